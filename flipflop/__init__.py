@@ -1,9 +1,185 @@
 ### Flip-Flop Logical Interpreted Language
-from flipflop.core import Interpreter, Lexer, Parser, Reader, Wordifier
+from collections.abc import Iterator
 
+from flipflop.core import (
+    BddInterpreter,
+    BitwiseInterpreter,
+    CheckpointedJob,
+    ChunkedInterpreter,
+    EquivalenceChecker,
+    GrayInterpreter,
+    Interpreter,
+    ParallelInterpreter,
+    Parser,
+    SatInterpreter,
+    Scanner,
+    TruthTable,
+)
 
-def flipflop(code: str, full: bool = True):
-    words = Wordifier(Reader(code)).wordify()
-    tokens = Lexer(words).tokenize()
+# Interpreters which can be used to produce the truth table, selectable by name
+ENGINES = {
+    "row": Interpreter,
+    "bitwise": BitwiseInterpreter,
+    "chunked": ChunkedInterpreter,
+    "bdd": BddInterpreter,
+    "sat": SatInterpreter,
+    "gray": GrayInterpreter,
+    "parallel": ParallelInterpreter,
+}
+
+
+def _interpreter(code: str, engine: str, workers: int | None = None, **options):
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine '{engine}', expected one of: {', '.join(ENGINES)}"
+        )
+
+    # Only the parallel engine runs worker processes
+    if workers is not None:
+        if engine != "parallel":
+            raise ValueError(
+                "The number of workers only applies to the parallel engine"
+            )
+
+        options["workers"] = workers
+
+    tokens = Scanner(code).tokenize()
     ast = Parser(tokens).parse()
-    return Interpreter(ast).evaluate(full=full)
+    return ENGINES[engine](ast, **options)
+
+
+def _table_interpreter(code: str, engine: str, order: str, workers: int | None = None):
+    # Only the gray engine enumerates the rows in another order than the one of the table
+    if engine == "gray":
+        return _interpreter(code, engine, workers, order=order)
+
+    if order != "canonical":
+        raise ValueError(f"Rows in {order} order are only produced by the gray engine")
+
+    return _interpreter(code, engine, workers)
+
+
+def flipflop(
+    code: str,
+    full: bool = True,
+    engine: str = "row",
+    reduce: bool = False,
+    expand: bool = False,
+    compress: bool = False,
+    order: str = "canonical",
+    stream: bool = False,
+    workers: int | None = None,
+):
+    if stream:
+        return iter_rows(code, full=full, engine=engine, order=order, workers=workers)
+
+    interpreter = _table_interpreter(code, engine, order, workers)
+
+    # Compressed tables only contain the variables and the final expression
+    if compress:
+        return interpreter.evaluate_compressed()
+
+    return interpreter.evaluate(full=full, reduce=reduce, expand=expand)
+
+
+def iter_rows(
+    code: str,
+    full: bool = True,
+    engine: str = "row",
+    order: str = "canonical",
+    offset: int = 0,
+    limit: int | None = None,
+    workers: int | None = None,
+) -> Iterator[list]:
+    """
+    Stream the truth table, the first item is the header, followed by the rows which are evaluated lazily.
+    The expression is parsed right away, so syntax errors are raised before iterating.
+    With `offset` and `limit`, only the rows in that range are evaluated.
+    """
+    interpreter = _table_interpreter(code, engine, order, workers)
+
+    def rows():
+        yield interpreter.headers(full)
+
+        if offset == 0 and limit is None:
+            yield from interpreter.iter_rows(full)
+        else:
+            stop = None if limit is None else offset + limit
+            yield from interpreter.rows(offset, stop, full=full)
+
+    return rows()
+
+
+def page(
+    code: str,
+    offset: int = 0,
+    limit: int | None = None,
+    full: bool = True,
+    engine: str = "row",
+    order: str = "canonical",
+    workers: int | None = None,
+):
+    """
+    Evaluate only the rows [offset, offset + limit) of the truth table, each row is computed directly from its index.
+    The result has the header, the values of the rows, the offset and the total number of rows of the table.
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("The offset and the limit can't be negative")
+
+    interpreter = _table_interpreter(code, engine, order, workers)
+    stop = None if limit is None else offset + limit
+
+    return {
+        "header": interpreter.headers(full),
+        "values": list(interpreter.rows(offset, stop, full=full)),
+        "offset": offset,
+        "total": 1 << len(interpreter.index.variables),
+    }
+
+
+def truth_table(
+    code: str, full: bool = True, engine: str = "bitwise", order: str = "canonical"
+) -> TruthTable:
+    """
+    Evaluate the truth table into a `TruthTable`, which stores every column as a packed bitset.
+    The rows are only turned into lists of booleans when they're accessed, `to_dict()` gives the usual dictionary.
+    """
+    return _table_interpreter(code, engine, order).table(full)
+
+
+def check(code: str, engine: str = "row", workers: int | None = None):
+    """
+    Only check if the expression is a tautology, without building the truth table.
+    The search stops at the first counterexample (an assignment for which the expression is False).
+    """
+    counterexample = _interpreter(code, engine, workers).counterexample()
+    return {
+        "is_tautology": counterexample is None,
+        "counterexample": counterexample,
+    }
+
+
+def count_models(code: str, engine: str = "bdd", workers: int | None = None) -> int:
+    """
+    Count the assignments of the variables for which the expression is True, without building the truth table.
+    The default engine counts the paths of the decision diagram, so the count is exact even for hundreds of variables.
+    """
+    return _interpreter(code, engine, workers).count_models()
+
+
+def run_job(code: str, path: str, resume: bool = False, **options) -> dict:
+    """
+    Count the true rows and find the first counterexample chunk by chunk, saving the progress to a checkpoint file.
+    An interrupted job continues from the checkpoint with `resume`, and gives the same result as an uninterrupted one.
+    """
+    ast = Parser(Scanner(code).tokenize()).parse()
+    return CheckpointedJob(ast, path, **options).run(resume=resume)
+
+
+def equivalent(left: str, right: str, seed: int | None = None):
+    """
+    Check if two expressions have the same value for every assignment of their variables.
+    When they differ, the counterexample is an assignment of the variables of both sides for which they do.
+    """
+    asts = [Parser(Scanner(code).tokenize()).parse() for code in (left, right)]
+    return EquivalenceChecker(*asts, seed=seed).check()
@@ -1,14 +1,75 @@
 import click
+from click.core import ParameterSource
 from tabulate import tabulate
 
-from flipflop import flipflop
+from flipflop import (
+    ENGINES,
+    check,
+    count_models,
+    equivalent,
+    flipflop,
+    iter_rows,
+    page,
+    run_job,
+)
+
+# Options selecting a mode of the main command, with the other options each of them accepts (by precedence)
+# Without any of them, the truth table is printed, which accepts every other option
+PAGE_OPTIONS = {
+    "offset",
+    "limit",
+    "simple",
+    "table_format",
+    "engine",
+    "order",
+    "workers",
+}
+MODE_OPTIONS = {
+    "job": {"resume"},
+    "count_only": {"engine", "workers"},
+    "check_only": {"engine", "workers"},
+    "stream": {"simple", "engine", "order", "offset", "limit", "workers"},
+    "offset": PAGE_OPTIONS,
+    "limit": PAGE_OPTIONS,
+}
+
+
+def check_options(ctx: click.Context) -> None:
+    """Raise a usage error for options which are given together, but don't apply to the same mode"""
+    given = {
+        name
+        for name in ctx.params
+        if ctx.get_parameter_source(name) != ParameterSource.DEFAULT
+    }
+    flags = {param.name: param.opts[0] for param in ctx.command.params}
+
+    if "resume" in given and "job" not in given:
+        raise click.UsageError("Option '--resume' requires '--job'.")
+
+    if "expand" in given and "reduce" not in given:
+        raise click.UsageError("Option '--expand' requires '--reduce'.")
+
+    # Compressed tables are never reduced
+    if "compress" in given and "reduce" in given:
+        raise click.UsageError(
+            "Options '--compress' and '--reduce' can't be used together."
+        )
+
+    mode = next((name for name in MODE_OPTIONS if name in given), None)
+    if mode is None:
+        return
 
+    conflicts = sorted(given - MODE_OPTIONS[mode] - {mode, "inline_input"})
+    if conflicts:
+        raise click.UsageError(
+            f"Options '{flags[mode]}' and '{flags[conflicts[0]]}' can't be used together."
+        )
 
-@click.command()
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--inline-input",
     "-i",
-    required=True,
     help="Singular inline expression to execute",
 )
 @click.option(
@@ -24,9 +85,257 @@ from flipflop import flipflop
     help="Chosen table format (see python-tabulate for more details)",
     default="simple_grid",
 )
-def main(inline_input: str | None, simple: bool, table_format: str) -> int:
+@click.option(
+    "--engine",
+    "-e",
+    help="Engine used to evaluate the truth table (row by default, bdd when counting)",
+    type=click.Choice(list(ENGINES)),
+    default=None,
+)
+@click.option(
+    "--reduce",
+    "-r",
+    help="Only enumerate the variables the expression depends on",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--expand",
+    help="Expand a reduced table back to all the variables",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--compress",
+    "-c",
+    help="Only include the final expression, merging rows decided before all variables are fixed (* = any value)",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--check",
+    "check_only",
+    help="Only check if the expression is a tautology, and print a counterexample if it is not",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--order",
+    "-o",
+    help="Order of the rows, gray order is produced by the gray engine (which is used by default)",
+    type=click.Choice(["canonical", "gray"]),
+    default="canonical",
+)
+@click.option(
+    "--stream",
+    help="Print the rows as tab-separated values while they are evaluated, instead of a table",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--count",
+    "count_only",
+    help="Only count the assignments for which the expression is True",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--offset",
+    help="Index of the first row to print, only the requested rows are evaluated",
+    type=click.IntRange(min=0),
+    default=0,
+)
+@click.option(
+    "--limit",
+    help="Maximum number of rows to print",
+    type=click.IntRange(min=0),
+    default=None,
+)
+@click.option(
+    "--workers",
+    "-w",
+    help="Number of processes evaluating the rows (selects the parallel engine, all cores by default)",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--job",
+    help="Run as a resumable job, counting the true rows chunk by chunk and saving the progress to this checkpoint file",
+    type=click.Path(dir_okay=False),
+    default=None,
+)
+@click.option(
+    "--resume",
+    help="Continue the job from its checkpoint file",
+    is_flag=True,
+    default=False,
+)
+@click.pass_context
+def main(
+    ctx: click.Context,
+    inline_input: str | None,
+    simple: bool,
+    table_format: str,
+    engine: str | None,
+    reduce: bool,
+    expand: bool,
+    compress: bool,
+    check_only: bool,
+    order: str,
+    stream: bool,
+    count_only: bool,
+    offset: int,
+    limit: int | None,
+    workers: int | None,
+    job: str | None,
+    resume: bool,
+) -> int:
+    # The options only apply to the truth table, subcommands have their own
+    if ctx.invoked_subcommand is not None:
+        return 0
+
+    if inline_input is None:
+        raise click.UsageError("Missing option '--inline-input' / '-i'.")
+
+    check_options(ctx)
+
+    if job is not None:
+        return main_job(inline_input, job, resume)
+
+    # Setting the number of workers implies the parallel engine
+    if workers is not None:
+        engine = engine or "parallel"
+
+    if count_only:
+        return main_count(inline_input, engine or "bdd", workers)
+
+    engine = engine or ("gray" if order == "gray" else "row")
+    if check_only:
+        return main_check(inline_input, engine, workers)
+
+    if stream:
+        return main_stream(
+            inline_input, not simple, engine, order, offset, limit, workers
+        )
+
+    if offset or limit is not None:
+        return main_page(
+            inline_input,
+            not simple,
+            engine,
+            order,
+            offset,
+            limit,
+            table_format,
+            workers,
+        )
+
+    try:
+        results = flipflop(
+            inline_input,
+            full=not simple,
+            engine=engine,
+            reduce=reduce,
+            expand=expand,
+            compress=compress,
+            order=order,
+            workers=workers,
+        )
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    # Don't-care values of compressed rows
+    values = [
+        ["*" if value is None else value for value in row] for row in results["values"]
+    ]
+    click.echo(tabulate(values, headers=results["header"], tablefmt=table_format))
+
+    if results.get("dropped_variables"):
+        click.secho(
+            f"Dropped variables: {', '.join(results['dropped_variables'])}",
+            fg="yellow",
+        )
+
+    if results["is_tautology"]:
+        click.secho("Expression IS a tautology", fg="green")
+    else:
+        click.secho("Expression IS NOT a tautology", fg="red")
+
+    return 0
+
+
+def main_check(inline_input: str, engine: str, workers: int | None = None) -> int:
     try:
-        results = flipflop(inline_input, full=not simple)
+        results = check(inline_input, engine=engine, workers=workers)
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    if results["is_tautology"]:
+        click.secho("Expression IS a tautology", fg="green")
+    else:
+        click.secho("Expression IS NOT a tautology", fg="red")
+        click.echo(
+            "Counterexample: "
+            + ", ".join(
+                f"{name}={value}" for name, value in results["counterexample"].items()
+            )
+        )
+
+    return 0
+
+
+def main_stream(
+    inline_input: str,
+    full: bool,
+    engine: str,
+    order: str,
+    offset: int = 0,
+    limit: int | None = None,
+    workers: int | None = None,
+) -> int:
+    try:
+        rows = iter_rows(
+            inline_input,
+            full=full,
+            engine=engine,
+            order=order,
+            offset=offset,
+            limit=limit,
+            workers=workers,
+        )
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    # The first row is the header
+    for row in rows:
+        click.echo("\t".join(map(str, row)))
+
+    return 0
+
+
+def main_page(
+    inline_input: str,
+    full: bool,
+    engine: str,
+    order: str,
+    offset: int,
+    limit: int | None,
+    table_format: str,
+    workers: int | None = None,
+) -> int:
+    try:
+        results = page(
+            inline_input,
+            offset=offset,
+            limit=limit,
+            full=full,
+            engine=engine,
+            order=order,
+            workers=workers,
+        )
     except Exception as e:
         click.secho(e, fg="red")
         return 1
@@ -35,10 +344,71 @@ def main(inline_input: str | None, simple: bool, table_format: str) -> int:
         tabulate(results["values"], headers=results["header"], tablefmt=table_format)
     )
 
+    # Only a part of the table was evaluated, so it can't tell if the expression is a tautology
+    start = min(offset, results["total"])
+    click.echo(f"Rows {start}-{start + len(results['values'])} of {results['total']}")
+    return 0
+
+
+def main_count(inline_input: str, engine: str, workers: int | None = None) -> int:
+    try:
+        results = count_models(inline_input, engine=engine, workers=workers)
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    click.echo(f"Satisfying assignments: {results}")
+    return 0
+
+
+def main_job(inline_input: str, path: str, resume: bool) -> int:
+    try:
+        results = run_job(inline_input, path, resume=resume)
+    except KeyboardInterrupt:
+        click.secho(
+            f"Interrupted, resume the job with --job {path} --resume", fg="yellow"
+        )
+        return 1
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    click.echo(f"Satisfying assignments: {results['count']} of {results['rows']}")
     if results["is_tautology"]:
         click.secho("Expression IS a tautology", fg="green")
     else:
         click.secho("Expression IS NOT a tautology", fg="red")
+        click.echo(
+            "Counterexample: "
+            + ", ".join(
+                f"{name}={value}" for name, value in results["counterexample"].items()
+            )
+        )
+
+    return 0
+
+
+@main.command("equivalent")
+@click.option("--left", "-a", required=True, help="First expression")
+@click.option("--right", "-b", required=True, help="Second expression")
+def main_equivalent(left: str, right: str) -> int:
+    """Check if two expressions have the same value for every assignment"""
+    try:
+        results = equivalent(left, right)
+    except Exception as e:
+        click.secho(e, fg="red")
+        return 1
+
+    if results["equivalent"]:
+        click.secho(f"Expressions ARE equivalent ({results['method']})", fg="green")
+    else:
+        click.secho(f"Expressions ARE NOT equivalent ({results['method']})", fg="red")
+        click.echo(
+            "Counterexample: "
+            + ", ".join(
+                f"{name}={value}" for name, value in results["counterexample"].items()
+            )
+        )
 
     return 0
 
@@ -1,4 +1,11 @@
-from .evaluator import Evaluator
+from .bdd import BDD
+from .bitwise import BitwiseInterpreter
+from .checkpoint import CheckpointedJob
+from .chunked import ChunkedInterpreter
+from .compiler import CompiledExpression, Compiler
+from .diagram import BddInterpreter
+from .equivalence import EquivalenceChecker
+from .evaluator import Evaluator, IncrementalEvaluator
 from .exceptions import (
     InvalidBinaryTokenPlacement,
     InvalidParenthesisTokenPlacement,
@@ -11,23 +18,49 @@ from .exceptions import (
     TokenAssertionError,
     UnexpectedTokenError,
 )
+from .flat import FlatTree
+from .gray import GrayInterpreter
+from .index import ExpressionIndex
 from .interpreter import Interpreter
 from .lexer import Lexer
-from .node import Node
+from .node import Node, NodeFactory
+from .parallel import ParallelInterpreter
 from .parser import Parser
 from .reader import Reader
+from .sat import SatInterpreter, Solver, Tseitin
+from .scanner import Scanner
+from .table import TruthTable
 from .token import Token, TokenType
 from .wordifier import Wordifier
 
 __all__ = [
+    BDD,
+    BddInterpreter,
+    BitwiseInterpreter,
+    CheckpointedJob,
+    ChunkedInterpreter,
+    CompiledExpression,
+    Compiler,
+    EquivalenceChecker,
     Evaluator,
+    ExpressionIndex,
+    FlatTree,
+    GrayInterpreter,
+    IncrementalEvaluator,
     Interpreter,
     Lexer,
     Node,
+    NodeFactory,
+    ParallelInterpreter,
     Parser,
     Reader,
+    SatInterpreter,
+    Scanner,
+    Solver,
     Token,
     TokenType,
+    Tseitin,
+    TruthTable,
     Wordifier,
     ReaderError,
     OutOfBoundsError,
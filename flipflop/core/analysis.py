@@ -0,0 +1,23 @@
+from .bdd import BDD
+from .index import ExpressionIndex
+from .node import Node
+
+
+### Analysis
+# Static analysis of the function described by the Syntax Tree
+def essential_variables(root_node: Node, bdd: BDD | None = None) -> list[str]:
+    """
+    Variables the expression actually depends on (sorted like the columns of the truth table).
+    A variable is essential when the two cofactors of the expression's diagram (with the variable fixed to False
+    and to True) differ, e.g. `x` is not essential in `(x or not x) and p`.
+    """
+    if bdd is None:
+        bdd = BDD()
+
+    variables = ExpressionIndex(root_node).variables
+
+    function = bdd.from_node(root_node)
+    try:
+        return [name for name in variables if bdd.depends_on(function, name)]
+    finally:
+        bdd.deref(function)
@@ -0,0 +1,377 @@
+import sys
+
+from .index import ExpressionIndex
+from .node import Node
+from .token import TokenType
+
+# The terminal nodes, every manager starts with them at these ids
+FALSE = 0
+TRUE = 1
+
+# Level of the terminal nodes (below every variable), and of the nodes freed by the garbage collector
+TERMINAL_LEVEL = sys.maxsize
+FREED_LEVEL = -1
+
+DEFAULT_CACHE_SIZE = 1 << 16
+DEFAULT_GC_THRESHOLD = 1 << 17
+
+
+### BDD
+# Reduced Ordered Binary Decision Diagrams
+# Every boolean function is stored as a single canonical node in a shared DAG, so tautology (the node is TRUE),
+# satisfiability (the node is not FALSE) and equivalence (the nodes are the same) are checked in constant time,
+# and the size of the diagram depends on the structure of the function, not on the number of rows.
+class BDD:
+    """
+    Manager owning the nodes of the diagrams, a node is an integer id referring to the (level, low, high) columns.
+    Nodes are unique (hash-consed through the unique table), operators are computed with ITE (if-then-else),
+    whose results are memoized in a direct-mapped computed table (colliding entries evict each other).
+    The nodes are reference counted from the outside with `ref()` / `deref()`, and unreferenced nodes are reclaimed
+    by a mark-and-sweep garbage collection once the number of live nodes reaches `gc_threshold`.
+    """
+
+    def __init__(
+        self,
+        variables: list[str] | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        gc_threshold: int = DEFAULT_GC_THRESHOLD,
+    ):
+        if cache_size < 1 or cache_size & (cache_size - 1):
+            raise ValueError("The cache size has to be a power of two")
+
+        # Variable names in the order of their levels (level 0 is the top of the diagram)
+        self.variables: list[str] = []
+        self.levels: dict[str, int] = {}
+
+        # Columns of the nodes, the first two are the terminals
+        self._level = [TERMINAL_LEVEL, TERMINAL_LEVEL]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._refs = [1, 1]
+
+        self._unique: dict[tuple[int, int, int], int] = {}
+        self._free: list[int] = []
+
+        self._cache: list[tuple[int, int, int, int] | None] = [None] * cache_size
+        self.gc_threshold = gc_threshold
+
+        for name in variables or []:
+            self.add_variable(name)
+
+    def __len__(self):
+        """Number of live (non-terminal) nodes"""
+        return len(self._unique)
+
+    def add_variable(self, name: str) -> int:
+        """Add a variable below all the existing ones (if it doesn't exist yet), and return its node"""
+        if name not in self.levels:
+            self.levels[name] = len(self.variables)
+            self.variables.append(name)
+
+        return self.variable(name)
+
+    def variable(self, name: str) -> int:
+        """Node of the function which is True when the variable is True"""
+        if name not in self.levels:
+            raise KeyError(f"Unknown variable '{name}'")
+
+        return self._make(self.levels[name], FALSE, TRUE)
+
+    def ref(self, node: int) -> int:
+        """Protect a node (and its descendants) from the garbage collection"""
+        self._refs[node] += 1
+        return node
+
+    def deref(self, node: int):
+        """Release a reference taken with `ref()`, the node is reclaimed by the next garbage collection"""
+        if self._refs[node] <= 0:
+            raise ValueError(f"Node {node} is not referenced")
+
+        self._refs[node] -= 1
+
+    def _make(self, level: int, low: int, high: int) -> int:
+        # Reduction rule, a node with equal children does not depend on its variable
+        if low == high:
+            return low
+
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is not None:
+            return node
+
+        if self._free:
+            node = self._free.pop()
+            self._level[node] = level
+            self._low[node] = low
+            self._high[node] = high
+            self._refs[node] = 0
+        else:
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._refs.append(0)
+
+        self._unique[key] = node
+        return node
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """
+        If-then-else, the function which is `g` where `f` is True and `h` elsewhere.
+        The recursion over the levels is unrolled onto an explicit stack, so the depth is not limited by python.
+        """
+        if len(self._unique) >= self.gc_threshold:
+            self.collect_garbage(roots=(f, g, h))
+
+        level, low, high = self._level, self._low, self._high
+        cache = self._cache
+        mask = len(cache) - 1
+
+        results: list[int] = []
+        stack = [(f, g, h, -1)]
+        while stack:
+            f, g, h, top = stack.pop()
+
+            # Both cofactors are computed, build the node at the top level
+            if top != -1:
+                high_result = results.pop()
+                low_result = results.pop()
+                node = self._make(top, low_result, high_result)
+                cache[hash((f, g, h)) & mask] = (f, g, h, node)
+                results.append(node)
+                continue
+
+            if f == TRUE or g == h:
+                results.append(g)
+                continue
+
+            if f == FALSE:
+                results.append(h)
+                continue
+
+            if g == TRUE and h == FALSE:
+                results.append(f)
+                continue
+
+            entry = cache[hash((f, g, h)) & mask]
+            if entry is not None and entry[0] == f and entry[1] == g and entry[2] == h:
+                results.append(entry[3])
+                continue
+
+            top = min(level[f], level[g], level[h])
+            f0, f1 = (low[f], high[f]) if level[f] == top else (f, f)
+            g0, g1 = (low[g], high[g]) if level[g] == top else (g, g)
+            h0, h1 = (low[h], high[h]) if level[h] == top else (h, h)
+
+            # The low cofactor is popped first, so it's below the high one on the results stack
+            stack.append((f, g, h, top))
+            stack.append((f1, g1, h1, -1))
+            stack.append((f0, g0, h0, -1))
+
+        return results[0]
+
+    def apply(self, token_type: TokenType, left: int, right: int = FALSE) -> int:
+        """Apply an operator of the language to one (NOT) or two nodes"""
+        match token_type:
+            case TokenType.NOT:
+                return self.ite(left, FALSE, TRUE)
+
+            case TokenType.AND:
+                return self.ite(left, right, FALSE)
+
+            case TokenType.OR:
+                return self.ite(left, TRUE, right)
+
+            case TokenType.NAND:
+                return self.ite(left, self.ite(right, FALSE, TRUE), TRUE)
+
+            case TokenType.NOR:
+                return self.ite(left, FALSE, self.ite(right, FALSE, TRUE))
+
+            case TokenType.XOR:
+                return self.ite(left, self.ite(right, FALSE, TRUE), right)
+
+            case TokenType.IF:
+                return self.ite(left, right, TRUE)
+
+            case TokenType.EQ:
+                return self.ite(left, right, self.ite(right, FALSE, TRUE))
+
+            case _:
+                raise ValueError(f"Unsupported operator {token_type}")
+
+    def from_node(self, root_node: Node) -> int:
+        """
+        Build the diagram of an expression, the returned node is referenced (release it with `deref()`).
+        New variables are placed below the existing ones, in the order in which they first appear in the expression.
+        """
+        index = ExpressionIndex(root_node)
+
+        # The index is in post-order, so the variables are in the order of their first appearance
+        for node in index.nodes:
+            if node.token.type == TokenType.VARIABLE:
+                self.add_variable(node.token.value)
+
+        # Number of parents still needing each sub-expression, its node is released after the last one
+        uses = [0] * len(index.nodes)
+        for left, right in index.children:
+            if left != -1:
+                uses[left] += 1
+            if right != -1:
+                uses[right] += 1
+
+        results: list[int] = []
+        for node, (left, right) in zip(index.nodes, index.children):
+            if node.token.type == TokenType.VARIABLE:
+                result = self.variable(node.token.value)
+            else:
+                result = self.apply(
+                    node.token.type,
+                    results[left],
+                    results[right] if right != -1 else FALSE,
+                )
+
+            results.append(self.ref(result))
+
+            # Both operands can be the same sub-expression, which is counted once for each of them
+            for child in (left, right):
+                if child == -1:
+                    continue
+
+                uses[child] -= 1
+                if uses[child] == 0:
+                    self.deref(results[child])
+
+        return results[index.root]
+
+    def collect_garbage(self, roots: tuple[int, ...] = ()):
+        """Reclaim every node which is not reachable from a referenced node (or one of the given roots)"""
+        level, low, high, refs = self._level, self._low, self._high, self._refs
+
+        marked = bytearray(len(level))
+        stack = [node for node in range(len(level)) if refs[node] > 0]
+        stack.extend(roots)
+        while stack:
+            node = stack.pop()
+            if marked[node]:
+                continue
+
+            marked[node] = 1
+            if node > TRUE:
+                stack.append(low[node])
+                stack.append(high[node])
+
+        for node in range(TRUE + 1, len(level)):
+            if not marked[node] and level[node] != FREED_LEVEL:
+                del self._unique[(level[node], low[node], high[node])]
+                level[node] = FREED_LEVEL
+                self._free.append(node)
+
+        # Cached results might refer to freed nodes, whose ids are going to be reused
+        self._cache = [None] * len(self._cache)
+
+        # Grow the threshold if most of the nodes are still alive, to avoid collecting again right away
+        self.gc_threshold = max(self.gc_threshold, 2 * len(self._unique))
+
+    def cofactor(self, node: int, name: str, value: bool) -> int:
+        """The function with the variable fixed to the given value"""
+        target = self.levels[name]
+        level, low, high = self._level, self._low, self._high
+
+        # Nodes below the variable are not affected, the ones above are rebuilt children first
+        results: dict[int, int] = {}
+        stack = [node]
+        while stack:
+            u = stack[-1]
+            if u in results:
+                stack.pop()
+                continue
+
+            if level[u] > target:
+                results[u] = u
+            elif level[u] == target:
+                results[u] = high[u] if value else low[u]
+            else:
+                pending = [child for child in (low[u], high[u]) if child not in results]
+                if pending:
+                    stack.extend(pending)
+                    continue
+
+                results[u] = self._make(level[u], results[low[u]], results[high[u]])
+
+            stack.pop()
+
+        return results[node]
+
+    def depends_on(self, node: int, name: str) -> bool:
+        """Check if the function depends on the variable, which is the case when its two cofactors differ"""
+        if name not in self.levels:
+            return False
+
+        return self.cofactor(node, name, False) != self.cofactor(node, name, True)
+
+    def is_tautology(self, node: int) -> bool:
+        return node == TRUE
+
+    def is_satisfiable(self, node: int) -> bool:
+        return node != FALSE
+
+    def equivalent(self, left: int, right: int) -> bool:
+        """Diagrams are canonical, so equivalent functions (built by the same manager) are the same node"""
+        return left == right
+
+    def count(self, node: int, variables: int | None = None) -> int:
+        """
+        Number of satisfying assignments, over all the variables of the manager by default,
+        or over the given number of variables (which have to include every variable the function depends on).
+        """
+        total = len(self.variables)
+        if variables is None:
+            variables = total
+
+        level, low, high = self._level, self._low, self._high
+
+        def depth(u: int) -> int:
+            return total if u <= TRUE else level[u]
+
+        # Models of each node over the variables from its level down, computed children first
+        counts = {FALSE: 0, TRUE: 1}
+        stack = [node]
+        while stack:
+            u = stack[-1]
+            if u in counts:
+                stack.pop()
+                continue
+
+            pending = [child for child in (low[u], high[u]) if child not in counts]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            counts[u] = (counts[low[u]] << (depth(low[u]) - level[u] - 1)) + (
+                counts[high[u]] << (depth(high[u]) - level[u] - 1)
+            )
+
+        models = counts[node] << depth(node)
+        return models >> (total - variables)
+
+    def satisfy_one(self, node: int) -> dict[str, bool] | None:
+        """
+        One satisfying assignment of all the variables (those the function doesn't depend on are False),
+        or None if the function is not satisfiable.
+        """
+        if node == FALSE:
+            return None
+
+        assignment = dict.fromkeys(self.variables, False)
+
+        # Every node other than FALSE has a path to TRUE, so the walk never has to backtrack
+        while node > TRUE:
+            if self._low[node] != FALSE:
+                node = self._low[node]
+            else:
+                assignment[self.variables[self._level[node]]] = True
+                node = self._high[node]
+
+        return assignment
@@ -0,0 +1,69 @@
+from .interpreter import Interpreter
+from .packed import evaluate_packed, unpack_column, variable_mask
+from .table import TruthTable
+
+
+### Bitwise
+# Bit-parallel evaluation of the Syntax Tree
+# Every column of the truth table is stored as a single integer with one bit per row (bit i = row i),
+# so each operator is applied to all rows at once with a single bitwise operation
+class BitwiseInterpreter(Interpreter):
+    """
+    Interpreter producing the same truth table as the default one, but evaluating each sub-expression
+    exactly once over all rows instead of once per row.
+    """
+
+    def evaluate(self, full: bool = True, reduce: bool = False, expand: bool = False):
+        if reduce:
+            return self.evaluate_reduced(full, expand)
+
+        rows = 1 << len(self.index.variables)
+        columns = self.index.columns(full)
+
+        packed = self.evaluate_columns()
+        values = [
+            list(row) for row in zip(*(unpack_column(packed[i], rows) for i in columns))
+        ]
+
+        return {
+            "header": [self.index.header(i) for i in columns],
+            "values": values,
+            "is_tautology": packed[self.index.root] == (1 << rows) - 1,
+        }
+
+    def count_models(self) -> int:
+        return self.evaluate_columns()[self.index.root].bit_count()
+
+    def counterexample(self) -> dict[str, bool] | None:
+        """The first row in which the root expression is False, i.e. the lowest zero bit of its packed column"""
+        full = (1 << (1 << len(self.index.variables))) - 1
+        false = full ^ self.evaluate_columns()[self.index.root]
+        if not false:
+            return None
+
+        row = (false & -false).bit_length() - 1
+        return dict(zip(self.index.variables, self.assignment(row)))
+
+    def table(self, full: bool = True) -> TruthTable:
+        columns = self.index.columns(full)
+        packed = self.evaluate_columns()
+        return TruthTable.from_integers(
+            self.headers(full),
+            [packed[i] for i in columns],
+            1 << len(self.index.variables),
+            root=columns.index(self.index.root),
+        )
+
+    def evaluate_columns(self) -> list[int]:
+        """
+        Compute the packed column of every unique sub-expression (in the order of the index),
+        with a single pass over the AST.
+        """
+        variables = self.index.variables
+        rows = 1 << len(variables)
+        full = (1 << rows) - 1
+        positions = {name: len(variables) - 1 - i for i, name in enumerate(variables)}
+
+        return evaluate_packed(
+            self.index, lambda name: variable_mask(positions[name], rows), full
+        )
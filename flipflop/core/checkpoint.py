@@ -0,0 +1,156 @@
+import base64
+import hashlib
+import json
+import os
+import time
+
+from .chunked import (
+    DEFAULT_CHUNK_ROWS,
+    ChunkedInterpreter,
+    IntegerBackend,
+    NumpyBackend,
+)
+from .node import Node
+
+# Version of the checkpoint format, checkpoints of other versions are rejected
+CHECKPOINT_VERSION = 1
+
+# Seconds between two checkpoints
+DEFAULT_INTERVAL = 30.0
+
+
+### Checkpoint
+# Runs the enumeration of very large truth tables as a job, which can be interrupted and resumed
+# The rows are processed in numbered chunks (see the ChunkedInterpreter), and a small checkpoint file periodically
+# records which chunks are done, with the number of true rows and the first falsifying row found so far
+class CheckpointedJob:
+    """
+    The result is a dictionary with the number of rows, the number of rows in which the expression is True,
+    whether it's a tautology, and its first counterexample (in the order of the rows).
+    Resuming a job only evaluates the chunks which weren't done, and produces the same result as an uninterrupted run.
+    """
+
+    def __init__(
+        self,
+        root_node: Node,
+        path: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        interval: float = DEFAULT_INTERVAL,
+        backend: IntegerBackend | NumpyBackend | None = None,
+    ):
+        self.interpreter = ChunkedInterpreter(root_node, chunk_rows, backend)
+        self.index = self.interpreter.index
+        self.path = path
+        self.interval = interval
+
+        chunks = self.interpreter.chunk_count()
+        self.done = bytearray((chunks + 7) // 8)
+        self.count = 0
+
+        # Index of the first row in which the expression is False
+        self.counterexample_row: int | None = None
+
+    @property
+    def chunks(self) -> int:
+        return self.interpreter.chunk_count()
+
+    @property
+    def completed(self) -> int:
+        """Number of chunks which are done"""
+        return int.from_bytes(self.done, "little").bit_count()
+
+    def is_done(self, number: int) -> bool:
+        return bool((self.done[number >> 3] >> (number & 7)) & 1)
+
+    def run(self, resume: bool = False) -> dict:
+        """
+        Process every chunk which isn't done yet, writing a checkpoint every `interval` seconds,
+        and when the job stops (it's finished, interrupted with Ctrl-C, or fails).
+        Without `resume`, an existing checkpoint is never overwritten.
+        """
+        if os.path.exists(self.path):
+            if not resume:
+                raise FileExistsError(
+                    f"Checkpoint '{self.path}' already exists, resume the job or remove it"
+                )
+
+            self.load()
+
+        remaining = [n for n in range(self.chunks) if not self.is_done(n)]
+        saved = time.monotonic()
+        try:
+            for number, chunk in zip(
+                remaining, self.interpreter.chunks(numbers=remaining)
+            ):
+                count = chunk.count()
+                offset = chunk.first_false()
+
+                # The aggregates and the bitmap are updated together, once the chunk is evaluated,
+                # so an interrupted run never saves a chunk counted but not done (or the other way around)
+                if offset is not None and (
+                    self.counterexample_row is None
+                    or chunk.start + offset < self.counterexample_row
+                ):
+                    self.counterexample_row = chunk.start + offset
+                self.count += count
+                self.done[number >> 3] |= 1 << (number & 7)
+
+                if time.monotonic() - saved >= self.interval:
+                    self.save()
+                    saved = time.monotonic()
+        finally:
+            self.save()
+
+        return self.result()
+
+    def result(self) -> dict:
+        counterexample = None
+        if self.counterexample_row is not None:
+            values = self.interpreter.assignment(self.counterexample_row)
+            counterexample = dict(zip(self.index.variables, values))
+
+        return {
+            "rows": 1 << len(self.index.variables),
+            "count": self.count,
+            "is_tautology": counterexample is None,
+            "counterexample": counterexample,
+        }
+
+    def state(self) -> dict:
+        """Contents of the checkpoint, the expression is identified by its variables and a hash of its header"""
+        header = self.index.header(self.index.root)
+        return {
+            "version": CHECKPOINT_VERSION,
+            "expression": hashlib.sha256(header.encode()).hexdigest(),
+            "variables": self.index.variables,
+            "chunk_rows": self.interpreter.chunk_rows,
+            "chunks": self.chunks,
+            "done": base64.b64encode(self.done).decode("ascii"),
+            "count": self.count,
+            "counterexample_row": self.counterexample_row,
+        }
+
+    def save(self) -> None:
+        """Write the checkpoint atomically, a crash while writing leaves the previous checkpoint intact"""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.state(), file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary, self.path)
+
+    def load(self) -> None:
+        with open(self.path) as file:
+            state = json.load(file)
+
+        expected = self.state()
+        for key in ["version", "expression", "variables", "chunk_rows", "chunks"]:
+            if state.get(key) != expected[key]:
+                raise ValueError(
+                    f"Checkpoint '{self.path}' belongs to another job (different {key.replace('_', ' ')})"
+                )
+
+        self.done = bytearray(base64.b64decode(state["done"]))
+        self.count = state["count"]
+        self.counterexample_row = state["counterexample_row"]
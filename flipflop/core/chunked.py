@@ -0,0 +1,300 @@
+from collections.abc import Callable, Iterator
+
+from .interpreter import Interpreter
+from .node import Node
+from .packed import apply_operator, unpack_column, variable_mask
+from .table import TruthTable
+from .token import TokenType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+
+### Chunked
+# Evaluates the Syntax Tree over fixed-size chunks of the row space
+# Each chunk is evaluated bit-parallel (like the BitwiseInterpreter), either as packed numpy uint64 words,
+# or as python integers when numpy is not installed, so the peak memory only depends on the chunk size
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+
+class IntegerBackend:
+    """Stores a chunk column as a single python integer with one bit per row"""
+
+    name = "int"
+
+    def full(self, size: int) -> int:
+        return (1 << size) - 1
+
+    def variable(self, position: int, start: int, size: int) -> int:
+        if (1 << position) < size:
+            return variable_mask(position, size)
+
+        # The variable does not change within this chunk
+        return self.full(size) if (start >> position) & 1 else 0
+
+    def count(self, column: int) -> int:
+        return column.bit_count()
+
+    def equal(self, left: int, right: int) -> bool:
+        return left == right
+
+    def unpack(self, column: int, size: int) -> list[bool]:
+        return unpack_column(column, size)
+
+    def to_bytes(self, column: int, size: int) -> bytes:
+        return column.to_bytes((size + 7) // 8, "little")
+
+    def first_false(self, column: int, size: int) -> int | None:
+        false = ~column & self.full(size)
+        return (false & -false).bit_length() - 1 if false else None
+
+
+class NumpyBackend:
+    """Stores a chunk column as an array of uint64 words with 64 rows per word"""
+
+    name = "numpy"
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("The numpy backend requires numpy to be installed")
+
+    def full(self, size: int):
+        if size < 64:
+            return np.array([(1 << size) - 1], dtype=np.uint64)
+
+        return np.full(size // 64, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+    def variable(self, position: int, start: int, size: int):
+        if size < 64:
+            return np.array([variable_mask(position, size)], dtype=np.uint64)
+
+        words = size // 64
+        if position < 6:
+            return np.full(words, variable_mask(position, 64), dtype=np.uint64)
+
+        # Above 64 rows the value is the same for the whole word, derive it from the word index
+        index = np.arange(start // 64, start // 64 + words, dtype=np.uint64)
+        bit = (index >> np.uint64(position - 6)) & np.uint64(1)
+        return np.uint64(0) - bit
+
+    def count(self, column) -> int:
+        if hasattr(np, "bitwise_count"):
+            return int(np.bitwise_count(column).sum())
+
+        return int(np.unpackbits(column.astype("<u8").view(np.uint8)).sum())
+
+    def equal(self, left, right) -> bool:
+        return bool(np.array_equal(left, right))
+
+    def unpack(self, column, size: int) -> list[bool]:
+        bits = np.unpackbits(column.astype("<u8").view(np.uint8), bitorder="little")
+        return bits[:size].astype(bool).tolist()
+
+    def to_bytes(self, column, size: int) -> bytes:
+        return column.astype("<u8").tobytes()[: (size + 7) // 8]
+
+    def first_false(self, column, size: int) -> int | None:
+        false = ~column & self.full(size)
+        words = np.flatnonzero(false)
+        if len(words) == 0:
+            return None
+
+        word = int(false[words[0]])
+        return int(words[0]) * 64 + (word & -word).bit_length() - 1
+
+
+def default_backend():
+    """Use numpy when it's installed, otherwise fall back to python integers"""
+    return NumpyBackend() if np is not None else IntegerBackend()
+
+
+class Chunk:
+    """Packed columns of the requested expressions for the rows [start, start + size)"""
+
+    def __init__(self, start: int, size: int, columns: list, full, backend):
+        self.start = start
+        self.size = size
+        self.columns = columns
+        self.full = full
+        self.backend = backend
+
+    def count(self, column: int = -1) -> int:
+        """Count the rows in which the expression at the given column is True"""
+        return self.backend.count(self.columns[column])
+
+    def is_full(self, column: int = -1) -> bool:
+        """Check whether the expression at the given column is True in every row of the chunk"""
+        return self.backend.equal(self.columns[column], self.full)
+
+    def unpack(self, column: int = -1) -> list[bool]:
+        return self.backend.unpack(self.columns[column], self.size)
+
+    def first_false(self, column: int = -1) -> int | None:
+        """Offset (from the start of the chunk) of the first row in which the expression is False"""
+        return self.backend.first_false(self.columns[column], self.size)
+
+    def to_bytes(self, column: int = -1) -> bytes:
+        """Packed bytes of the column, bit i of the bytes is row start + i"""
+        return self.backend.to_bytes(self.columns[column], self.size)
+
+    def rows(self) -> list[list[bool]]:
+        return [
+            list(row)
+            for row in zip(*(self.unpack(i) for i in range(len(self.columns))))
+        ]
+
+
+class ChunkedInterpreter(Interpreter):
+    """
+    Interpreter streaming the truth table in chunks of `chunk_rows` rows.
+    Only the columns which are still needed are kept alive while a chunk is evaluated.
+    """
+
+    def __init__(
+        self,
+        root_node: Node,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        backend: IntegerBackend | NumpyBackend | None = None,
+    ):
+        super().__init__(root_node)
+
+        if chunk_rows < 64 or chunk_rows & (chunk_rows - 1):
+            raise ValueError("chunk_rows must be a power of two of at least 64")
+
+        self.chunk_rows = chunk_rows
+        self.backend = backend if backend is not None else default_backend()
+
+    def evaluate(self, full: bool = True, reduce: bool = False, expand: bool = False):
+        if reduce:
+            return self.evaluate_reduced(full, expand)
+
+        columns = self.index.columns(full)
+
+        values = []
+        is_tautology = True
+        for chunk in self.chunks(columns):
+            values.extend(chunk.rows())
+            is_tautology = is_tautology and chunk.is_full()
+
+        return {
+            "header": [self.index.header(i) for i in columns],
+            "values": values,
+            "is_tautology": is_tautology,
+        }
+
+    def iter_rows(self, full: bool = True) -> Iterator[list[bool]]:
+        """Yield the rows of the truth table one at a time, only a single chunk is kept in memory"""
+        for chunk in self.chunks(self.index.columns(full)):
+            yield from chunk.rows()
+
+    def table(self, full: bool = True) -> TruthTable:
+        """Assemble the packed columns of the chunks, without unpacking the rows"""
+        columns = self.index.columns(full)
+        rows = 1 << len(self.index.variables)
+
+        packed = [bytearray((rows + 7) // 8) for _ in columns]
+        for chunk in self.chunks(columns):
+            # Chunks of more than 8 rows always start on a byte boundary
+            offset = chunk.start // 8
+            for i, column in enumerate(packed):
+                data = chunk.to_bytes(i)
+                column[offset : offset + len(data)] = data
+
+        return TruthTable(
+            self.headers(full),
+            packed,
+            rows,
+            root=columns.index(self.index.root),
+        )
+
+    def stream(self, consumer: Callable[[Chunk], bool | None], columns=None):
+        """
+        Pass every chunk to the consumer, stops early if the consumer returns True.
+        By default, the chunks only contain the column of the root expression.
+        """
+        for chunk in self.chunks(columns):
+            if consumer(chunk):
+                return
+
+    def count_true(self) -> int:
+        """Count the rows in which the root expression is True"""
+        return sum(chunk.count() for chunk in self.chunks())
+
+    def count_models(self) -> int:
+        return self.count_true()
+
+    def counterexample(self) -> dict[str, bool] | None:
+        """The first row in which the root expression is False, the chunks after it are never evaluated"""
+        for chunk in self.chunks():
+            offset = chunk.first_false()
+            if offset is not None:
+                row = chunk.start + offset
+                return dict(zip(self.index.variables, self.assignment(row)))
+
+        return None
+
+    def chunk_count(self) -> int:
+        """Number of chunks the rows are split into"""
+        return max((1 << len(self.index.variables)) // self.chunk_rows, 1)
+
+    def chunks(self, columns: list[int] | None = None, numbers=None) -> Iterator[Chunk]:
+        """
+        Evaluate the expressions at the given index positions chunk by chunk, in row order.
+        With `numbers`, only the chunks with these numbers are evaluated (chunk k starts at row k * chunk_rows).
+        """
+        if columns is None:
+            columns = [self.index.root]
+
+        if numbers is None:
+            numbers = range(self.chunk_count())
+
+        variables = self.index.variables
+        positions = {name: len(variables) - 1 - i for i, name in enumerate(variables)}
+        size = min(self.chunk_rows, 1 << len(variables))
+
+        # Count how many times each column is read, the requested columns are read once more
+        # when the chunk is assembled, so they're never released
+        uses = [0] * len(self.index.nodes)
+        for left, right in self.index.children:
+            for child in (left, right):
+                if child != -1:
+                    uses[child] += 1
+
+        for column in columns:
+            uses[column] += 1
+
+        for number in numbers:
+            start = number * size
+            full = self.backend.full(size)
+            remaining = list(uses)
+            packed = {}
+
+            # The index is in post-order, so the children are always evaluated before their parents
+            for position, node in enumerate(self.index.nodes):
+                left, right = self.index.children[position]
+
+                if node.token.type == TokenType.VARIABLE:
+                    packed[position] = self.backend.variable(
+                        positions[node.token.value], start, size
+                    )
+                    continue
+
+                packed[position] = apply_operator(
+                    node.token.type,
+                    packed[left] if left != -1 else 0,
+                    packed[right] if right != -1 else 0,
+                    full,
+                )
+
+                # Release the columns of children which won't be read anymore
+                for child in (left, right):
+                    if child == -1:
+                        continue
+
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        del packed[child]
+
+            yield Chunk(start, size, [packed[i] for i in columns], full, self.backend)
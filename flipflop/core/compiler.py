@@ -0,0 +1,115 @@
+from .index import ExpressionIndex
+from .node import Node
+from .token import TokenType
+
+# Python expression templates for each operator, applied to the slots of the children
+OPERATOR_TEMPLATES = {
+    TokenType.NOT: "not {left}",
+    TokenType.AND: "{left} and {right}",
+    TokenType.OR: "{left} or {right}",
+    TokenType.NAND: "not ({left} and {right})",
+    TokenType.NOR: "not ({left} or {right})",
+    TokenType.XOR: "{left} != {right}",
+    TokenType.IF: "not {left} or {right}",
+    TokenType.EQ: "{left} == {right}",
+}
+
+
+### Compiler
+# Compiles the Syntax Tree into a python function, so that it can be evaluated many times
+# without walking the tree and dispatching on the token type of every node
+class CompiledExpression:
+    """
+    Callable taking the values of the variables as positional arguments (in the order of `variables`).
+    Only the generated source is pickled, the function is rebuilt when unpickling.
+    """
+
+    def __init__(self, variables: list[str], source: str):
+        self.variables = variables
+        self.source = source
+        self.function = self._build()
+
+    def __call__(self, *values: bool) -> bool | tuple[bool, ...]:
+        return self.function(*values)
+
+    def __getstate__(self):
+        return {"variables": self.variables, "source": self.source}
+
+    def __setstate__(self, state):
+        self.variables = state["variables"]
+        self.source = state["source"]
+        self.function = self._build()
+
+    def evaluate(self, variable_values: dict[str, bool]) -> bool:
+        """Evaluate the expression given a dictionary of variable values, like the Evaluator"""
+        return self.function(*(variable_values[v] for v in self.variables))
+
+    def _build(self):
+        namespace = {}
+        exec(compile(self.source, "<flipflop>", "exec"), namespace)
+        return namespace["expression"]
+
+
+class Compiler:
+    def compile(
+        self, node: Node, variables: list[str] | None = None
+    ) -> CompiledExpression:
+        """
+        Compile the AST node into a function with one positional argument for each variable.
+        The body is generated as straight-line code with one local slot for each distinct sub-expression,
+        so that deeply nested expressions do not hit the limits of the python parser.
+        """
+        index = ExpressionIndex(node)
+        return self.compile_index(index, [index.root], variables, many=False)
+
+    def compile_many(
+        self, nodes: list[Node], variables: list[str] | None = None
+    ) -> CompiledExpression:
+        """
+        Compile multiple expressions into a single function returning a tuple with the value of each one.
+        Every distinct sub-expression is evaluated once per call, and all the outputs read from the same slots.
+        """
+        index = ExpressionIndex(nodes[0])
+        outputs = [index.add(node) for node in nodes]
+        return self.compile_index(index, outputs, variables)
+
+    def compile_index(
+        self,
+        index: ExpressionIndex,
+        outputs: list[int],
+        variables: list[str] | None = None,
+        many: bool = True,
+    ) -> CompiledExpression:
+        """Compile the expressions at the given positions of an already built index"""
+        if variables is None:
+            variables = index.variables
+
+        slots = {name: f"v{i}" for i, name in enumerate(variables)}
+        names: list[str] = []
+        lines = []
+
+        # The index is in post-order, so the slots of the children are always assigned before their parents
+        for node, (left, right) in zip(index.nodes, index.children):
+            if node.token.type == TokenType.VARIABLE:
+                names.append(slots[node.token.value])
+                continue
+
+            if node.token.type not in OPERATOR_TEMPLATES:
+                raise ValueError(f"Unsupported operator {node.token.type}")
+
+            name = f"t{len(lines)}"
+            expression = OPERATOR_TEMPLATES[node.token.type].format(
+                left=names[left] if left != -1 else "False",
+                right=names[right] if right != -1 else "False",
+            )
+            lines.append(f"    {name} = {expression}")
+            names.append(name)
+
+        if many:
+            lines.append(f"    return ({''.join(f'{names[i]}, ' for i in outputs)})")
+        else:
+            lines.append(f"    return {names[outputs[0]]}")
+
+        arguments = ", ".join(f"v{i}" for i in range(len(variables)))
+        source = f"def expression({arguments}):\n" + "\n".join(lines) + "\n"
+        return CompiledExpression(variables, source)
@@ -0,0 +1,60 @@
+import weakref
+
+from .bdd import BDD
+from .interpreter import Interpreter
+from .node import Node
+from .token import TokenType
+
+
+### Diagram
+# Interprets the Syntax Tree through its decision diagram (see the BDD manager)
+class BddInterpreter(Interpreter):
+    """
+    Interpreter producing the same truth table as the default one (the rows are still enumerated),
+    but counting the models and finding a counterexample from the diagram of the expression, without enumerating them.
+    The root of the diagram stays referenced until the interpreter is closed (or used as a context manager),
+    or garbage collected, so the nodes of a manager shared by several interpreters can be reclaimed.
+    """
+
+    def __init__(self, root_node: Node, bdd: BDD | None = None):
+        super().__init__(root_node)
+
+        self.bdd = bdd if bdd is not None else BDD()
+        self.root = self.bdd.from_node(root_node)
+        self._release = weakref.finalize(self, self.bdd.deref, self.root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the reference to the root, the interpreter can't be used anymore (closing it again does nothing)"""
+        self._release()
+
+    def is_satisfiable(self) -> bool:
+        return self.bdd.is_satisfiable(self.root)
+
+    def is_equivalent(self, node: Node) -> bool:
+        """Check if another expression is equivalent to the interpreted one"""
+        other = self.bdd.from_node(node)
+        try:
+            return self.bdd.equivalent(self.root, other)
+        finally:
+            self.bdd.deref(other)
+
+    def count_models(self) -> int:
+        """Number of rows of the truth table in which the expression is True"""
+        return self.bdd.count(self.root, len(self.index.variables))
+
+    def counterexample(self) -> dict[str, bool] | None:
+        negation = self.bdd.apply(TokenType.NOT, self.root)
+        assignment = self.bdd.satisfy_one(negation)
+        if assignment is None:
+            return None
+
+        return {v: assignment[v] for v in self.index.variables}
+
+    def _essential_variables(self) -> list[str]:
+        return [v for v in self.index.variables if self.bdd.depends_on(self.root, v)]
@@ -0,0 +1,154 @@
+import random
+
+from .index import ExpressionIndex
+from .node import Node, NodeFactory
+from .packed import evaluate_packed
+from .sat import GATE_CLAUSES, Solver, Tseitin
+from .token import Token, TokenType
+
+# Operators whose operands can be swapped
+COMMUTATIVE = frozenset(
+    {
+        TokenType.AND,
+        TokenType.OR,
+        TokenType.NAND,
+        TokenType.NOR,
+        TokenType.XOR,
+        TokenType.EQ,
+    }
+)
+
+
+### Equivalence
+# Checks if two expressions have the same value for every assignment of their variables
+# The cheap checks come first: equal structures are equivalent, and random simulation quickly distinguishes most
+# expressions which are not, while the complete SAT check of the miter (left XOR right) decides the rest
+class EquivalenceChecker:
+    """
+    The result is a dictionary with whether the expressions are equivalent, the method which decided it
+    ("structural", "simulation" or "sat"), and a distinguishing assignment of all variables when they differ.
+    """
+
+    def __init__(
+        self,
+        left: Node,
+        right: Node,
+        rounds: int = 4,
+        width: int = 256,
+        seed: int | None = None,
+    ):
+        self.left = left
+        self.right = right
+
+        # Number of simulation rounds, each one evaluating both expressions over `width` random assignments at once
+        self.rounds = rounds
+        self.width = width
+        self.random = random.Random(seed)
+
+        self.indexes = (ExpressionIndex(left), ExpressionIndex(right))
+        self.variables = sorted(
+            set(self.indexes[0].variables) | set(self.indexes[1].variables)
+        )
+
+    def check(self) -> dict:
+        if self.structurally_equal():
+            return self._result(True, "structural")
+
+        counterexample = self.simulate()
+        if counterexample is not None:
+            return self._result(False, "simulation", counterexample)
+
+        counterexample = self.solve()
+        if counterexample is not None:
+            return self._result(False, "sat", counterexample)
+
+        return self._result(True, "sat")
+
+    def structurally_equal(self) -> bool:
+        """
+        Build both expressions through the same unique table, with the operands of commutative operators
+        in a canonical order and double negations removed, equal structures end up as the same node.
+        """
+        factory = NodeFactory()
+        return self._canonical(factory, self.left) is self._canonical(
+            factory, self.right
+        )
+
+    def simulate(self) -> dict[str, bool] | None:
+        """Evaluate both expressions bit-parallel over random assignments, and return one for which they differ"""
+        full = (1 << self.width) - 1
+        for _ in range(self.rounds):
+            columns = {
+                name: self.random.getrandbits(self.width) for name in self.variables
+            }
+
+            left, right = (
+                self._simulate(index, columns, full) for index in self.indexes
+            )
+            difference = left ^ right
+            if difference:
+                # Any bit where the results differ is a distinguishing assignment
+                bit = (difference & -difference).bit_length() - 1
+                return {
+                    name: bool((columns[name] >> bit) & 1) for name in self.variables
+                }
+
+        return None
+
+    def solve(self) -> dict[str, bool] | None:
+        """Check if the miter (left XOR right) is satisfiable, which is the case when the expressions differ"""
+        encoder = Tseitin(self.variables)
+        left = encoder.encode(self.left)
+        right = encoder.encode(self.right)
+
+        miter = encoder.fresh()
+        encoder.clauses.extend(GATE_CLAUSES[TokenType.XOR](miter, left, right))
+
+        solver = Solver(encoder.count, encoder.clauses)
+        solver.add_clause([miter])
+        if not solver.solve():
+            return None
+
+        model = solver.model()
+        return {name: model[encoder.literals[name]] for name in self.variables}
+
+    def _canonical(self, factory: NodeFactory, root_node: Node) -> Node:
+        built: dict[int, Node] = {}
+        for node in root_node.postorder():
+            left = built[id(node.left)] if node.left is not None else None
+            right = built[id(node.right)] if node.right is not None else None
+            token_type = node.token.type
+
+            if token_type == TokenType.NOT and left.token.type == TokenType.NOT:
+                built[id(node)] = left.left
+                continue
+
+            # The children are unique in the factory, so their ids give a canonical order
+            if token_type in COMMUTATIVE and id(left) > id(right):
+                left, right = right, left
+
+            token = (
+                node.token
+                if token_type == TokenType.VARIABLE
+                else Token.operator(token_type)
+            )
+            built[id(node)] = factory.node(token, left=left, right=right)
+
+        return built[id(root_node)]
+
+    def _simulate(
+        self, index: ExpressionIndex, columns: dict[str, int], full: int
+    ) -> int:
+        return evaluate_packed(index, columns.__getitem__, full)[index.root]
+
+    def _result(
+        self,
+        equivalent: bool,
+        method: str,
+        counterexample: dict[str, bool] | None = None,
+    ) -> dict:
+        return {
+            "equivalent": equivalent,
+            "method": method,
+            "counterexample": counterexample,
+        }
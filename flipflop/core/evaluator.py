@@ -1,4 +1,8 @@
+import heapq
+
+from .index import ExpressionIndex
 from .node import Node
+from .partial import apply_partial
 from .token import TokenType
 
 
@@ -6,53 +10,153 @@ from .token import TokenType
 # Helper class for evaluating logical expressions
 class Evaluator:
     def evaluate(self, node: Node | None, variable_values: dict[str, bool]):
-        """Evaluate the AST node recursively given a dictionary of variable values"""
+        """
+        Evaluate the AST node given a dictionary of variable values.
+        The nodes are evaluated in post-order with an explicit stack, children before their parents.
+        """
 
         # None is an edge-case which may happen
         if node is None:
             return False
 
-        match node.token.type:
-            case TokenType.VARIABLE:
-                return variable_values[node.token.value]
+        values: dict[int, bool] = {}
+        for current in node.postorder():
+            if current.token.type == TokenType.VARIABLE:
+                values[id(current)] = variable_values[current.token.value]
+                continue
+
+            left_val = values[id(current.left)] if current.left is not None else False
+            right_val = (
+                values[id(current.right)] if current.right is not None else False
+            )
+            values[id(current)] = self._apply(current.token.type, left_val, right_val)
+
+        return values[id(node)]
+
+    def evaluate_partial(
+        self, node: Node | None, variable_values: dict[str, bool]
+    ) -> bool | None:
+        """
+        Evaluate the AST node with three-valued (Kleene) logic, variables missing from the dictionary are unknown.
+        Returns None when the value depends on the unknown variables, e.g. `p and q` is False when `p` is False,
+        but unknown when `p` is True.
+        """
+        if node is None:
+            return False
+
+        values: dict[int, bool | None] = {}
+        for current in node.postorder():
+            if current.token.type == TokenType.VARIABLE:
+                values[id(current)] = variable_values.get(current.token.value)
+                continue
+
+            left_val = values[id(current.left)] if current.left is not None else None
+            right_val = values[id(current.right)] if current.right is not None else None
+            values[id(current)] = apply_partial(current.token.type, left_val, right_val)
+
+        return values[id(node)]
 
+    def _apply(self, token_type: TokenType, left_val: bool, right_val: bool) -> bool:
+        match token_type:
             case TokenType.NOT:
-                return not self.evaluate(node.left, variable_values)
+                return not left_val
 
             case TokenType.AND:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return left_val and right_val
 
             case TokenType.OR:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return left_val or right_val
 
             case TokenType.NAND:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return not (left_val and right_val)
 
             case TokenType.NOR:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return not (left_val or right_val)
 
             case TokenType.XOR:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return left_val != right_val
 
             case TokenType.IF:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return not left_val or right_val
 
             case TokenType.EQ:
-                left_val = self.evaluate(node.left, variable_values)
-                right_val = self.evaluate(node.right, variable_values)
                 return left_val == right_val
 
             case _:
-                raise ValueError(f"Unsupported operator {node.token.type}")
+                raise ValueError(f"Unsupported operator {token_type}")
+
+
+class IncrementalEvaluator:
+    """
+    Keeps the value of every sub-expression for the current assignment of the variables, and updates them
+    when a single variable changes. Only the parents of the nodes whose value changed are evaluated again,
+    so the update stops as soon as the change is absorbed (e.g. `p and q` stays False when `q` changes and `p` is False).
+    """
+
+    def __init__(self, node: Node, variable_values: dict[str, bool] | None = None):
+        self.index = ExpressionIndex(node)
+        self.evaluator = Evaluator()
+
+        # Parents of each unique sub-expression (in the order of the index)
+        self.parents: list[list[int]] = [[] for _ in self.index.nodes]
+        for position, (left, right) in enumerate(self.index.children):
+            for child in {left, right} - {-1}:
+                self.parents[child].append(position)
+
+        # Variables missing from the initial values are False
+        self.values: list[bool] = []
+        for current, (left, right) in zip(self.index.nodes, self.index.children):
+            if current.token.type == TokenType.VARIABLE:
+                self.values.append(
+                    bool((variable_values or {}).get(current.token.value, False))
+                )
+            else:
+                self.values.append(self._evaluate(current, left, right))
+
+        # Number of nodes evaluated by the last update
+        self.touched = 0
+
+    def set(self, variable: str, value: bool) -> int:
+        """Change the value of a variable, and return the number of nodes evaluated again"""
+        if variable not in self.index.variable_positions:
+            raise KeyError(f"Unknown variable '{variable}'")
+
+        position = self.index.variable_positions[variable]
+        self.touched = 0
+        if self.values[position] == value:
+            return self.touched
+
+        self.values[position] = bool(value)
+
+        # Parents always come after their children in the index, so taking the lowest position first
+        # evaluates every node once, after all of its changed children
+        queue = list(self.parents[position])
+        heapq.heapify(queue)
+        queued = set(queue)
+        while queue:
+            current = heapq.heappop(queue)
+            left, right = self.index.children[current]
+            value = self._evaluate(self.index.nodes[current], left, right)
+            self.touched += 1
+
+            if value == self.values[current]:
+                continue
+
+            self.values[current] = value
+            for parent in self.parents[current]:
+                if parent not in queued:
+                    queued.add(parent)
+                    heapq.heappush(queue, parent)
+
+        return self.touched
+
+    def result(self) -> bool:
+        """Value of the root expression for the current assignment"""
+        return self.values[self.index.root]
+
+    def _evaluate(self, node: Node, left: int, right: int) -> bool:
+        return self.evaluator._apply(
+            node.token.type,
+            self.values[left] if left != -1 else False,
+            self.values[right] if right != -1 else False,
+        )
@@ -0,0 +1,103 @@
+from array import array
+
+from .node import Node, NodeFactory
+from .token import Token, TokenType
+
+# Token types stored as opcodes, the opcode is the position in this tuple
+OPCODES = tuple(TokenType)
+_opcode_positions = {token_type: i for i, token_type in enumerate(OPCODES)}
+
+
+### Flat
+# Compact representation of the Syntax Tree as parallel arrays in post-order
+# Each node is a row of the columns (opcode, left, right, variable slot), children are referenced by their row,
+# structurally equal sub-expressions are stored once, and -1 marks a missing child / non-variable node
+class FlatTree:
+    def __init__(
+        self,
+        opcodes: array | None = None,
+        left: array | None = None,
+        right: array | None = None,
+        slots: array | None = None,
+        variables: list[str] | None = None,
+    ):
+        self.opcodes = opcodes if opcodes is not None else array("B")
+        self.left = left if left is not None else array("i")
+        self.right = right if right is not None else array("i")
+        self.slots = slots if slots is not None else array("i")
+
+        # Variable names, in the order in which they first appear in the tree
+        self.variables = variables if variables is not None else []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    @property
+    def root(self) -> int:
+        return len(self.opcodes) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the columns (without the variable names)"""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.opcodes, self.left, self.right, self.slots)
+        )
+
+    @classmethod
+    def from_node(cls, root_node: Node) -> "FlatTree":
+        tree = cls()
+        variable_slots: dict[str, int] = {}
+
+        # Rows of the visited nodes (by identity), and unique rows by structure
+        rows: dict[int, int] = {}
+        unique: dict[tuple, int] = {}
+
+        for node in root_node.postorder():
+            left = rows[id(node.left)] if node.left is not None else -1
+            right = rows[id(node.right)] if node.right is not None else -1
+
+            slot = -1
+            if node.token.type == TokenType.VARIABLE:
+                slot = variable_slots.setdefault(node.token.value, len(variable_slots))
+
+            key = (node.token.type, slot, left, right)
+            row = unique.get(key)
+            if row is None:
+                row = len(tree.opcodes)
+                unique[key] = row
+                tree.opcodes.append(_opcode_positions[node.token.type])
+                tree.left.append(left)
+                tree.right.append(right)
+                tree.slots.append(slot)
+
+            rows[id(node)] = row
+
+        tree.variables = list(variable_slots)
+        return tree
+
+    def to_node(self, factory: NodeFactory | None = None) -> Node:
+        """Build the nodes back, structurally equal sub-expressions are shared through the factory"""
+        if factory is None:
+            factory = NodeFactory()
+
+        nodes: list[Node] = []
+        for opcode, left, right, slot in zip(
+            self.opcodes, self.left, self.right, self.slots
+        ):
+            token_type = OPCODES[opcode]
+            token = (
+                Token(token_type, self.variables[slot])
+                if token_type == TokenType.VARIABLE
+                else Token.operator(token_type)
+            )
+
+            nodes.append(
+                factory.node(
+                    token,
+                    left=nodes[left] if left != -1 else None,
+                    right=nodes[right] if right != -1 else None,
+                )
+            )
+
+        return nodes[-1]
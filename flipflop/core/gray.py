@@ -0,0 +1,130 @@
+from .compiler import OPERATOR_TEMPLATES
+from .interpreter import Interpreter
+from .node import Node
+from .token import TokenType
+
+# Orders in which the rows can be emitted
+ORDERS = ("canonical", "gray")
+
+
+### Gray
+# Enumerates the rows in Gray code order, in which consecutive rows differ in a single variable
+# The values of all sub-expressions are kept between rows, and after each flip only the fan-out cone of the flipped
+# variable (the sub-expressions containing it) is evaluated again, by a function compiled for that variable
+class GrayInterpreter(Interpreter):
+    """
+    Interpreter producing the same truth table as the default one, with the rows in the canonical order
+    (re-ordered after the enumeration), or in the Gray code order in which they were evaluated.
+    """
+
+    def __init__(self, root_node: Node, order: str = "canonical"):
+        super().__init__(root_node)
+
+        if order not in ORDERS:
+            raise ValueError(
+                f"Unknown order '{order}', expected one of: {', '.join(ORDERS)}"
+            )
+
+        self.order = order
+
+    def evaluate(self, full: bool = True, reduce: bool = False, expand: bool = False):
+        if reduce:
+            return self.evaluate_reduced(full, expand)
+
+        columns = self.index.columns(full)
+        rows = list(self.gray_rows(columns))
+        root_column = columns.index(self.index.root)
+
+        if self.order == "canonical":
+            # Row i of the enumeration is row i ^ (i >> 1) of the truth table
+            canonical = [None] * len(rows)
+            for i, row in enumerate(rows):
+                canonical[i ^ (i >> 1)] = row
+            rows = canonical
+
+        return {
+            "header": [self.index.header(i) for i in columns],
+            "values": rows,
+            "is_tautology": all(row[root_column] for row in rows),
+        }
+
+    def iter_rows(self, full: bool = True):
+        """Yield the rows one at a time, only the Gray code order can be produced without keeping every row"""
+        if self.order == "canonical":
+            yield from super().iter_rows(full)
+        else:
+            yield from self.gray_rows(self.index.columns(full))
+
+    def assignment(self, i: int) -> tuple[bool, ...]:
+        # Row i of the Gray code order is row i ^ (i >> 1) of the canonical one
+        if self.order == "gray":
+            i ^= i >> 1
+
+        return super().assignment(i)
+
+    def gray_rows(self, columns: list[int]):
+        """Yield the values of the columns for every row, in Gray code order"""
+        variables = self.index.variables
+        flips = self.compile_flips()
+
+        # Every variable starts False, so the first row is evaluated in full
+        values = [False] * len(self.index.nodes)
+        self.compile_cone(list(range(len(self.index.nodes))))(values)
+        yield [values[i] for i in columns]
+
+        for i in range(1, 1 << len(variables)):
+            # The bit flipped between two consecutive Gray codes is the lowest set bit of the counter,
+            # and the first variable is the most significant bit of the row number
+            bit = (i & -i).bit_length() - 1
+            flips[len(variables) - 1 - bit](values)
+            yield [values[c] for c in columns]
+
+    def compile_flips(self) -> list:
+        """Compile a function for each variable, flipping it and updating its fan-out cone"""
+        parents: list[list[int]] = [[] for _ in self.index.nodes]
+        for position, (left, right) in enumerate(self.index.children):
+            for child in {left, right} - {-1}:
+                parents[child].append(position)
+
+        flips = []
+        for name in self.index.variables:
+            position = self.index.variable_positions[name]
+
+            cone = set()
+            stack = list(parents[position])
+            while stack:
+                parent = stack.pop()
+                if parent not in cone:
+                    cone.add(parent)
+                    stack.extend(parents[parent])
+
+            # Positions in the index are in post-order, so sorting the cone updates children before their parents
+            flips.append(self.compile_cone(sorted(cone), flip=position))
+
+        return flips
+
+    def compile_cone(self, positions: list[int], flip: int | None = None):
+        """Compile a function updating the values of the given positions in place (in this order)"""
+        lines = []
+        if flip is not None:
+            lines.append(f"    values[{flip}] = not values[{flip}]")
+
+        for position in positions:
+            node = self.index.nodes[position]
+            if node.token.type == TokenType.VARIABLE:
+                continue
+
+            if node.token.type not in OPERATOR_TEMPLATES:
+                raise ValueError(f"Unsupported operator {node.token.type}")
+
+            left, right = self.index.children[position]
+            expression = OPERATOR_TEMPLATES[node.token.type].format(
+                left=f"values[{left}]" if left != -1 else "False",
+                right=f"values[{right}]" if right != -1 else "False",
+            )
+            lines.append(f"    values[{position}] = {expression}")
+
+        source = "def update(values):\n" + "\n".join(lines or ["    pass"]) + "\n"
+        namespace = {}
+        exec(compile(source, "<flipflop>", "exec"), namespace)
+        return namespace["update"]
@@ -0,0 +1,107 @@
+from .node import Node
+from .token import TokenType
+
+
+### Index
+# Indexes the Syntax Tree in a single iterative post-order pass
+# Structurally equal sub-expressions share a single position, children always come before their parents
+class ExpressionIndex:
+    def __init__(self, root_node: Node):
+        # Unique nodes in post-order, with the positions of their children (-1 if there is no child)
+        self.nodes: list[Node] = []
+        self.children: list[tuple[int, int]] = []
+
+        # Variable names mapped to the position of their node
+        self.variable_positions: dict[str, int] = {}
+
+        # Nodes already indexed (by identity, the node is kept to make sure its id is not reused),
+        # and unique positions by structure
+        # The structural key only contains the positions of the children, so it is hashed in constant time
+        self._visited_ids: dict[int, tuple[Node, int]] = {}
+        self._positions: dict[tuple, int] = {}
+
+        self.root = self.add(root_node)
+
+    def add(self, node: Node) -> int:
+        """Index another expression (e.g. a sub-expression of the root) and return its position"""
+        position = self._build(node)
+
+        self.variables = sorted(self.variable_positions)
+
+        # The column order is built again when it's first needed
+        self._expressions = None
+
+        return position
+
+    @property
+    def expressions(self) -> list[int]:
+        """Positions of all expressions, sorted in the order of the columns in the truth table"""
+        if self._expressions is None:
+            # Sort visually in the truth table, shorter expressions first and alphabetically if equal in length
+            headers = self.headers
+            self._expressions = sorted(
+                range(len(self.nodes)), key=lambda i: (len(headers[i]), headers[i])
+            )
+
+        return self._expressions
+
+    @property
+    def headers(self) -> list[str]:
+        """
+        Headers of all expressions in the order of the index, the representations are cached by the nodes,
+        and built in post-order so that each one only joins the cached headers of its children.
+        """
+        return [repr(node) for node in self.nodes]
+
+    def header(self, position: int) -> str:
+        return repr(self.nodes[position])
+
+    def columns(self, full: bool = True) -> list[int]:
+        """
+        Positions of the expressions included in the truth table, either all sub-expressions,
+        or only the variables and the final expression.
+        """
+        if full:
+            return self.expressions
+
+        return [self.variable_positions[v] for v in self.variables] + [self.root]
+
+    def _build(self, root_node: Node) -> int:
+        visited_ids = self._visited_ids
+        positions = self._positions
+
+        stack = [(root_node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in visited_ids:
+                continue
+
+            if not expanded:
+                stack.append((node, True))
+                for child in (node.right, node.left):
+                    if child is not None and id(child) not in visited_ids:
+                        stack.append((child, False))
+                continue
+
+            left = visited_ids[id(node.left)][1] if node.left is not None else -1
+            right = visited_ids[id(node.right)][1] if node.right is not None else -1
+            key = (node.token.type, node.token.value, left, right)
+
+            position = positions.get(key)
+            if position is None:
+                position = len(self.nodes)
+                positions[key] = position
+                self.nodes.append(node)
+                self.children.append((left, right))
+
+                if node.token.type == TokenType.VARIABLE:
+                    if getattr(node.token, "value", None) is None:
+                        raise ValueError(
+                            "Encountered a variable token without a value (name)"
+                        )
+
+                    self.variable_positions[node.token.value] = position
+
+            visited_ids[id(node)] = (node, position)
+
+        return visited_ids[id(root_node)][1]
@@ -1,8 +1,13 @@
 import itertools
+from collections.abc import Iterator
 
-from .evaluator import Evaluator
+from .analysis import essential_variables
+from .compiler import Compiler
+from .index import ExpressionIndex
 from .node import Node
-from .token import Token, TokenType
+from .partial import CounterexampleSearch, ModelCount, PrunedEnumeration
+from .table import TruthTable
+from .token import TokenType
 
 
 ### Interpreter
@@ -10,106 +15,246 @@ from .token import Token, TokenType
 class Interpreter:
     def __init__(self, root_node: Node):
         self.root_node = root_node
-        self.evaluator = Evaluator()
+        self.compiler = Compiler()
 
-    def evaluate(self, full: bool = True):
-        """Evaluate the AST to determine the state of all expressions in all possible variable states"""
-        variables = self._collect_variables()
+        # Unique sub-expressions, variables and column order of the truth table, shared by all evaluations
+        self.index = ExpressionIndex(root_node)
 
-        if full:
-            expressions = self._collect_expressions()
-        else:
-            # Only include variables + final expression if intermediate (sub-expression) output is not necessary
-            expressions = [Node(Token(TokenType.VARIABLE, v)) for v in variables] + [
-                self.root_node
-            ]
+        # Functions computing a single row, compiled on first use (with and without the sub-expressions)
+        self._row_functions = {}
 
-        # Generate all combinations of truth values for the variables
-        combinations = list(itertools.product([False, True], repeat=len(variables)))
-
-        # Generate a truth table with rows for each expression
-        truth_table = {repr(expr): [] for expr in expressions}
-
-        # Evaluate each expression for each combination
-        values = []
-        for combination in combinations:
-            # Map variable names to their current values in this specific combination
-            current_variable_values = dict(zip(variables, combination))
+    def evaluate(self, full: bool = True, reduce: bool = False, expand: bool = False):
+        """
+        Evaluate the AST to determine the state of all expressions in all possible variable states.
+        With `reduce`, only the variables the expression actually depends on are enumerated (see `evaluate_reduced`).
+        """
+        if reduce:
+            return self.evaluate_reduced(full, expand)
 
-            row = []
-            for expression in expressions:
-                result = self.evaluator.evaluate(expression, current_variable_values)
-                truth_table[repr(expression)].append(result)
-                row.append(result)
+        # Only include variables + final expression if intermediate (sub-expression) output is not necessary
+        columns = self.index.columns(full)
+        values = list(self.iter_rows(full))
 
-            values.append(row)
+        # The root is always one of the columns, so the table already tells if it's a tautology
+        root_column = columns.index(self.index.root)
 
-        headers = [repr(expr) for expr in expressions]
         return {
-            "header": headers,
+            "header": self.headers(full),
             "values": values,
-            "is_tautology": self._is_tautology(),
+            "is_tautology": all(row[root_column] for row in values),
         }
 
-    def _collect_variables(
-        self, node: Node | None = None, variables: set[str] | None = None
-    ) -> list[str]:
+    def iter_rows(self, full: bool = True) -> Iterator[list[bool]]:
         """
-        Collect all variables from a Node.
-        Variables are also considered expressions, however this method allows to easily extract only variables.
+        Yield the rows of the truth table one at a time (in the order of the header),
+        the combinations of the variables are generated lazily, so the memory doesn't depend on the number of rows.
         """
-        if node is None:
-            node = self.root_node
+        variables = self.index.variables
+        columns = self.index.columns(full)
 
-        if variables is None:
-            variables = set()
+        # Compile all expressions into a single function, which evaluates every distinct sub-expression once
+        # per combination and returns the values of all the columns
+        function = self.compiler.compile_index(self.index, columns)
 
-        if node.token.type == TokenType.VARIABLE:
-            if getattr(node.token, "value", None) is None:
-                raise ValueError("Encountered a variable token without a value (name)")
+        for combination in itertools.product([False, True], repeat=len(variables)):
+            yield list(function(*combination))
 
-            variables.add(node.token.value)
+    def row(self, i: int, full: bool = True) -> list[bool]:
+        """
+        Evaluate only row i of the truth table (negative indexes count from the end),
+        the values of the variables are the binary digits of i, with the first variable as the most significant bit.
+        """
+        rows = 1 << len(self.index.variables)
+        if i < 0:
+            i += rows
 
-        if node.left:
-            self._collect_variables(node.left, variables)
+        if not 0 <= i < rows:
+            raise IndexError(f"Row {i} is out of range for a table of {rows} rows")
 
-        if node.right:
-            self._collect_variables(node.right, variables)
+        return list(self._row_function(full)(*self.assignment(i)))
 
-        return sorted(variables)
+    def rows(
+        self,
+        start: int | None = 0,
+        stop: int | None = None,
+        step: int | None = 1,
+        full: bool = True,
+    ) -> Iterator[list[bool]]:
+        """
+        Yield the rows in range(start, stop, step) of the truth table (with the same semantics as slicing a list),
+        only the requested rows are evaluated, so the cost of a page doesn't depend on where it starts.
+        """
+        rows = 1 << len(self.index.variables)
+        function = self._row_function(full)
 
-    def _collect_expressions(self, node: Node | None = None) -> list[Node]:
-        """Collect all expressions, including the variables, all sub-expressions, and the full expression."""
-        if node is None:
-            node = self.root_node
+        for i in range(*slice(start, stop, step).indices(rows)):
+            yield list(function(*self.assignment(i)))
 
-        expressions = []
+    def assignment(self, i: int) -> tuple[bool, ...]:
+        """Values of the variables in row i of the truth table"""
+        count = len(self.index.variables)
+        return tuple(bool((i >> (count - 1 - k)) & 1) for k in range(count))
 
-        if node.left:
-            expressions.extend(self._collect_expressions(node.left))
+    def _row_function(self, full: bool):
+        if full not in self._row_functions:
+            self._row_functions[full] = self.compiler.compile_index(
+                self.index, self.index.columns(full)
+            )
 
-        if node.right:
-            expressions.extend(self._collect_expressions(node.right))
+        return self._row_functions[full]
 
-        expressions.append(node)
+    def table(self, full: bool = True) -> TruthTable:
+        """
+        Evaluate the truth table into a `TruthTable`, which keeps every column packed as a bitset (one bit per row),
+        instead of a list of booleans for every row.
+        """
+        columns = self.index.columns(full)
+        return TruthTable.from_rows(
+            self.headers(full),
+            self.iter_rows(full),
+            1 << len(self.index.variables),
+            root=columns.index(self.index.root),
+        )
 
-        # Cast to set to remove duplicates, then sort which will return a list
-        return sorted(set(expressions))
+    def headers(self, full: bool = True) -> list[str]:
+        """Headers of the columns of the truth table"""
+        return [self.index.header(i) for i in self.index.columns(full)]
 
-    def _is_tautology(self) -> bool:
-        """Check if the root expression is a tautology."""
-        variables = self._collect_variables()
+    def evaluate_reduced(self, full: bool = True, expand: bool = False):
+        """
+        Evaluate the AST over its essential variables only, every dropped variable halves the number of rows.
+        Sub-expressions depending on a dropped variable are left out of the table (the final expression is always kept).
+        With `expand`, the rows are expanded back to every combination of all the variables,
+        reusing the value computed for the combination of the essential ones.
+        """
+        variables = self.index.variables
+        essential = self._essential_variables()
+        dropped = [v for v in variables if v not in essential]
+
+        # Whether each sub-expression (in the order of the index) contains a dropped variable
+        dropped_names = set(dropped)
+        contains_dropped: list[bool] = []
+        for node, (left, right) in zip(self.index.nodes, self.index.children):
+            if node.token.type == TokenType.VARIABLE:
+                contains_dropped.append(node.token.value in dropped_names)
+            else:
+                contains_dropped.append(
+                    (left != -1 and contains_dropped[left])
+                    or (right != -1 and contains_dropped[right])
+                )
+
+        # Dropped variables are only shown when the rows are expanded back to all the variables
+        root = self.index.root
+        columns = [
+            i
+            for i in self.index.columns(full)
+            if not contains_dropped[i]
+            or i == root
+            or (expand and self.index.nodes[i].token.type == TokenType.VARIABLE)
+        ]
+
+        # The expression doesn't depend on the dropped variables, so they are fixed to False
+        function = self.compiler.compile_index(
+            self.index, columns, variables=essential + dropped
+        )
+        constants = (False,) * len(dropped)
+        values = [
+            list(function(*combination, *constants))
+            for combination in itertools.product([False, True], repeat=len(essential))
+        ]
+
+        root_column = columns.index(root)
+        is_tautology = all(row[root_column] for row in values)
+
+        if expand:
+            values = self._expand(values, columns, essential)
+
+        return {
+            "header": [self.index.header(i) for i in columns],
+            "values": values,
+            "is_tautology": is_tautology,
+            "dropped_variables": dropped,
+        }
 
-        # Generate all combinations of truth values for the variables
-        combinations = list(itertools.product([False, True], repeat=len(variables)))
+    def evaluate_compressed(self):
+        """
+        Evaluate only the final expression, with one compressed row for each group of rows in which it's decided
+        before all the variables are fixed, the variables which don't matter for the group are None (don't-care).
+        The rows are in the order of the truth table, and every row of the full table is covered by exactly one.
+        """
+        values = []
+        is_tautology = True
+        for variables, result in PrunedEnumeration(self.index):
+            values.append(variables + [result])
+            is_tautology = is_tautology and result
+
+        return {
+            "header": self.index.variables + [self.index.header(self.index.root)],
+            "values": values,
+            "is_tautology": is_tautology,
+        }
 
-        # Evaluate the root expression for each combination
-        for combination in combinations:
-            current_variable_values = dict(zip(variables, combination))
-            result = self.evaluator.evaluate(self.root_node, current_variable_values)
+    def _expand(
+        self, reduced: list[list[bool]], columns: list[int], essential: list[str]
+    ) -> list[list[bool]]:
+        """Expand the rows evaluated over the essential variables to every combination of all the variables"""
+        variables = self.index.variables
+        slots = {name: i for i, name in enumerate(variables)}
+        essential_slots = [slots[name] for name in essential]
 
-            # If any combination yields False, the expression is not a tautology
-            if result is not True:
-                return False
+        # Variable columns take their value from the combination, the other ones from the reduced row
+        variable_slots = [
+            slots[self.index.nodes[i].token.value]
+            if self.index.nodes[i].token.type == TokenType.VARIABLE
+            else None
+            for i in columns
+        ]
 
-        return True
+        values = []
+        for combination in itertools.product([False, True], repeat=len(variables)):
+            reduced_row = 0
+            for slot in essential_slots:
+                reduced_row = (reduced_row << 1) | combination[slot]
+
+            row = reduced[reduced_row]
+            values.append(
+                [
+                    row[column] if slot is None else combination[slot]
+                    for column, slot in enumerate(variable_slots)
+                ]
+            )
+
+        return values
+
+    def _essential_variables(self) -> list[str]:
+        """Variables the root expression actually depends on."""
+        return essential_variables(self.root_node)
+
+    def _collect_variables(self) -> list[str]:
+        """
+        Collect all variables from the AST.
+        Variables are also considered expressions, however this method allows to easily extract only variables.
+        """
+        return list(self.index.variables)
+
+    def _collect_expressions(self) -> list[Node]:
+        """Collect all expressions, including the variables, all sub-expressions, and the full expression."""
+        return [self.index.nodes[i] for i in self.index.expressions]
+
+    def count_models(self) -> int:
+        """
+        Number of rows of the truth table in which the root expression is True.
+        Rows decided by a prefix of the variables are counted in groups, and the last ones in packed columns.
+        """
+        return ModelCount(self.index).run()
+
+    def counterexample(self) -> dict[str, bool] | None:
+        """
+        Find an assignment of the variables for which the root expression is False (None for a tautology),
+        stopping at the first one, and deciding whole branches of the rows from partial assignments.
+        """
+        return CounterexampleSearch(self.index).run()
+
+    def _is_tautology(self) -> bool:
+        """Check if the root expression is a tautology, with the counterexample search of the engine."""
+        return self.counterexample() is None
@@ -10,6 +10,39 @@ from .token import Token, TokenType
 ### Lexer
 # Tokenizes the words into tokens
 class Lexer:
+    # Words of the operators and parentheses
+    word_types = {
+        "~": TokenType.NOT,
+        "¬": TokenType.NOT,
+        "∧": TokenType.AND,
+        "∨": TokenType.OR,
+        "→": TokenType.IF,
+        "↔": TokenType.EQ,
+        "⊕": TokenType.XOR,
+        "∣": TokenType.NAND,
+        "↓": TokenType.NOR,
+        "(": TokenType.L_PAR,
+        ")": TokenType.R_PAR,
+    }
+
+    # Tokens which can be followed by a variable, a unary operator or the opening of a sub-expression
+    operand_predecessors = frozenset(
+        {
+            TokenType.L_PAR,
+            TokenType.NOT,
+            TokenType.AND,
+            TokenType.OR,
+            TokenType.IF,
+            TokenType.EQ,
+            TokenType.XOR,
+            TokenType.NAND,
+            TokenType.NOR,
+        }
+    )
+
+    # Tokens which can be followed by a binary operator or the closing of a sub-expression
+    operator_predecessors = frozenset({TokenType.VARIABLE, TokenType.R_PAR})
+
     def __init__(self, words: list[str]):
         self.words = words
         self.tokens = []
@@ -21,55 +54,30 @@ class Lexer:
         return self.tokens
 
     def add_token(self, word: str):
-        match word:
-            case "~" | "¬":
+        # Every word which is not an operator or a parenthesis is a variable
+        token_type = self.word_types.get(word, TokenType.VARIABLE)
+
+        match token_type:
+            case TokenType.VARIABLE:
+                self.expect_variable_position(word)
+                self.tokens.append(Token(TokenType.VARIABLE, value=word))
+                return
+            case TokenType.NOT:
                 self.expect_unary_position(word)
-                self.tokens.append(Token(TokenType.NOT))
-            case "∧":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.AND))
-            case "∨":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.OR))
-            case "→":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.IF))
-            case "↔":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.EQ))
-            case "⊕":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.XOR))
-            case "∣":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.NAND))
-            case "↓":
-                self.expect_binary_position(word)
-                self.tokens.append(Token(TokenType.NOR))
-            case "(":
-                self.tokens.append(Token(TokenType.L_PAR))
-            case ")":
+            case TokenType.L_PAR:
+                pass
+            case TokenType.R_PAR:
                 self.expect_closing_parenthesis(word)
-                self.tokens.append(Token(TokenType.R_PAR))
             case _:
-                self.expect_variable_position(word)
-                self.tokens.append(Token(TokenType.VARIABLE, value=word))
+                self.expect_binary_position(word)
+
+        self.tokens.append(Token.operator(token_type))
 
     def expect_unary_position(self, word: str):
         """
         Expect a unary operator to be placed only after a left parenthesis, another unary, or as the first token.
         """
-        if self.tokens and self.tokens[-1].type not in {
-            TokenType.L_PAR,
-            TokenType.NOT,
-            TokenType.AND,
-            TokenType.OR,
-            TokenType.IF,
-            TokenType.EQ,
-            TokenType.XOR,
-            TokenType.NAND,
-            TokenType.NOR,
-        }:
+        if self.tokens and self.tokens[-1].type not in self.operand_predecessors:
             raise InvalidUnaryTokenPlacement(
                 f"Invalid placement of unary operator '{word}' after '{self.tokens[-1].type}'"
             )
@@ -78,10 +86,7 @@ class Lexer:
         """
         Expect a binary operator to follow either a variable or a right parenthesis.
         """
-        if not self.tokens or self.tokens[-1].type not in {
-            TokenType.VARIABLE,
-            TokenType.R_PAR,
-        }:
+        if not self.tokens or self.tokens[-1].type not in self.operator_predecessors:
             raise InvalidBinaryTokenPlacement(
                 f"Invalid placement of binary operator '{word}' at the start or after an invalid token"
             )
@@ -91,17 +96,7 @@ class Lexer:
         Expect a variable to follow a left parenthesis, any operator, or as the first token.
         Disallow variable immediately after another variable or right parenthesis without an operator.
         """
-        if self.tokens and self.tokens[-1].type not in {
-            TokenType.L_PAR,
-            TokenType.NOT,
-            TokenType.AND,
-            TokenType.OR,
-            TokenType.IF,
-            TokenType.EQ,
-            TokenType.XOR,
-            TokenType.NAND,
-            TokenType.NOR,
-        }:
+        if self.tokens and self.tokens[-1].type not in self.operand_predecessors:
             raise InvalidVariableTokenPlacement(
                 f"Invalid placement of variable '{word}' immediately following '{self.tokens[-1].type}'"
             )
@@ -111,10 +106,7 @@ class Lexer:
         Expect a closing parenthesis to follow a variable or another right parenthesis,
         indicating the closure of an open expression.
         """
-        if not self.tokens or self.tokens[-1].type not in {
-            TokenType.VARIABLE,
-            TokenType.R_PAR,
-        }:
+        if not self.tokens or self.tokens[-1].type not in self.operator_predecessors:
             raise InvalidParenthesisTokenPlacement(
                 "Invalid placement of closing parenthesis ')' without a matching opening '(' or improperly placed"
             )
@@ -5,26 +5,79 @@ from .token import Token
 
 
 class Node:
+    """
+    Nodes are immutable, which allows to compute the hash once when the node is created
+    (the hashes of the children are already cached, so it takes constant time).
+    The string and JSON representations are also computed only once, when they're first requested.
+    Only the representation of the requested node is cached (not of all its sub-trees), as the cached strings
+    of all nodes in a deep tree would take memory quadratic to the size of the tree.
+    """
+
+    __slots__ = ("token", "left", "right", "_hash", "_repr", "_json")
+
     def __init__(
         self, token: Token, left: Self | None = None, right: Self | None = None
     ):
-        self.token = token
-        self.left = left
-        self.right = right
+        object.__setattr__(self, "token", token)
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+        object.__setattr__(self, "_hash", hash((token, left, right)))
+        object.__setattr__(self, "_repr", None)
+        object.__setattr__(self, "_json", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot set '{name}', Node is immutable")
+
+    def __reduce__(self):
+        # The tree is flattened in post-order, so that pickling deep trees doesn't recurse,
+        # and rebuilt through __init__, as the cached hash is not valid in a different process
+        positions: dict[int, int] = {}
+        tokens, children = [], []
+        for node in self.postorder():
+            positions[id(node)] = len(tokens)
+            tokens.append(node.token)
+            children.append(
+                (
+                    positions[id(node.left)] if node.left is not None else -1,
+                    positions[id(node.right)] if node.right is not None else -1,
+                )
+            )
+
+        return _unflatten, (tokens, children)
 
     def __eq__(self, other):
         if not isinstance(other, Node):
             return NotImplemented
 
+        # Nodes built by the same NodeFactory are equal only if they are the same object,
+        # different hashes are enough to tell that the nodes are not equal
+        if self is other:
+            return True
+
+        if self._hash != other._hash:
+            return False
+
         # Nodes are considered equal if the tokens, left children, and right children are equal
-        return (
-            self.token == other.token
-            and self.left == other.left
-            and self.right == other.right
-        )
+        # The children are compared with an explicit stack, so that deep trees do not recurse
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            if left is right:
+                continue
+
+            if left is None or right is None or left._hash != right._hash:
+                return False
+
+            if left.token != right.token:
+                return False
+
+            stack.append((left.right, right.right))
+            stack.append((left.left, right.left))
+
+        return True
 
     def __hash__(self):
-        return hash((self.token, self.left, self.right))
+        return self._hash
 
     def __lt__(self, other):
         """
@@ -58,38 +111,159 @@ class Node:
         return repr(self)
 
     def __repr__(self):
-        # Handle binary operations (e.g. AND, OR, XOR)
-        if self.left and self.right:
-            return f"({self._repr_child(self.left)} {self.token.type.value} {self._repr_child(self.right)})"
+        if self._repr is None:
+            object.__setattr__(self, "_repr", "".join(self._repr_parts()))
+
+        return self._repr
+
+    def _repr_parts(self) -> list[str]:
+        """
+        Build the representation from left to right with an explicit stack,
+        reusing the cached representations of the sub-trees which have already been formatted.
+        """
+        parts = []
+
+        stack = [self]
+        while stack:
+            item = stack.pop()
 
-        # Handle unary operations (e.g. NOT)
-        elif self.left:
-            return f"{self.token.type.value}({self._repr_child(self.left)})"
+            if isinstance(item, str):
+                parts.append(item)
 
-        # Handle leaf nodes (e.g. VARS)
-        else:
-            return self._format_leaf()
+            elif item._repr is not None:
+                parts.append(item._repr)
 
-    def _repr_child(self, child):
-        """Format child nodes"""
-        return repr(child)
+            # Handle binary operations (e.g. AND, OR, XOR)
+            elif item.left and item.right:
+                stack.extend(
+                    [")", item.right, f" {item.token.type.value} ", item.left, "("]
+                )
+
+            # Handle unary operations (e.g. NOT)
+            elif item.left:
+                stack.extend([")", item.left, f"{item.token.type.value}("])
+
+            # Handle leaf nodes (e.g. VARS)
+            else:
+                parts.append(item._format_leaf())
+
+        return parts
 
     def _format_leaf(self):
         """Format leaf node which will be variables"""
         return str(self.token.value)
 
     def to_json_serializable(self):
-        data = {
-            "token": self.token.to_json_serializable(),
-        }
+        """
+        Note: The returned dictionary is cached, and shared with the dictionaries of the parent nodes,
+        it should not be modified.
+        """
+        if self._json is None:
+            for node in self._uncached_postorder("_json"):
+                data = {
+                    "token": node.token.to_json_serializable(),
+                }
 
-        if self.left is not None:
-            data["left"] = self.left.to_json_serializable()
+                if node.left is not None:
+                    data["left"] = node.left._json
 
-        if self.right is not None:
-            data["right"] = self.right.to_json_serializable()
+                if node.right is not None:
+                    data["right"] = node.right._json
 
-        return data
+                object.__setattr__(node, "_json", data)
+
+        return self._json
+
+    def postorder(self):
+        """Iterate the distinct nodes of the tree (shared sub-trees only once), children before their parents"""
+        visited: set[int] = set()
+
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in visited:
+                continue
+
+            if expanded:
+                visited.add(id(node))
+                yield node
+                continue
+
+            stack.append((node, True))
+            for child in (node.right, node.left):
+                if child is not None and id(child) not in visited:
+                    stack.append((child, False))
+
+    def _uncached_postorder(self, attribute: str):
+        """Iterate the nodes which don't have the cached attribute yet, children before their parents"""
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if getattr(node, attribute) is not None:
+                continue
+
+            if expanded:
+                yield node
+                continue
+
+            stack.append((node, True))
+            for child in (node.right, node.left):
+                if child is not None and getattr(child, attribute) is None:
+                    stack.append((child, False))
 
     def as_json(self):
         return json.dumps(self.to_json_serializable(), indent=4)
+
+
+def _unflatten(tokens: list[Token], children: list[tuple[int, int]]) -> Node:
+    """Rebuild a pickled tree from its nodes in post-order, shared sub-trees are restored only once"""
+    nodes: list[Node] = []
+    for token, (left, right) in zip(tokens, children):
+        nodes.append(
+            Node(
+                token,
+                left=nodes[left] if left != -1 else None,
+                right=nodes[right] if right != -1 else None,
+            )
+        )
+
+    return nodes[-1]
+
+
+class NodeFactory:
+    """
+    Builds nodes through a unique table, so that structurally equal sub-trees are the same object.
+    Children passed to `node()` have to be built by the same factory, use `intern()` for any other tree.
+    """
+
+    def __init__(self):
+        self.table: dict[tuple, Node] = {}
+
+    def __len__(self):
+        return len(self.table)
+
+    def node(
+        self, token: Token, left: Node | None = None, right: Node | None = None
+    ) -> Node:
+        # The children are unique already, so they can be identified by their id
+        key = (token.type, token.value, id(left), id(right))
+
+        node = self.table.get(key)
+        if node is None:
+            node = Node(token, left=left, right=right)
+            self.table[key] = node
+
+        return node
+
+    def intern(self, root_node: Node) -> Node:
+        """Rebuild any tree through the unique table, returning the shared equivalent of the root node"""
+        built: dict[int, Node] = {}
+
+        for node in root_node.postorder():
+            built[id(node)] = self.node(
+                node.token,
+                left=built[id(node.left)] if node.left is not None else None,
+                right=built[id(node.right)] if node.right is not None else None,
+            )
+
+        return built[id(root_node)]
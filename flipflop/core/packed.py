@@ -0,0 +1,87 @@
+from collections.abc import Callable
+
+from .index import ExpressionIndex
+from .token import TokenType
+
+
+### Packed
+# Columns of the truth table packed as integers, with one bit per row (bit i = row i)
+# Each operator is applied to all the rows of a column at once with a single bitwise operation
+def variable_mask(position: int, rows: int) -> int:
+    """
+    Build the column of a variable which flips every 2 ** position rows.
+    The last variable (position 0) alternates every row, the first one is False for the first half of the table.
+    """
+    block = 1 << position
+    mask = ((1 << block) - 1) << block
+    width = block << 1
+
+    # Repeat the pattern by doubling it until it covers every row
+    while width < rows:
+        mask |= mask << width
+        width <<= 1
+
+    return mask & ((1 << rows) - 1)
+
+
+def apply_operator(token_type: TokenType, left: int, right: int, full: int) -> int:
+    """Apply an operator to whole columns, `full` is the column with every row set to True"""
+    match token_type:
+        case TokenType.NOT:
+            return full ^ left
+
+        case TokenType.AND:
+            return left & right
+
+        case TokenType.OR:
+            return left | right
+
+        case TokenType.NAND:
+            return full ^ (left & right)
+
+        case TokenType.NOR:
+            return full ^ (left | right)
+
+        case TokenType.XOR:
+            return left ^ right
+
+        case TokenType.IF:
+            return (full ^ left) | right
+
+        case TokenType.EQ:
+            return full ^ (left ^ right)
+
+        case _:
+            raise ValueError(f"Unsupported operator {token_type}")
+
+
+def unpack_column(column: int, rows: int) -> list[bool]:
+    """Expand a packed column into a list of booleans, one for each row"""
+    bits = format(column, "b").zfill(rows)
+    return [bit == "1" for bit in reversed(bits)]
+
+
+def evaluate_packed(
+    index: ExpressionIndex, leaf_column: Callable[[str], int], full: int
+) -> list[int]:
+    """
+    Compute the packed column of every unique sub-expression (in the order of the index) with a single pass,
+    `leaf_column` gives the column of each variable, and `full` is the column with every row set to True.
+    """
+    # The index is in post-order, so the children are always evaluated before their parents
+    columns: list[int] = []
+    for node, (left, right) in zip(index.nodes, index.children):
+        if node.token.type == TokenType.VARIABLE:
+            columns.append(leaf_column(node.token.value))
+            continue
+
+        columns.append(
+            apply_operator(
+                node.token.type,
+                columns[left] if left != -1 else 0,
+                columns[right] if right != -1 else 0,
+                full,
+            )
+        )
+
+    return columns
@@ -0,0 +1,204 @@
+import collections
+import itertools
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .compiler import CompiledExpression
+from .interpreter import Interpreter
+from .node import Node
+
+# Every worker gets a few shards, so that a slow shard doesn't leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+# Number of rows a worker evaluates between two checks of the cancellation flag
+CANCEL_INTERVAL = 1 << 12
+
+# Rows are streamed in blocks of 2 ** STREAM_BITS rows, every block is evaluated and sent back by a single worker
+STREAM_BITS = 12
+
+# Number of tasks submitted ahead for every worker, so the memory of a stream doesn't depend on the number of rows
+PREFETCH_PER_WORKER = 2
+
+# Set in every worker process, once any of them found a counterexample
+_cancelled = None
+
+
+def _initialize(cancelled) -> None:
+    global _cancelled
+    _cancelled = cancelled
+
+
+def _combinations(free: int) -> Iterator[tuple[bool, ...]]:
+    return itertools.product([False, True], repeat=free)
+
+
+def _evaluate_shard(
+    function: CompiledExpression, prefix: tuple[bool, ...], free: int
+) -> list[list[bool]]:
+    return [list(function(*prefix, *values)) for values in _combinations(free)]
+
+
+def _evaluate_range(
+    function: CompiledExpression, count: int, rows: range
+) -> list[list[bool]]:
+    """Evaluate the rows of the range, the values of the `count` variables are the binary digits of each row"""
+    shifts = range(count - 1, -1, -1)
+    return [list(function(*(bool((i >> k) & 1) for k in shifts))) for i in rows]
+
+
+def _count_shard(
+    function: CompiledExpression, prefix: tuple[bool, ...], free: int
+) -> int:
+    return sum(1 for values in _combinations(free) if function(*prefix, *values))
+
+
+def _search_shard(
+    function: CompiledExpression, prefix: tuple[bool, ...], free: int
+) -> tuple[tuple[bool, ...] | None, int]:
+    """Return the first falsifying row of the shard (None if there is none), and the number of rows evaluated"""
+    for i, values in enumerate(_combinations(free)):
+        if i % CANCEL_INTERVAL == 0 and _cancelled is not None and _cancelled.is_set():
+            return None, i
+
+        if not function(*prefix, *values):
+            return prefix + values, i + 1
+
+    return None, 1 << free
+
+
+### Parallel
+# Splits the rows into contiguous shards, by fixing the values of the first (most significant) variables,
+# and evaluates the shards in worker processes
+# The workers receive the compiled expression, which is pickled as its generated source
+class ParallelInterpreter(Interpreter):
+    """
+    Interpreter producing the same truth table as the default one, with the shards evaluated by `workers` processes
+    (all the cores by default) and reassembled in order. Counting and tautology checks are reduced in the workers,
+    and a tautology check stops the remaining shards as soon as one of them finds a counterexample.
+    Rows are streamed in small blocks with only a few of them in flight, and closing the stream cancels the others.
+    """
+
+    def __init__(
+        self,
+        root_node: Node,
+        workers: int | None = None,
+        shard_bits: int | None = None,
+    ):
+        super().__init__(root_node)
+
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.workers = workers or os.cpu_count() or 1
+
+        # Number of leading variables fixed in each shard, there are 2 ** shard_bits shards
+        if shard_bits is None:
+            shard_bits = (self.workers * SHARDS_PER_WORKER - 1).bit_length()
+
+        self.shard_bits = min(shard_bits, len(self.index.variables))
+
+        # Rows evaluated by the workers during the last counterexample search
+        self.rows_searched = 0
+
+    def shards(self) -> list[tuple[bool, ...]]:
+        """Values of the leading variables in every shard, in the order of the rows"""
+        return list(itertools.product([False, True], repeat=self.shard_bits))
+
+    def iter_rows(self, full: bool = True) -> Iterator[list[bool]]:
+        """Yield the rows in order, every block of rows is evaluated by a worker and yielded once the previous ones are"""
+        count = len(self.index.variables)
+        fixed = max(count - STREAM_BITS, 0)
+        function = self._row_function(full)
+
+        tasks = (
+            (function, prefix, count - fixed)
+            for prefix in itertools.product([False, True], repeat=fixed)
+        )
+        for rows in self._stream(_evaluate_shard, tasks):
+            yield from rows
+
+    def rows(
+        self,
+        start: int | None = 0,
+        stop: int | None = None,
+        step: int | None = 1,
+        full: bool = True,
+    ) -> Iterator[list[bool]]:
+        """Yield the rows in range(start, stop, step), evaluated by the workers in blocks like `iter_rows`"""
+        count = len(self.index.variables)
+        selected = range(*slice(start, stop, step).indices(1 << count))
+        function = self._row_function(full)
+
+        size = 1 << STREAM_BITS
+        tasks = (
+            (function, count, selected[i : i + size])
+            for i in range(0, len(selected), size)
+        )
+        for rows in self._stream(_evaluate_range, tasks):
+            yield from rows
+
+    def count_models(self) -> int:
+        free = len(self.index.variables) - self.shard_bits
+        function = self._root_function()
+        return sum(
+            self._stream(
+                _count_shard, ((function, prefix, free) for prefix in self.shards())
+            )
+        )
+
+    def counterexample(self) -> dict[str, bool] | None:
+        """Search every shard in parallel, the counterexample is the first one found, not the first row"""
+        function = self._root_function()
+        free = len(self.index.variables) - self.shard_bits
+
+        found = None
+        self.rows_searched = 0
+        cancelled = multiprocessing.Event()
+        with ProcessPoolExecutor(
+            self.workers, initializer=_initialize, initargs=(cancelled,)
+        ) as executor:
+            futures = [
+                executor.submit(_search_shard, function, prefix, free)
+                for prefix in self.shards()
+            ]
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                values, searched = future.result()
+                self.rows_searched += searched
+                if values is None or found is not None:
+                    continue
+
+                # Shards which haven't started are dropped, the running ones stop at their next check
+                found = values
+                cancelled.set()
+                for pending in futures:
+                    pending.cancel()
+
+        return None if found is None else dict(zip(self.index.variables, found))
+
+    def _root_function(self) -> CompiledExpression:
+        return self.compiler.compile_index(self.index, [self.index.root], many=False)
+
+    def _stream(self, task, arguments: Iterable[tuple]) -> Iterator:
+        """
+        Run the task with each tuple of arguments in the workers, and yield the results in order.
+        Tasks are submitted as the results are consumed, and closing the generator early cancels the pending ones
+        without waiting for the running ones.
+        """
+        executor = ProcessPoolExecutor(self.workers)
+        pending = collections.deque()
+        try:
+            for task_arguments in arguments:
+                pending.append(executor.submit(task, *task_arguments))
+                if len(pending) >= self.workers * PREFETCH_PER_WORKER:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
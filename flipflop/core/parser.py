@@ -1,5 +1,5 @@
 from .exceptions import ParserError, TokenAssertionError, UnexpectedTokenError
-from .node import Node
+from .node import Node, NodeFactory
 from .token import Token, TokenType
 
 
@@ -9,15 +9,14 @@ class Parser:
     """
     The key to understanding this parsing logic is to recognize that the parse tree needs to be structured
     to evaluate expressions from the most tightly bound operations (deepest nodes) outward to the least tightly
-    bound (root nodes). By starting with the lowest precedence operators, we ensure that these operators form
-    the uppermost nodes of the tree. This setup allows higher precedence operations, parsed subsequently,
-    to be nested deeper within the tree structure.
+    bound (root nodes). Lower precedence operators form the uppermost nodes of the tree, while higher precedence
+    operations are nested deeper within the tree structure.
 
-    This parsing approach ensures that when the tree is evaluated, the high precedence operations (deeper nodes)
-    are processed first, with their results propagating up to be further processed by the lower precedence
-    operators at higher levels of the tree. This method effectively allows each operator to operate on the results
-    of more tightly bound sub-expressions, respecting the intended order of operations and encapsulation of
-    logical units within the expression.
+    The tokens are parsed with operator precedence climbing, using explicit stacks of operands and pending
+    operators instead of recursion, so that the nesting depth of the expression is not limited by the python
+    call stack. Each binary operator first reduces the pending operators which bind at least as tightly
+    (all operators are left-associative), NOT is applied as soon as its operand is complete, and parentheses
+    mark the boundaries of sub-expressions on the operator stack.
 
     Complete operator precedence:
     1. Parentheses (Highest)
@@ -31,105 +30,98 @@ class Parser:
     9. EQ (Lowest)
     """
 
-    def __init__(self, tokens: list[Token]):
+    precedence = {
+        TokenType.NAND: 7,
+        TokenType.AND: 6,
+        TokenType.NOR: 5,
+        TokenType.OR: 4,
+        TokenType.XOR: 3,
+        TokenType.IF: 2,
+        TokenType.EQ: 1,
+    }
+
+    def __init__(self, tokens: list[Token], factory: NodeFactory | None = None):
         self.tokens = tokens
+
+        # Nodes are built through a unique table, so repeated sub-expressions are shared
+        self.factory = factory if factory is not None else NodeFactory()
         self.position = 0
         self.length = len(tokens)
 
     def parse(self) -> Node:
         """Parse the entire tree and return the root node"""
-        return self.eq_expr()
-
-    # 1. Handle equivalence (EQ) expressions
-    def eq_expr(self) -> Node:
-        node = self.imp_expr()
-        while self.match(TokenType.EQ):
-            token = Token(TokenType.EQ)
-            right = self.imp_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 2. Handle implication (IF) expressions
-    def imp_expr(self) -> Node:
-        node = self.xor_expr()
-        while self.match(TokenType.IF):
-            token = Token(TokenType.IF)
-            right = self.xor_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 3. Handle exclusive OR (XOR) expressions
-    def xor_expr(self) -> Node:
-        node = self.or_expr()
-        while self.match(TokenType.XOR):
-            token = Token(TokenType.XOR)
-            right = self.or_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 4. Handle OR expressions
-    def or_expr(self) -> Node:
-        node = self.nor_expr()
-        while self.match(TokenType.OR):
-            token = Token(TokenType.OR)
-            right = self.nor_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 5. Handle NOR expressions
-    def nor_expr(self) -> Node:
-        node = self.and_expr()
-        while self.match(TokenType.NOR):
-            token = Token(TokenType.NOR)
-            right = self.and_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 6. Handle AND expressions
-    def and_expr(self) -> Node:
-        node = self.nand_expr()
-        while self.match(TokenType.AND):
-            token = Token(TokenType.AND)
-            right = self.nand_expr()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 7. Handle NAND expressions
-    def nand_expr(self) -> Node:
-        node = self.factor()
-        while self.match(TokenType.NAND):
-            token = Token(TokenType.NAND)
-            right = self.factor()
-            node = Node(token, left=node, right=right)
-        return node
-
-    # 8. Handle the highest priority and nested logical units (VARS, PARENS, NOT)
-    def factor(self) -> Node:
-        token = self.current()
-
-        if getattr(token, "type", None) is None:
-            raise TokenAssertionError(
-                [TokenType.VARIABLE, TokenType.L_PAR, TokenType.NOT], None
-            )
+        operands: list[Node] = []
+        operators: list[TokenType] = []
 
-        match token.type:
-            case TokenType.VARIABLE:
-                self.consume()
-                return Node(token)
+        # Number of opened (not yet closed) parentheses on the operator stack
+        depth = 0
 
-            case TokenType.L_PAR:
-                self.consume()
-                node = self.parse()
-                self.expect(TokenType.R_PAR)
-                return node
+        while True:
+            # Expect an operand, optionally preceded by any NOT operators and opening parentheses
+            token = self.current()
 
-            case TokenType.NOT:
-                self.consume()
-                not_token = Token(TokenType.NOT)
-                return Node(not_token, left=self.factor())
+            if getattr(token, "type", None) is None:
+                raise TokenAssertionError(
+                    [TokenType.VARIABLE, TokenType.L_PAR, TokenType.NOT], None
+                )
+
+            match token.type:
+                case TokenType.NOT | TokenType.L_PAR:
+                    self.consume()
+                    operators.append(token.type)
+                    depth += token.type == TokenType.L_PAR
+                    continue
+
+                case TokenType.VARIABLE:
+                    self.consume()
+                    operands.append(self.factory.node(token))
+
+                case _:
+                    raise UnexpectedTokenError(token)
+
+            # The operand is complete, continue with operators and closing parentheses
+            while True:
+                self._reduce_unary(operands, operators)
+                token = self.current()
+
+                if token is not None and token.type in self.precedence:
+                    self.consume()
+                    self._reduce_binary(
+                        operands, operators, self.precedence[token.type]
+                    )
+                    operators.append(token.type)
+                    break
+
+                if depth == 0:
+                    # Anything else ends the expression at the top level
+                    self._reduce_binary(operands, operators, 0)
+                    return operands[-1]
+
+                # The sub-expression has to be closed, which completes it as an operand
+                self.expect(TokenType.R_PAR)
+                self._reduce_binary(operands, operators, 0)
+                operators.pop()
+                depth -= 1
+
+    def _reduce_unary(self, operands: list[Node], operators: list[TokenType]):
+        """Apply the NOT operators preceding the just completed operand"""
+        while operators and operators[-1] == TokenType.NOT:
+            operators.pop()
+            operands.append(
+                self.factory.node(Token.operator(TokenType.NOT), left=operands.pop())
+            )
 
-            case _:
-                raise UnexpectedTokenError(token)
+    def _reduce_binary(
+        self, operands: list[Node], operators: list[TokenType], precedence: int
+    ):
+        """Apply the pending binary operators (up to the innermost parenthesis) which bind at least as tightly"""
+        while operators and self.precedence.get(operators[-1], 0) >= max(precedence, 1):
+            token_type = operators.pop()
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(
+                self.factory.node(Token.operator(token_type), left=left, right=right)
+            )
 
     def match(self, token_type: TokenType) -> bool:
         if self.current() and self.current().type == token_type:
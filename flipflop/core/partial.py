@@ -0,0 +1,319 @@
+from collections.abc import Iterator
+
+from .index import ExpressionIndex
+from .packed import evaluate_packed, variable_mask
+from .token import TokenType
+
+# Number of unassigned variables from which the remaining rows are evaluated at once as packed columns
+SCAN_VARIABLES = 12
+
+
+### Partial
+# Evaluation of the Syntax Tree under a partial assignment of the variables
+# Unassigned variables are unknown (None), and operators short-circuit like in three-valued (Kleene) logic,
+# e.g. `p and q` is already False when `p` is False, whatever the value of `q`
+def apply_partial(
+    token_type: TokenType, left: bool | None, right: bool | None
+) -> bool | None:
+    match token_type:
+        case TokenType.NOT:
+            return None if left is None else not left
+
+        case TokenType.AND | TokenType.NAND:
+            if left is False or right is False:
+                value = False
+            elif left is None or right is None:
+                return None
+            else:
+                value = True
+
+            return value if token_type == TokenType.AND else not value
+
+        case TokenType.OR | TokenType.NOR:
+            if left is True or right is True:
+                value = True
+            elif left is None or right is None:
+                return None
+            else:
+                value = False
+
+            return value if token_type == TokenType.OR else not value
+
+        case TokenType.IF:
+            if left is False or right is True:
+                return True
+            if left is None or right is None:
+                return None
+            return False
+
+        case TokenType.XOR:
+            return None if left is None or right is None else left != right
+
+        case TokenType.EQ:
+            return None if left is None or right is None else left == right
+
+        case _:
+            raise ValueError(f"Unsupported operator {token_type}")
+
+
+def required_children(
+    token_type: TokenType, required: bool, left: bool | None, right: bool | None
+) -> tuple[bool | None, bool | None]:
+    """
+    Values the children are forced to take for the operator to have the required value,
+    given the values of the children which are already known (None where nothing is forced).
+    """
+    match token_type:
+        case TokenType.NOT:
+            return not required, None
+
+        case TokenType.AND | TokenType.NAND | TokenType.OR | TokenType.NOR:
+            # NAND and NOR are the negated AND and OR, and OR is AND with negated operands and result
+            if token_type in (TokenType.NAND, TokenType.NOR):
+                required = not required
+
+            # The value all operands have to take for AND to be True (OR to be False)
+            absorbing = token_type in (TokenType.AND, TokenType.NAND)
+            if required == absorbing:
+                return absorbing, absorbing
+
+            # Otherwise at least one operand has the other value, which is forced if the other one doesn't have it
+            return (
+                not absorbing if right is absorbing else None,
+                not absorbing if left is absorbing else None,
+            )
+
+        case TokenType.IF:
+            if not required:
+                return True, False
+
+            return (False if right is False else None, True if left is True else None)
+
+        case TokenType.XOR | TokenType.EQ:
+            # The value of each operand is forced as soon as the other one is known
+            differ = required if token_type == TokenType.XOR else not required
+            return (
+                None if right is None else right != differ,
+                None if left is None else left != differ,
+            )
+
+        case _:
+            raise ValueError(f"Unsupported operator {token_type}")
+
+
+def evaluate_index(
+    index: ExpressionIndex, assignment: dict[str, bool]
+) -> list[bool | None]:
+    """Value of each sub-expression (in the order of the index) under the partial assignment"""
+    values: list[bool | None] = []
+    for node, (left, right) in zip(index.nodes, index.children):
+        if node.token.type == TokenType.VARIABLE:
+            values.append(assignment.get(node.token.value))
+        else:
+            values.append(
+                apply_partial(
+                    node.token.type,
+                    values[left] if left != -1 else None,
+                    values[right] if right != -1 else None,
+                )
+            )
+
+    return values
+
+
+def scan_index(
+    index: ExpressionIndex, assignment: dict[str, bool], free: list[str]
+) -> int:
+    """
+    Packed column of the root over every combination of the unassigned variables `free`, in the order of the rows
+    (bit i = row i, the first free variable is the most significant bit), the assigned ones are constant columns.
+    """
+    rows = 1 << len(free)
+    full = (1 << rows) - 1
+    leaves = {name: full if value else 0 for name, value in assignment.items()}
+    leaves.update(
+        {name: variable_mask(len(free) - 1 - i, rows) for i, name in enumerate(free)}
+    )
+
+    return evaluate_packed(index, leaves.__getitem__, full)[index.root]
+
+
+class CounterexampleSearch:
+    """
+    Depth-first search of an assignment for which the root expression is False, stopping at the first one.
+    At every step the expression is evaluated under the partial assignment, so a branch is abandoned as soon as the
+    root is True, and it succeeds as soon as the root is False (the remaining variables can take any value).
+    Before branching, the value False is propagated down the tree: nodes whose value is forced by their parent
+    force their children in turn, and the variables reached this way are assigned (unit propagation).
+    Once at most `scan_variables` variables are left unassigned, pruning doesn't pay off anymore, and the remaining
+    rows are evaluated at once as packed columns instead (see `scan_index`).
+    """
+
+    def __init__(self, index: ExpressionIndex, scan_variables: int = SCAN_VARIABLES):
+        self.index = index
+        self.scan_variables = scan_variables
+
+        # Nodes explored, i.e. partial assignments evaluated
+        self.steps = 0
+
+    def run(self) -> dict[str, bool] | None:
+        """Return a counterexample (with the variables in sorted order), or None if the expression is a tautology"""
+        variables = self.index.variables
+
+        stack: list[dict[str, bool]] = [{}]
+        while stack:
+            assignment = stack.pop()
+            root = self._propagate(assignment)
+            if root is True:
+                continue
+
+            if root is False:
+                return {v: assignment.get(v, False) for v in variables}
+
+            free = [v for v in variables if v not in assignment]
+            if len(free) <= self.scan_variables:
+                full = (1 << (1 << len(free))) - 1
+                false = full ^ scan_index(self.index, assignment, free)
+                if not false:
+                    continue
+
+                # The first falsifying row, the values of the free variables are its binary digits
+                row = (false & -false).bit_length() - 1
+                for i, variable in enumerate(free):
+                    assignment[variable] = bool((row >> (len(free) - 1 - i)) & 1)
+
+                return {v: assignment[v] for v in variables}
+
+            # Branch on the first unassigned variable, trying False first (like the order of the rows)
+            variable = free[0]
+            stack.append(assignment | {variable: True})
+            stack.append(assignment | {variable: False})
+
+        return None
+
+    def _propagate(self, assignment: dict[str, bool]) -> bool | None:
+        """
+        Extend the assignment with the values forced by the root being False, and return the value of the root
+        (True also when the forced values contradict each other).
+        """
+        nodes, children = self.index.nodes, self.index.children
+
+        while True:
+            self.steps += 1
+            values = evaluate_index(self.index, assignment)
+            if values[self.index.root] is not None:
+                return values[self.index.root]
+
+            # Parents come after their children in the index, so walking it backwards visits them first
+            required: dict[int, bool] = {self.index.root: False}
+            forced = False
+            for position in range(len(nodes) - 1, -1, -1):
+                value = required.get(position)
+                if value is None:
+                    continue
+
+                if values[position] is not None:
+                    if values[position] != value:
+                        return True
+                    continue
+
+                node = nodes[position]
+                if node.token.type == TokenType.VARIABLE:
+                    assignment[node.token.value] = value
+                    forced = True
+                    continue
+
+                left, right = children[position]
+                for child, child_value in zip(
+                    (left, right),
+                    required_children(
+                        node.token.type,
+                        value,
+                        values[left] if left != -1 else None,
+                        values[right] if right != -1 else None,
+                    ),
+                ):
+                    if child == -1 or child_value is None:
+                        continue
+
+                    # A shared sub-expression can't be forced to both values
+                    if required.setdefault(child, child_value) != child_value:
+                        return True
+
+            if not forced:
+                return None
+
+
+class PrunedEnumeration:
+    """
+    Enumerates the rows of the truth table of the root expression depth-first, in the order of the rows,
+    fixing one variable at a time. As soon as the root is decided by the variables fixed so far, the whole subtree
+    of rows is emitted as a single compressed row, in which the remaining variables are don't-cares (None).
+    """
+
+    def __init__(self, index: ExpressionIndex):
+        self.index = index
+
+        # Nodes of the enumeration tree visited, i.e. partial assignments evaluated
+        self.steps = 0
+
+    def __iter__(self) -> Iterator[tuple[list[bool | None], bool]]:
+        """Yield the values of the variables (None for don't-cares) and the value of the root"""
+        variables = self.index.variables
+
+        stack: list[dict[str, bool]] = [{}]
+        while stack:
+            assignment = stack.pop()
+            self.steps += 1
+
+            root = evaluate_index(self.index, assignment)[self.index.root]
+            if root is not None:
+                yield [assignment.get(v) for v in variables], root
+                continue
+
+            # The root is undecided, so there is at least one variable left, fixed in the order of the variables
+            variable = variables[len(assignment)]
+            stack.append(assignment | {variable: True})
+            stack.append(assignment | {variable: False})
+
+
+class ModelCount:
+    """
+    Counts the rows in which the root expression is True, fixing one variable at a time like the pruned enumeration,
+    so a subtree of rows decided by the variables fixed so far is counted at once (2 ** remaining variables rows).
+    Once at most `scan_variables` variables are left, the remaining rows are evaluated at once as packed columns
+    (see `scan_index`), and their true bits are counted.
+    """
+
+    def __init__(self, index: ExpressionIndex, scan_variables: int = SCAN_VARIABLES):
+        self.index = index
+        self.scan_variables = scan_variables
+
+        # Nodes of the enumeration tree visited, i.e. partial assignments evaluated
+        self.steps = 0
+
+    def run(self) -> int:
+        variables = self.index.variables
+
+        count = 0
+        stack: list[dict[str, bool]] = [{}]
+        while stack:
+            assignment = stack.pop()
+            self.steps += 1
+
+            free = variables[len(assignment) :]
+            if len(free) <= self.scan_variables:
+                count += scan_index(self.index, assignment, free).bit_count()
+                continue
+
+            root = evaluate_index(self.index, assignment)[self.index.root]
+            if root is not None:
+                if root:
+                    count += 1 << len(free)
+                continue
+
+            variable = free[0]
+            stack.append(assignment | {variable: True})
+            stack.append(assignment | {variable: False})
+
+        return count
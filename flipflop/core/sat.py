@@ -0,0 +1,383 @@
+import heapq
+
+from .index import ExpressionIndex
+from .interpreter import Interpreter
+from .node import Node
+from .token import TokenType
+
+# Clauses defining a gate literal `g` from the literals of its operands `a` and `b` (g <-> a OP b)
+# NOT doesn't need a gate, it's the negated literal of its operand
+GATE_CLAUSES = {
+    TokenType.AND: lambda g, a, b: [[-g, a], [-g, b], [g, -a, -b]],
+    TokenType.OR: lambda g, a, b: [[g, -a], [g, -b], [-g, a, b]],
+    TokenType.NAND: lambda g, a, b: [[g, a], [g, b], [-g, -a, -b]],
+    TokenType.NOR: lambda g, a, b: [[-g, -a], [-g, -b], [g, a, b]],
+    TokenType.XOR: lambda g, a, b: [[-g, a, b], [-g, -a, -b], [g, -a, b], [g, a, -b]],
+    TokenType.IF: lambda g, a, b: [[g, a], [g, -b], [-g, -a, b]],
+    TokenType.EQ: lambda g, a, b: [[g, a, b], [g, -a, -b], [-g, -a, b], [-g, a, -b]],
+}
+
+RESTART_INTERVAL = 100
+VARIABLE_DECAY = 0.95
+
+
+### SAT
+# Satisfiability of the Syntax Tree without enumerating the rows
+# The tree is encoded into clauses in conjunctive normal form (Tseitin transformation), with one gate variable
+# for each distinct sub-expression, and the clauses are solved by a conflict-driven clause learning solver.
+# Literals follow the DIMACS convention, variable `n` is the literal `n`, and its negation is `-n`.
+class Tseitin:
+    """Encodes expressions into clauses, the variables of the language are numbered first (in sorted order)"""
+
+    def __init__(self, variables: list[str] | None = None):
+        self.clauses: list[list[int]] = []
+        self.literals: dict[str, int] = {}
+        self.count = 0
+
+        for name in variables or []:
+            self.variable(name)
+
+    def variable(self, name: str) -> int:
+        if name not in self.literals:
+            self.literals[name] = self.fresh()
+
+        return self.literals[name]
+
+    def fresh(self) -> int:
+        self.count += 1
+        return self.count
+
+    def encode(self, root_node: Node) -> int:
+        """Add the clauses of the expression, and return the literal which is True exactly when the expression is"""
+        index = ExpressionIndex(root_node)
+        for name in index.variables:
+            self.variable(name)
+
+        # The index is in post-order, so the literals of the children are always known before their parents
+        literals: list[int] = []
+        for node, (left, right) in zip(index.nodes, index.children):
+            token_type = node.token.type
+            if token_type == TokenType.VARIABLE:
+                literals.append(self.literals[node.token.value])
+                continue
+
+            if token_type == TokenType.NOT:
+                literals.append(-literals[left])
+                continue
+
+            if token_type not in GATE_CLAUSES:
+                raise ValueError(f"Unsupported operator {token_type}")
+
+            gate = self.fresh()
+            self.clauses.extend(
+                GATE_CLAUSES[token_type](gate, literals[left], literals[right])
+            )
+            literals.append(gate)
+
+        return literals[index.root]
+
+
+def luby(i: int) -> int:
+    """The i-th element (from 0) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..., scaling the restart intervals"""
+    size, power = 1, 1
+    while size < i + 1:
+        size = 2 * size + 1
+        power *= 2
+
+    while size - 1 != i:
+        size = (size - 1) // 2
+        power //= 2
+        i %= size
+
+    return power
+
+
+class Solver:
+    """
+    Conflict-driven clause learning SAT solver.
+    Clauses are watched by two of their literals (the first two), so a clause is only visited when one of them
+    becomes False. Conflicts are analyzed up to the first unique implication point, the learnt clause is added
+    and the search jumps back to the second highest level in it. Decisions follow the variable activity (VSIDS),
+    bumped for every variable taking part in a conflict, with the saved phase of the variable.
+    The search restarts after a number of conflicts following the Luby sequence, keeping the learnt clauses.
+    """
+
+    def __init__(self, count: int = 0, clauses: list[list[int]] | None = None):
+        self.count = 0
+        self.clauses: list[list[int]] = []
+        self.watches: dict[int, list[int]] = {}
+
+        # Value (1 True, -1 False, 0 unassigned), decision level and reason clause of each variable, index 0 unused
+        self.values = [0]
+        self.levels = [0]
+        self.reasons: list[int | None] = [None]
+        self.phases = [False]
+        self.activity = [0.0]
+        self.increment = 1.0
+
+        # Assigned literals in order, with the position where each decision level starts
+        self.trail: list[int] = []
+        self.trail_limits: list[int] = []
+        self.propagated = 0
+
+        self.heap: list[tuple[float, int]] = []
+        self.conflicts = 0
+        self.unsatisfiable = False
+
+        self.add_variables(count)
+        for clause in clauses or []:
+            self.add_clause(clause)
+
+    def add_variables(self, count: int):
+        for variable in range(self.count + 1, count + 1):
+            self.values.append(0)
+            self.levels.append(0)
+            self.reasons.append(None)
+            self.phases.append(False)
+            self.activity.append(0.0)
+            self.watches[variable] = []
+            self.watches[-variable] = []
+            heapq.heappush(self.heap, (0.0, variable))
+
+        self.count = max(self.count, count)
+
+    def value(self, literal: int) -> int:
+        value = self.values[abs(literal)]
+        return value if literal > 0 else -value
+
+    def add_clause(self, literals: list[int]):
+        """Add a clause (before solving, or between two calls to `solve()`)"""
+        self._backtrack(0)
+        self.add_variables(max((abs(literal) for literal in literals), default=0))
+
+        clause = []
+        for literal in dict.fromkeys(literals):
+            # A clause with complementary literals is always satisfied
+            if -literal in clause:
+                return
+
+            # Literals False at level 0 are always False, and a literal True at level 0 satisfies the clause
+            value = self.value(literal)
+            if value > 0:
+                return
+            if value == 0:
+                clause.append(literal)
+
+        if not clause:
+            self.unsatisfiable = True
+        elif len(clause) == 1:
+            self._assign(clause[0], None)
+            if self._propagate() is not None:
+                self.unsatisfiable = True
+        else:
+            self._attach(clause)
+
+    def _attach(self, clause: list[int]) -> int:
+        self.clauses.append(clause)
+        position = len(self.clauses) - 1
+        self.watches[clause[0]].append(position)
+        self.watches[clause[1]].append(position)
+        return position
+
+    def _assign(self, literal: int, reason: int | None):
+        variable = abs(literal)
+        self.values[variable] = 1 if literal > 0 else -1
+        self.levels[variable] = len(self.trail_limits)
+        self.reasons[variable] = reason
+        self.trail.append(literal)
+
+    def _propagate(self) -> int | None:
+        """Assign the literals implied by the clauses which became unit, and return a conflicting clause if any"""
+        clauses, watches, values = self.clauses, self.watches, self.values
+
+        while self.propagated < len(self.trail):
+            false_literal = -self.trail[self.propagated]
+            self.propagated += 1
+
+            watchers = watches[false_literal]
+            kept = []
+            for i, position in enumerate(watchers):
+                clause = clauses[position]
+
+                # Keep the literal which became False in the second slot
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+
+                first = clause[0]
+                first_value = values[first] if first > 0 else -values[-first]
+                if first_value > 0:
+                    kept.append(position)
+                    continue
+
+                # Look for another literal which is not False to watch instead
+                for k in range(2, len(clause)):
+                    literal = clause[k]
+                    if (values[literal] if literal > 0 else -values[-literal]) >= 0:
+                        clause[1], clause[k] = literal, false_literal
+                        watches[literal].append(position)
+                        break
+                else:
+                    kept.append(position)
+                    if first_value < 0:
+                        kept.extend(watchers[i + 1 :])
+                        watches[false_literal] = kept
+                        return position
+
+                    self._assign(first, position)
+
+            watches[false_literal] = kept
+
+        return None
+
+    def _analyze(self, conflict: int) -> tuple[list[int], int]:
+        """Learn a clause from the conflict (first unique implication point), and the level to jump back to"""
+        level = len(self.trail_limits)
+        learnt = [0]
+        seen = set()
+        pending = 0
+        literal = 0
+        position = len(self.trail) - 1
+        clause = self.clauses[conflict]
+
+        while True:
+            # The first literal of a reason clause is the one it implied
+            for other in clause if literal == 0 else clause[1:]:
+                variable = abs(other)
+                if variable in seen or self.levels[variable] == 0:
+                    continue
+
+                seen.add(variable)
+                self._bump(variable)
+                if self.levels[variable] == level:
+                    pending += 1
+                else:
+                    learnt.append(other)
+
+            # Walk back the trail to the next literal of the current level taking part in the conflict
+            while abs(self.trail[position]) not in seen:
+                position -= 1
+
+            literal = self.trail[position]
+            position -= 1
+            pending -= 1
+            if pending == 0:
+                break
+
+            clause = self.clauses[self.reasons[abs(literal)]]
+
+        learnt[0] = -literal
+        if len(learnt) == 1:
+            return learnt, 0
+
+        # Watch the literal of the highest level (after the asserting one), it's the first to become unassigned
+        highest = max(range(1, len(learnt)), key=lambda i: self.levels[abs(learnt[i])])
+        learnt[1], learnt[highest] = learnt[highest], learnt[1]
+        return learnt, self.levels[abs(learnt[1])]
+
+    def _bump(self, variable: int):
+        self.activity[variable] += self.increment
+        if self.activity[variable] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.increment *= 1e-100
+            self.heap = [
+                (-self.activity[v], v)
+                for v in range(1, self.count + 1)
+                if self.values[v] == 0
+            ]
+            heapq.heapify(self.heap)
+        elif self.values[variable] == 0:
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+    def _backtrack(self, level: int):
+        if len(self.trail_limits) <= level:
+            return
+
+        limit = self.trail_limits[level]
+        for literal in self.trail[limit:]:
+            variable = abs(literal)
+            self.values[variable] = 0
+            self.reasons[variable] = None
+            self.phases[variable] = literal > 0
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+        del self.trail[limit:]
+        del self.trail_limits[level:]
+        self.propagated = limit
+
+    def _decide(self) -> int | None:
+        """Most active unassigned variable (the heap may contain outdated entries, which are skipped)"""
+        while self.heap:
+            activity, variable = heapq.heappop(self.heap)
+            if self.values[variable] == 0 and -activity == self.activity[variable]:
+                return variable if self.phases[variable] else -variable
+
+        return None
+
+    def solve(self) -> bool:
+        if self.unsatisfiable:
+            return False
+
+        restarts = 0
+        limit = RESTART_INTERVAL * luby(restarts)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.trail_limits:
+                    self.unsatisfiable = True
+                    return False
+
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                self._assign(
+                    learnt[0], self._attach(learnt) if len(learnt) > 1 else None
+                )
+                self.increment /= VARIABLE_DECAY
+
+                limit -= 1
+                if limit == 0:
+                    restarts += 1
+                    limit = RESTART_INTERVAL * luby(restarts)
+                    self._backtrack(0)
+
+                continue
+
+            literal = self._decide()
+            if literal is None:
+                return True
+
+            self.trail_limits.append(len(self.trail))
+            self._assign(literal, None)
+
+    def model(self) -> dict[int, bool]:
+        """Values of the variables after a satisfiable `solve()` (unassigned variables are False)"""
+        return {
+            variable: self.values[variable] > 0 for variable in range(1, self.count + 1)
+        }
+
+
+def counterexample(root_node: Node) -> dict[str, bool] | None:
+    """
+    Check if the expression is a tautology, by checking that its negation is not satisfiable.
+    Returns None for a tautology, and otherwise an assignment of the variables for which the expression is False.
+    """
+    encoder = Tseitin(ExpressionIndex(root_node).variables)
+    root = encoder.encode(root_node)
+
+    solver = Solver(encoder.count, encoder.clauses)
+    solver.add_clause([-root])
+    if not solver.solve():
+        return None
+
+    model = solver.model()
+    return {name: model[literal] for name, literal in encoder.literals.items()}
+
+
+class SatInterpreter(Interpreter):
+    """
+    Interpreter producing the same truth table as the default one (the rows are still enumerated),
+    but finding a counterexample with the SAT solver, without enumerating them.
+    """
+
+    def counterexample(self) -> dict[str, bool] | None:
+        return counterexample(self.root_node)
@@ -0,0 +1,150 @@
+import re
+
+from .lexer import Lexer
+from .reader import Reader
+from .token import Token, TokenType
+
+# Syntax sugar operators, in the same priority order in which the Reader replaces them
+_keywords = "|".join(Reader.syntax_sugar_translations)
+
+# Characters which the Reader translates to their unicode equivalents
+_ambiguous_characters = {
+    chr(k): chr(v) for k, v in Reader.ambiguous_characters_translations.items()
+}
+
+_pattern = re.compile(
+    # Whitespace is skipped, and so is any other whitespace following it
+    r"[ \t\n\r\x0b\x0c]\s*"
+    # Operator keywords are recognized anywhere, even inside longer words (like the Reader replaces them),
+    # variables are runs of letters ('v' is an ambiguous character) ending right before the next keyword,
+    # and every other character is a word of its own (operators and parentheses)
+    rf"|({_keywords}|(?:(?!{_keywords})[a-uw-z])+|.)",
+    re.DOTALL,
+)
+
+# Operator symbols, which are surrounded by spaces so that splitting the code on whitespace separates them
+_symbols = [*Lexer.word_types, *_ambiguous_characters]
+
+# Whitespace which doesn't separate words (only ascii whitespace does)
+_other_whitespace = re.compile(r"[^\S \t\n\r\x0b\x0c]")
+
+# Words of the operators as they're passed to the Lexer's checks (translated like the Reader does)
+_canonical_words = {**Reader.syntax_sugar_translations, **_ambiguous_characters}
+
+# Shared tokens of the operator keywords, symbols and ambiguous characters
+_word_tokens = {
+    word: Token.operator(token_type) for word, token_type in Lexer.word_types.items()
+}
+_word_tokens.update(
+    {
+        keyword: _word_tokens[symbol]
+        for keyword, symbol in Reader.syntax_sugar_translations.items()
+    }
+)
+_word_tokens.update(
+    {
+        character: _word_tokens[symbol]
+        for character, symbol in _ambiguous_characters.items()
+    }
+)
+
+# One character for the kind of every token: (V)ariable, (N)ot, (B)inary operator, (L)eft and (R)ight parenthesis
+_kinds = {
+    TokenType.VARIABLE: "V",
+    TokenType.NOT: "N",
+    TokenType.L_PAR: "L",
+    TokenType.R_PAR: "R",
+}
+
+# Placements rejected by the Lexer's checks: a binary operator or closing parenthesis where an operand is expected,
+# and a variable or unary operator right after an operand (an opening parenthesis can be placed anywhere)
+_invalid_placement = re.compile(r"^[BR]|[NBL][BR]|[VR][VN]")
+
+
+### Scanner
+# Tokenizes the code in a single pass, replacing the Reader + Wordifier + Lexer pipeline
+# It produces the same words as the Wordifier (with the same translations as the Reader),
+# and validates the placement of all of them at once, with the same rules as the Lexer
+class Scanner(Lexer):
+    def __init__(self, code: str):
+        super().__init__([])
+        self.code = code.strip().lower()
+
+        # Whether the next token has to be an operand (variable, unary operator or opening parenthesis),
+        # which is equivalent to the Lexer's checks on the type of the previous token
+        self.operand_position = True
+
+    def add_token(self, word: str):
+        token_type = self.word_types.get(word, TokenType.VARIABLE)
+
+        # The Lexer's checks are only called to raise the same exceptions, when the position is invalid
+        if token_type is TokenType.VARIABLE:
+            if not self.operand_position:
+                self.expect_variable_position(word)
+
+            self.tokens.append(Token(TokenType.VARIABLE, value=word))
+            self.operand_position = False
+            return
+
+        if token_type is TokenType.R_PAR:
+            if self.operand_position:
+                self.expect_closing_parenthesis(word)
+
+            self.operand_position = False
+
+        elif token_type is TokenType.NOT:
+            if not self.operand_position:
+                self.expect_unary_position(word)
+
+        elif token_type is not TokenType.L_PAR:
+            if self.operand_position:
+                self.expect_binary_position(word)
+
+            self.operand_position = True
+
+        # Opening parenthesis can be placed anywhere, and it's followed by an operand
+        else:
+            self.operand_position = True
+
+        self.tokens.append(Token.operator(token_type))
+
+    def tokenize(self):
+        words = self.words = self._split_words()
+
+        tokens = dict(_word_tokens)
+        for word in set(words).difference(tokens):
+            tokens[word] = Token(TokenType.VARIABLE, value=word)
+
+        # The placement of every token only depends on the previous one, so all of them are checked at once
+        kinds = {word: _kinds.get(token.type, "B") for word, token in tokens.items()}
+        invalid = _invalid_placement.search("".join(map(kinds.__getitem__, words)))
+        if invalid is not None:
+            # Add the words one by one up to the invalid one, to raise the same exception as the Lexer
+            for word in words[: invalid.end()]:
+                self.add_token(_canonical_words.get(word, word))
+
+        self.tokens = list(map(tokens.__getitem__, words))
+        return self.tokens
+
+    def _split_words(self) -> list[str]:
+        """
+        Split the code into the same words as the Wordifier. The code is split on whitespace and around the operator
+        symbols, then every distinct word is matched by the regex once, to separate the keywords inside it.
+        """
+        if _other_whitespace.search(self.code) is not None:
+            return list(filter(None, _pattern.findall(self.code)))
+
+        # Replacing every symbol is much faster than a single `str.translate` (which is slow for non-ascii text)
+        code = self.code
+        for symbol in _symbols:
+            if symbol in code:
+                code = code.replace(symbol, f" {symbol} ")
+
+        words = code.split()
+        parts = {word: _pattern.findall(word) for word in set(words)}
+
+        # Most words are a single variable, keyword or symbol
+        if all(len(part) == 1 for part in parts.values()):
+            return words
+
+        return [part for word in words for part in parts[word]]
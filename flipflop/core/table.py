@@ -0,0 +1,107 @@
+from collections.abc import Iterator
+
+
+### Table
+# Truth table storing every column as a packed bitset, one bit per row (bit i of the bytes = row i)
+# Rows and python booleans are only built when they're accessed, so a table takes rows / 8 bytes per column
+class TruthTable:
+    def __init__(
+        self,
+        header: list[str],
+        columns: list[bytes | bytearray],
+        rows: int,
+        root: int = -1,
+    ):
+        if len(header) != len(columns):
+            raise ValueError("Expected one column for each header")
+
+        if any(len(column) != (rows + 7) // 8 for column in columns):
+            raise ValueError(
+                f"Expected columns of {(rows + 7) // 8} bytes for {rows} rows"
+            )
+
+        self.header = header
+        self.columns = columns
+        self.size = rows
+
+        # Column of the final expression
+        self.root = root % len(columns) if columns else -1
+
+    @classmethod
+    def from_rows(
+        cls, header: list[str], rows, count: int, root: int = -1
+    ) -> "TruthTable":
+        """Pack an iterable of `count` rows (lists of booleans in the order of the header)"""
+        columns = [bytearray((count + 7) // 8) for _ in header]
+        for i, row in enumerate(rows):
+            byte, bit = i >> 3, 1 << (i & 7)
+            for column, value in zip(columns, row):
+                if value:
+                    column[byte] |= bit
+
+        return cls(header, columns, count, root)
+
+    @classmethod
+    def from_integers(
+        cls, header: list[str], columns: list[int], rows: int, root: int = -1
+    ) -> "TruthTable":
+        """Build a table from columns packed as integers (bit i = row i), like the bitwise engine's"""
+        return cls(
+            header,
+            [column.to_bytes((rows + 7) // 8, "little") for column in columns],
+            rows,
+            root,
+        )
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, row: int) -> list[bool]:
+        if row < 0:
+            row += self.size
+
+        if not 0 <= row < self.size:
+            raise IndexError(
+                f"Row {row} is out of range for a table of {self.size} rows"
+            )
+
+        byte, shift = row >> 3, row & 7
+        return [bool((column[byte] >> shift) & 1) for column in self.columns]
+
+    def __iter__(self) -> Iterator[list[bool]]:
+        return self.rows()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the packed columns"""
+        return sum(len(column) for column in self.columns)
+
+    @property
+    def is_tautology(self) -> bool:
+        return self.count() == self.size
+
+    def rows(self) -> Iterator[list[bool]]:
+        """Yield the rows one at a time"""
+        for row in range(self.size):
+            yield self[row]
+
+    def column(self, name: str) -> list[bool]:
+        """Values of the column with the given header in every row"""
+        if name not in self.header:
+            raise KeyError(f"Unknown column '{name}'")
+
+        column = self.columns[self.header.index(name)]
+        return [bool((column[row >> 3] >> (row & 7)) & 1) for row in range(self.size)]
+
+    def count(self, name: str | None = None) -> int:
+        """Number of rows in which the column (the final expression by default) is True"""
+        column = self.columns[self.root if name is None else self.header.index(name)]
+        return int.from_bytes(column, "little").bit_count()
+
+    def to_dict(self) -> dict:
+        """The truth table in the same shape as returned by `Interpreter.evaluate`"""
+        return {
+            "header": list(self.header),
+            "values": list(self.rows()),
+            "is_tautology": self.is_tautology,
+        }
@@ -23,10 +23,20 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ("type", "value")
+
     def __init__(self, type: TokenType, value: str | None = None):
         self.type = type
         self.value = value
 
+    @classmethod
+    def operator(cls, type: TokenType) -> "Token":
+        """
+        Return the shared token of an operator (or parenthesis), which carry no value.
+        Note: The shared tokens must not be modified.
+        """
+        return _operator_tokens[type]
+
     def __eq__(self, other):
         if not isinstance(other, Token):
             return NotImplemented
@@ -56,3 +66,11 @@ class Token:
 
     def as_json(self):
         return json.dumps(self.to_json_serializable(), indent=4)
+
+
+# Tokens without a value are interned, so that every operator in a tree shares the same token object
+_operator_tokens = {
+    token_type: Token(token_type)
+    for token_type in TokenType
+    if token_type != TokenType.VARIABLE
+}
@@ -0,0 +1,21 @@
+import unittest
+
+from flipflop.core.analysis import essential_variables
+from tests.util import parse
+
+
+class AnalysisTestCase(unittest.TestCase):
+    def test_essential_variables(self):
+        test_cases = [
+            ("p", ["p"]),
+            ("(x or not x) and p", ["p"]),
+            ("p xor q xor q", ["p"]),
+            ("(p and q) or (p and not q)", ["p"]),
+            ("p or not p", []),
+            ("(p if q) eq (not q if not p)", []),
+            ("(p and q) or r", ["p", "q", "r"]),
+        ]
+
+        for code, expected in test_cases:
+            with self.subTest(code=code):
+                self.assertEqual(expected, essential_variables(parse(code)))
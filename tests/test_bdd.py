@@ -0,0 +1,174 @@
+import itertools
+import unittest
+
+from flipflop import flipflop
+from flipflop.core import BDD, BddInterpreter, Interpreter, TokenType
+from flipflop.core.bdd import FALSE, TRUE
+from tests.util import parse
+
+EXPRESSIONS = [
+    "p",
+    "not p",
+    "p and not p",
+    "p or not p",
+    "p nand q",
+    "p nor q",
+    "p xor q xor r",
+    "(p if q) eq (not q if not p)",
+    "(p and q) or (not p and r) or (q and r)",
+    "not (p or q) eq (not p and not q)",
+    "(p if q) and (q if r) if (p if r)",
+]
+
+
+def variable_names(count: int) -> list[str]:
+    # Letters which can't form any operator keyword (or the 'v' operator) when combined
+    letters = "bcghjklmpsuwyz"
+    return ["".join(name) for name in itertools.product(letters, repeat=3)][:count]
+
+
+class BDDTestCase(unittest.TestCase):
+    def test_terminals_and_variables(self):
+        bdd = BDD(["p", "q"])
+
+        self.assertTrue(bdd.is_tautology(TRUE))
+        self.assertFalse(bdd.is_satisfiable(FALSE))
+        self.assertEqual(2, bdd.count(bdd.variable("p")))
+        self.assertRaises(KeyError, bdd.variable, "r")
+
+    def test_nodes_are_unique(self):
+        bdd = BDD(["p", "q"])
+        p, q = bdd.variable("p"), bdd.variable("q")
+
+        self.assertEqual(bdd.apply(TokenType.AND, p, q), bdd.apply(TokenType.AND, q, p))
+        self.assertEqual(p, bdd.apply(TokenType.NOT, bdd.apply(TokenType.NOT, p)))
+
+    def test_operators_have_the_expected_number_of_models(self):
+        bdd = BDD(["p", "q"])
+        p, q = bdd.variable("p"), bdd.variable("q")
+        test_cases = [
+            (TokenType.NOT, 2),
+            (TokenType.AND, 1),
+            (TokenType.OR, 3),
+            (TokenType.NAND, 3),
+            (TokenType.NOR, 1),
+            (TokenType.XOR, 2),
+            (TokenType.IF, 3),
+            (TokenType.EQ, 2),
+        ]
+
+        for token_type, models in test_cases:
+            with self.subTest(token_type=token_type):
+                self.assertEqual(models, bdd.count(bdd.apply(token_type, p, q)))
+
+        self.assertRaises(ValueError, bdd.apply, TokenType.L_PAR, p, q)
+
+    def test_count_and_tautology_match_the_truth_table(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                table = flipflop(code, full=False)
+                interpreter = BddInterpreter(parse(code))
+
+                self.assertEqual(
+                    sum(row[-1] for row in table["values"]),
+                    interpreter.count_models(),
+                )
+                self.assertEqual(table["is_tautology"], interpreter._is_tautology())
+
+    def test_satisfy_one_returns_a_model(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                root = parse(code)
+                bdd = BDD()
+                node = bdd.from_node(root)
+                assignment = bdd.satisfy_one(node)
+
+                if node == FALSE:
+                    self.assertIsNone(assignment)
+                    continue
+
+                function = Interpreter(root).compiler.compile(root)
+                self.assertTrue(function.evaluate(assignment))
+
+    def test_equivalent_expressions_share_the_same_node(self):
+        interpreter = BddInterpreter(parse("not (p and q)"))
+
+        self.assertTrue(interpreter.is_equivalent(parse("not p or not q")))
+        self.assertFalse(interpreter.is_equivalent(parse("not p and not q")))
+
+    def test_hundreds_of_variables(self):
+        names = variable_names(400)
+        pairs = list(zip(names[::2], names[1::2]))
+
+        # The variables of each pair are next to each other in the order, so the diagram stays linear
+        code = " and ".join(f"({x} eq {y})" for x, y in pairs)
+        interpreter = BddInterpreter(parse(code))
+
+        self.assertTrue(interpreter.is_satisfiable())
+        self.assertFalse(interpreter._is_tautology())
+        self.assertEqual(1 << len(pairs), interpreter.count_models())
+
+        implication = parse(f"({' and '.join(names)}) if {names[-1]}")
+        self.assertTrue(BddInterpreter(implication)._is_tautology())
+
+    def test_garbage_collection_reclaims_unreferenced_nodes(self):
+        names = variable_names(60)
+        bdd = BDD(cache_size=16, gc_threshold=32)
+
+        node = bdd.from_node(parse(" xor ".join(names)))
+        self.assertEqual(1 << 59, bdd.count(node))
+
+        bdd.deref(node)
+        bdd.collect_garbage()
+        self.assertEqual(0, len(bdd))
+        self.assertRaises(ValueError, bdd.deref, node)
+
+        # Operators whose operands are the same (hash-consed) sub-expression
+        for code in ["(p and q) or (p and q)", "p xor p"]:
+            with self.subTest(code=code):
+                bdd.deref(bdd.from_node(parse(code)))
+                bdd.collect_garbage()
+                self.assertEqual(0, len(bdd))
+
+    def test_interpreters_release_their_root(self):
+        bdd = BDD()
+
+        with BddInterpreter(parse("p xor q xor r"), bdd) as interpreter:
+            self.assertEqual(4, interpreter.count_models())
+            bdd.collect_garbage()
+            self.assertEqual(5, len(bdd))
+
+        bdd.collect_garbage()
+        self.assertEqual(0, len(bdd))
+
+        # The root is only released once
+        interpreter.close()
+
+        # Interpreters which aren't closed release their root when they're garbage collected
+        interpreter = BddInterpreter(parse("p and q"), bdd)
+        bdd.collect_garbage()
+        self.assertEqual(2, len(bdd))
+
+        del interpreter
+        bdd.collect_garbage()
+        self.assertEqual(0, len(bdd))
+
+    def test_small_cache_and_threshold_give_the_same_results(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                root = parse(code)
+                small = BDD(cache_size=1, gc_threshold=1)
+                large = BDD()
+
+                self.assertEqual(
+                    large.count(large.from_node(root)),
+                    small.count(small.from_node(root)),
+                )
+
+    def test_bdd_engine_produces_the_same_table(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                self.assertEqual(flipflop(code), flipflop(code, engine="bdd"))
+
+    def test_invalid_cache_size(self):
+        self.assertRaises(ValueError, BDD, cache_size=3)
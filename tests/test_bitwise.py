@@ -0,0 +1,65 @@
+import unittest
+
+from flipflop import flipflop
+from flipflop.core import (
+    BitwiseInterpreter,
+    Interpreter,
+    TokenType,
+)
+from flipflop.core.packed import apply_operator, unpack_column, variable_mask
+from tests.util import parse
+
+
+class BitwiseTestCase(unittest.TestCase):
+    def test_variable_masks_follow_truth_table_order(self):
+        # Three variables: p flips every 4 rows, q every 2 rows, r every row
+        self.assertEqual(0b11110000, variable_mask(2, 8))
+        self.assertEqual(0b11001100, variable_mask(1, 8))
+        self.assertEqual(0b10101010, variable_mask(0, 8))
+
+    def test_unpack_column_returns_bit_for_each_row(self):
+        self.assertEqual([False, True, False, False], unpack_column(0b0010, 4))
+
+    def test_operators_are_applied_to_whole_columns(self):
+        p, q, full = 0b1100, 0b1010, 0b1111
+        test_cases = [
+            (TokenType.NOT, 0b0011),
+            (TokenType.AND, 0b1000),
+            (TokenType.OR, 0b1110),
+            (TokenType.NAND, 0b0111),
+            (TokenType.NOR, 0b0001),
+            (TokenType.XOR, 0b0110),
+            (TokenType.IF, 0b1011),
+            (TokenType.EQ, 0b1001),
+        ]
+
+        for token_type, expected in test_cases:
+            with self.subTest(token_type=token_type):
+                self.assertEqual(expected, apply_operator(token_type, p, q, full))
+
+    def test_produces_the_same_truth_table_as_row_interpreter(self):
+        expressions = [
+            "p or q",
+            "not (p xor (q nand (not p)))",
+            "(p if (q if p))",
+            "(p and q) or (r and not (p or q))",
+            "p nor q eq r and s",
+            "a",
+        ]
+
+        for expression in expressions:
+            for full in (True, False):
+                with self.subTest(expression=expression, full=full):
+                    ast = parse(expression)
+                    self.assertDictEqual(
+                        Interpreter(ast).evaluate(full=full),
+                        BitwiseInterpreter(ast).evaluate(full=full),
+                    )
+
+    def test_engine_can_be_selected_from_entrypoint(self):
+        result = flipflop("p or not p", engine="bitwise")
+        self.assertTrue(result["is_tautology"])
+
+    def test_entrypoint_rejects_unknown_engines(self):
+        with self.assertRaises(ValueError):
+            flipflop("p", engine="unknown")
@@ -0,0 +1,132 @@
+import itertools
+import json
+import os
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from flipflop import count_models, run_job
+from flipflop.__main__ import main
+from flipflop.core import CheckpointedJob
+from flipflop.core.chunked import IntegerBackend
+from tests.util import parse
+
+# 2 ** 12 rows, the first counterexample is in the middle of the table
+NAMES = ["".join(name) for name in itertools.product("bcghjklm", repeat=2)][:12]
+CODE = f"({' xor '.join(NAMES[:6])}) or not {NAMES[0]} or {NAMES[7]} or ({' and '.join(NAMES[6:])})"
+
+
+class CheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "job.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _job(self, code: str = CODE, **options):
+        ast = parse(code)
+        return CheckpointedJob(
+            ast, self.path, chunk_rows=64, backend=IntegerBackend(), **options
+        )
+
+    def _interrupt_after(self, job: CheckpointedJob, count: int):
+        chunks = job.interpreter.chunks
+
+        def interrupted(*args, **kwargs):
+            for i, chunk in enumerate(chunks(*args, **kwargs)):
+                if i == count:
+                    raise KeyboardInterrupt
+
+                yield chunk
+
+        job.interpreter.chunks = interrupted
+
+    def test_counts_the_rows_and_finds_the_first_counterexample(self):
+        result = self._job().run()
+
+        self.assertEqual(1 << 12, result["rows"])
+        self.assertEqual(count_models(CODE), result["count"])
+        self.assertFalse(result["is_tautology"])
+
+        # The first falsifying row sets the first variable, and an odd number of the next five
+        expected = dict.fromkeys(NAMES, False)
+        expected.update({NAMES[0]: True, NAMES[5]: True})
+        self.assertEqual(expected, result["counterexample"])
+
+    def test_interrupted_job_resumes_with_the_same_result(self):
+        expected = self._job().run()
+        os.remove(self.path)
+
+        job = self._job()
+        self._interrupt_after(job, 10)
+        with self.assertRaises(KeyboardInterrupt):
+            job.run()
+
+        # The checkpoint is written when the job is interrupted
+        with open(self.path) as file:
+            state = json.load(file)
+        self.assertEqual(64, state["chunks"])
+        self.assertIsNone(state["counterexample_row"])
+
+        job = self._job()
+        self._interrupt_after(job, 30)
+        with self.assertRaises(KeyboardInterrupt):
+            job.run(resume=True)
+        self.assertEqual(40, job.completed)
+
+        job = self._job()
+        self.assertEqual(expected, job.run(resume=True))
+        self.assertEqual(64, job.completed)
+
+    def test_checkpoints_are_written_periodically(self):
+        job = self._job(interval=0)
+        self._interrupt_after(job, 5)
+
+        saved = []
+        save = job.save
+
+        def record():
+            save()
+            saved.append(job.completed)
+
+        job.save = record
+        with self.assertRaises(KeyboardInterrupt):
+            job.run()
+
+        # After every chunk, and once more when interrupted
+        self.assertEqual([1, 2, 3, 4, 5, 5], saved)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_existing_checkpoints_are_not_overwritten(self):
+        self._job().run()
+        self.assertRaises(FileExistsError, self._job().run)
+
+    def test_checkpoints_of_other_jobs_are_rejected(self):
+        self._job().run()
+        self.assertRaises(ValueError, self._job("p or q").run, resume=True)
+
+    def test_tautology(self):
+        result = run_job("p or not p", self.path)
+        self.assertEqual(
+            {"rows": 2, "count": 2, "is_tautology": True, "counterexample": None},
+            result,
+        )
+
+    def test_job_options(self):
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["-i", "p if q", "--job", self.path])
+        self.assertIn("Satisfying assignments: 3 of 4", result.output)
+        self.assertIn("Counterexample: p=True, q=False", result.output)
+
+        result = runner.invoke(main, ["-i", "p if q", "--job", self.path, "--resume"])
+        self.assertIn("Satisfying assignments: 3 of 4", result.output)
+
+        result = runner.invoke(main, ["-i", "p if q", "--resume"])
+        self.assertNotEqual(0, result.exit_code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from flipflop import flipflop
+from flipflop.core import (
+    ChunkedInterpreter,
+    Interpreter,
+)
+from flipflop.core.chunked import IntegerBackend, NumpyBackend, np
+from tests.util import parse
+
+
+class ChunkedTestCase(unittest.TestCase):
+    expressions = [
+        "p or q",
+        "not (p xor (q nand (not p)))",
+        "(p and q) or (r and not (p or q))",
+        "a and b and c and d and e and f and g and h",
+        "(a xor b xor c xor d xor e xor f xor g xor h) or (a eq b)",
+    ]
+
+    def _backends(self):
+        backends = [IntegerBackend()]
+        if np is not None:
+            backends.append(NumpyBackend())
+
+        return backends
+
+    def test_produces_the_same_truth_table_as_row_interpreter(self):
+        for backend in self._backends():
+            for expression in self.expressions:
+                with self.subTest(backend=backend.name, expression=expression):
+                    ast = parse(expression)
+                    self.assertDictEqual(
+                        Interpreter(ast).evaluate(),
+                        ChunkedInterpreter(
+                            ast, chunk_rows=64, backend=backend
+                        ).evaluate(),
+                    )
+
+    def test_counts_true_rows_across_chunks(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend.name):
+                ast = parse("a or b or c or d or e or f or g or h")
+                interpreter = ChunkedInterpreter(ast, chunk_rows=64, backend=backend)
+                self.assertEqual(255, interpreter.count_true())
+
+    def test_determines_tautology_across_chunks(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend.name):
+                ast = parse(
+                    "(a and b and c and d and e and f and g) or not a or h or not h"
+                )
+                interpreter = ChunkedInterpreter(ast, chunk_rows=64, backend=backend)
+                self.assertTrue(interpreter._is_tautology())
+
+    def test_stream_stops_when_consumer_returns_true(self):
+        ast = parse("a and b and c and d and e and f and g and h")
+        interpreter = ChunkedInterpreter(ast, chunk_rows=64)
+
+        seen = []
+        interpreter.stream(lambda chunk: seen.append(chunk.start) or True)
+        self.assertEqual([0], seen)
+
+    def test_selected_chunks_can_be_evaluated(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend.name):
+                ast = parse("not (a and b and c and d and e and f and g and h)")
+                interpreter = ChunkedInterpreter(ast, chunk_rows=64, backend=backend)
+                self.assertEqual(4, interpreter.chunk_count())
+
+                chunks = list(interpreter.chunks(numbers=[3, 1]))
+                self.assertEqual([192, 64], [chunk.start for chunk in chunks])
+                self.assertEqual([63, None], [chunk.first_false() for chunk in chunks])
+
+    def test_rejects_invalid_chunk_sizes(self):
+        for chunk_rows in (32, 100):
+            with self.subTest(chunk_rows=chunk_rows):
+                with self.assertRaises(ValueError):
+                    ChunkedInterpreter(parse("p"), chunk_rows=chunk_rows)
+
+    @unittest.skipIf(np is not None, "numpy is installed")
+    def test_numpy_backend_requires_numpy(self):
+        with self.assertRaises(ImportError):
+            NumpyBackend()
+
+    def test_engine_can_be_selected_from_entrypoint(self):
+        self.assertDictEqual(flipflop("p or q"), flipflop("p or q", engine="chunked"))
@@ -0,0 +1,80 @@
+import itertools
+import pickle
+import unittest
+
+from flipflop.core import (
+    CompiledExpression,
+    Compiler,
+    Evaluator,
+    Node,
+    Token,
+    TokenType,
+)
+from tests.util import parse
+
+
+class CompilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.compiler = Compiler()
+
+    def test_compiles_every_operator(self):
+        for token_type in TokenType:
+            if token_type in [TokenType.VARIABLE, TokenType.L_PAR, TokenType.R_PAR]:
+                continue
+
+            node = Node(
+                token=Token(token_type),
+                left=Node(Token(TokenType.VARIABLE, "p")),
+                right=(
+                    Node(Token(TokenType.VARIABLE, "q"))
+                    if token_type != TokenType.NOT
+                    else None
+                ),
+            )
+            compiled = self.compiler.compile(node, ["p", "q"])
+
+            for p, q in itertools.product([False, True], repeat=2):
+                with self.subTest(token_type=token_type, p=p, q=q):
+                    self.assertEqual(
+                        Evaluator().evaluate(node, {"p": p, "q": q}), compiled(p, q)
+                    )
+
+    def test_collects_variables_in_sorted_order_by_default(self):
+        compiled = self.compiler.compile(parse("q and not p"))
+        self.assertEqual(["p", "q"], compiled.variables)
+        self.assertTrue(compiled(False, True))
+        self.assertFalse(compiled(True, True))
+
+    def test_variable_order_can_be_chosen(self):
+        compiled = self.compiler.compile(parse("p if q"), ["q", "p"])
+        self.assertFalse(compiled(False, True))
+        self.assertTrue(compiled.evaluate({"p": False, "q": False}))
+
+    def test_repeated_sub_expressions_are_compiled_once(self):
+        compiled = self.compiler.compile(parse("(p and q) or (p and q)"))
+        self.assertEqual(1, compiled.source.count(" and "))
+
+    def test_compiles_deeply_nested_expressions(self):
+        # Nesting deeper than the 200 parentheses levels allowed by the python parser
+        code = " and ".join(["p", "q", "r", "s"] * 63)
+        node = parse(code)
+        compiled = self.compiler.compile(node)
+        self.assertTrue(compiled(*[True] * len(compiled.variables)))
+
+    def test_compiled_expressions_can_be_pickled(self):
+        compiled = self.compiler.compile(parse("p xor q"))
+        restored = pickle.loads(pickle.dumps(compiled))
+
+        self.assertIsInstance(restored, CompiledExpression)
+        self.assertEqual(compiled.variables, restored.variables)
+        self.assertTrue(restored(True, False))
+
+    def test_compiles_multiple_outputs_sharing_sub_expressions(self):
+        root = parse("(p and q) or not (p and q)")
+        conjunction = root.left
+        compiled = self.compiler.compile_many([conjunction, root])
+
+        self.assertEqual(1, compiled.source.count(" and "))
+        for p, q in itertools.product([False, True], repeat=2):
+            with self.subTest(p=p, q=q):
+                self.assertEqual((p and q, True), compiled(p, q))
@@ -0,0 +1,113 @@
+import itertools
+import unittest
+
+from click.testing import CliRunner
+
+from flipflop import equivalent, flipflop
+from flipflop.__main__ import main
+from flipflop.core import Compiler, EquivalenceChecker
+from tests.util import parse
+
+
+def variable_names(count: int) -> list[str]:
+    # Letters which can't form any operator keyword (or the 'v' operator) when combined
+    letters = "bcghjklmpsuwyz"
+    return ["".join(name) for name in itertools.product(letters, repeat=3)][:count]
+
+
+class EquivalenceTestCase(unittest.TestCase):
+    def _assert_distinguishes(self, left: str, right: str, assignment: dict):
+        compiler = Compiler()
+        self.assertNotEqual(
+            compiler.compile(parse(left)).evaluate(assignment),
+            compiler.compile(parse(right)).evaluate(assignment),
+        )
+
+    def test_structurally_equal_expressions(self):
+        test_cases = [
+            ("p and q", "q and p"),
+            ("not not p", "p"),
+            ("(p xor q) or (r eq s)", "(s eq r) or (q xor p)"),
+        ]
+
+        for left, right in test_cases:
+            with self.subTest(left=left, right=right):
+                self.assertEqual(
+                    {
+                        "equivalent": True,
+                        "method": "structural",
+                        "counterexample": None,
+                    },
+                    equivalent(left, right),
+                )
+
+    def test_equivalent_expressions_are_proven_by_sat(self):
+        test_cases = [
+            ("not (p and q)", "not p or not q"),
+            ("p if q", "not q if not p"),
+            ("p nand q", "not p or not q"),
+            ("p xor q", "not (p eq q)"),
+            ("p", "p and (p or q)"),
+        ]
+
+        for left, right in test_cases:
+            with self.subTest(left=left, right=right):
+                self.assertEqual(
+                    {"equivalent": True, "method": "sat", "counterexample": None},
+                    equivalent(left, right),
+                )
+
+    def test_different_expressions_have_a_distinguishing_assignment(self):
+        test_cases = [("p if q", "q if p"), ("p", "q"), ("p or q", "p xor q")]
+
+        for left, right in test_cases:
+            with self.subTest(left=left, right=right):
+                result = equivalent(left, right, seed=1)
+                self.assertFalse(result["equivalent"])
+                self._assert_distinguishes(left, right, result["counterexample"])
+
+    def test_rare_differences_are_found_by_sat(self):
+        names = variable_names(40)
+        left = " and ".join(names)
+        right = " and ".join(names[1:])
+
+        # The sides only differ in one of the 2 ** 40 assignments, which random simulation misses
+        result = EquivalenceChecker(parse(left), parse(right), seed=3).check()
+
+        self.assertEqual("sat", result["method"])
+        self.assertFalse(result["equivalent"])
+        self._assert_distinguishes(left, right, result["counterexample"])
+
+    def test_hundreds_of_variables(self):
+        names = variable_names(300)
+        left = " or ".join(f"({x} and {y})" for x, y in zip(names[::2], names[1::2]))
+        right = (
+            "not ("
+            + " and ".join(
+                f"(not {x} or not {y})" for x, y in zip(names[::2], names[1::2])
+            )
+            + ")"
+        )
+
+        self.assertTrue(equivalent(left, right)["equivalent"])
+
+    def test_equivalent_subcommand(self):
+        runner = CliRunner()
+
+        result = runner.invoke(
+            main, ["equivalent", "-a", "p if q", "-b", "not q if not p"]
+        )
+        self.assertIn("Expressions ARE equivalent", result.output)
+
+        result = runner.invoke(main, ["equivalent", "-a", "p if q", "-b", "q if p"])
+        self.assertIn("Expressions ARE NOT equivalent", result.output)
+        self.assertIn("Counterexample: ", result.output)
+
+    def test_inline_input_still_prints_the_table(self):
+        result = CliRunner().invoke(main, ["-i", "p or not p", "-s"])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("Expression IS a tautology", result.output)
+        self.assertTrue(flipflop("p or not p")["is_tautology"])
+
+        self.assertNotEqual(0, CliRunner().invoke(main, []).exit_code)
@@ -1,6 +1,15 @@
+import itertools
+import random
 import unittest
 
-from flipflop.core import Evaluator, Node, Token, TokenType
+from flipflop.core import (
+    Evaluator,
+    IncrementalEvaluator,
+    Node,
+    Token,
+    TokenType,
+)
+from tests.util import parse
 
 
 class EvaluatorTestCase(unittest.TestCase):
@@ -70,3 +79,87 @@ class EvaluatorTestCase(unittest.TestCase):
         self.assertFalse(
             result, "Evaluating None node did not return False as expected."
         )
+
+    def test_evaluates_deep_trees_without_recursion(self):
+        node = Node(Token(TokenType.VARIABLE, "p"))
+        for _ in range(100000):
+            node = Node(
+                Token(TokenType.AND),
+                left=node,
+                right=Node(Token(TokenType.VARIABLE, "q")),
+            )
+
+        self.assertTrue(self.evaluator.evaluate(node, {"p": True, "q": True}))
+        self.assertFalse(self.evaluator.evaluate(node, {"p": False, "q": True}))
+
+    def test_partial_evaluation_with_unknown_variables(self):
+        p = Node(Token(TokenType.VARIABLE, "p"))
+        q = Node(Token(TokenType.VARIABLE, "q"))
+        test_cases = [
+            # operator, known values, expected_result
+            (TokenType.AND, {"p": False}, False),
+            (TokenType.AND, {"p": True}, None),
+            (TokenType.OR, {"q": True}, True),
+            (TokenType.OR, {"q": False}, None),
+            (TokenType.NAND, {"q": False}, True),
+            (TokenType.NOR, {"p": True}, False),
+            (TokenType.IF, {"p": False}, True),
+            (TokenType.IF, {"q": True}, True),
+            (TokenType.IF, {"p": True}, None),
+            (TokenType.XOR, {"p": True}, None),
+            (TokenType.EQ, {"p": True, "q": True}, True),
+            (TokenType.NOT, {}, None),
+        ]
+
+        for operator, variable_values, expected in test_cases:
+            with self.subTest(operator=operator, variable_values=variable_values):
+                right = q if operator != TokenType.NOT else None
+                node = Node(Token(operator), left=p, right=right)
+                self.assertEqual(
+                    expected, self.evaluator.evaluate_partial(node, variable_values)
+                )
+
+
+class IncrementalEvaluatorTestCase(unittest.TestCase):
+    def test_updates_match_full_evaluation(self):
+        code = "((p and q) xor (r if s)) or not (q nor (p eq s))"
+        root = parse(code)
+        evaluator = Evaluator()
+        incremental = IncrementalEvaluator(root)
+
+        generator = random.Random(2)
+        values = dict.fromkeys(["p", "q", "r", "s"], False)
+        for _ in range(200):
+            variable = generator.choice(list(values))
+            values[variable] = generator.random() < 0.5
+
+            incremental.set(variable, values[variable])
+            self.assertEqual(evaluator.evaluate(root, values), incremental.result())
+
+    def test_initial_values(self):
+        incremental = IncrementalEvaluator(parse("p and q"), {"p": True, "q": True})
+        self.assertTrue(incremental.result())
+
+    def test_unchanged_values_touch_nothing(self):
+        incremental = IncrementalEvaluator(parse("p and q"))
+        self.assertEqual(0, incremental.set("p", False))
+
+    def test_propagation_stops_when_values_do_not_change(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)]
+        root = parse(f"p and ({' or '.join(names)})")
+        incremental = IncrementalEvaluator(root)
+
+        # The last name is an operand of the outermost OR, which changes, but the root stays False without p
+        self.assertEqual(2, incremental.set(names[-1], True))
+
+        # The first name changes every OR of the chain up to the outermost one, which is already True
+        self.assertEqual(len(names) - 1, incremental.set(names[0], True))
+        self.assertFalse(incremental.result())
+
+        self.assertEqual(1, incremental.set("p", True))
+        self.assertTrue(incremental.result())
+        self.assertEqual(incremental.touched, 1)
+
+    def test_unknown_variables(self):
+        incremental = IncrementalEvaluator(parse("p"))
+        self.assertRaises(KeyError, incremental.set, "q", True)
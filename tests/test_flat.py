@@ -0,0 +1,48 @@
+import unittest
+
+from flipflop.core import FlatTree, NodeFactory, TokenType
+from tests.util import parse
+
+
+class FlatTreeTestCase(unittest.TestCase):
+    def test_round_trip_is_lossless(self):
+        for code in [
+            "p",
+            "not p",
+            "p and q",
+            "(p if q) eq (not q if not p)",
+            "p nand q nor r xor s",
+        ]:
+            with self.subTest(code=code):
+                root = parse(code)
+                self.assertEqual(root, FlatTree.from_node(root).to_node())
+
+    def test_columns_are_in_post_order(self):
+        tree = FlatTree.from_node(parse("p and not q"))
+
+        self.assertEqual(4, len(tree))
+        self.assertEqual(3, tree.root)
+        self.assertEqual(["p", "q"], tree.variables)
+        self.assertEqual([0, 1, -1, -1], list(tree.slots))
+        self.assertEqual([-1, -1, 1, 0], list(tree.left))
+        self.assertEqual([-1, -1, -1, 2], list(tree.right))
+        self.assertEqual(TokenType.AND, list(TokenType)[tree.opcodes[tree.root]])
+
+    def test_equal_sub_expressions_are_stored_once(self):
+        tree = FlatTree.from_node(parse("(p and q) or (p and q)"))
+        self.assertEqual(4, len(tree))
+
+    def test_to_node_shares_equal_sub_expressions(self):
+        factory = NodeFactory()
+        root = FlatTree.from_node(parse("(p and q) or (p and q)")).to_node(factory)
+
+        self.assertIs(root.left, root.right)
+        self.assertEqual(4, len(factory))
+
+    def test_deep_tree_round_trip(self):
+        code = " and ".join(["p", "q", "r", "s"] * 1000)
+        root = parse(code)
+        tree = FlatTree.from_node(root)
+
+        self.assertEqual(root, tree.to_node())
+        self.assertEqual(13 * len(tree), tree.nbytes)
@@ -0,0 +1,57 @@
+import unittest
+
+from flipflop import flipflop
+from flipflop.core import GrayInterpreter
+from tests.util import parse
+
+EXPRESSIONS = [
+    "p",
+    "not p",
+    "p or not p",
+    "p nand q nor r",
+    "(p if q) eq (not q if not p)",
+    "(p and q) or (not p and r) or (q and r)",
+    "(p xor s) and (q if r) if (p if r)",
+]
+
+
+class GrayTestCase(unittest.TestCase):
+    def test_canonical_order_produces_the_same_table(self):
+        for code in EXPRESSIONS:
+            for full in [True, False]:
+                with self.subTest(code=code, full=full):
+                    self.assertEqual(
+                        flipflop(code, full=full),
+                        flipflop(code, full=full, engine="gray"),
+                    )
+
+    def test_gray_order_flips_a_single_variable_per_row(self):
+        code = "(p xor s) and (q if r) if (p if r)"
+        result = flipflop(code, engine="gray", order="gray", full=False)
+        expected = flipflop(code, full=False)
+
+        self.assertEqual(sorted(expected["values"]), sorted(result["values"]))
+        for previous, row in zip(result["values"], result["values"][1:]):
+            flipped = [a != b for a, b in zip(previous[:-1], row[:-1])]
+            self.assertEqual(1, sum(flipped))
+
+    def test_single_rows_follow_the_order_of_the_table(self):
+        code = "(p and q) or (not p and r) or (q and r)"
+        for order in ["canonical", "gray"]:
+            with self.subTest(order=order):
+                interpreter = GrayInterpreter(parse(code), order=order)
+                values = interpreter.evaluate()["values"]
+
+                self.assertEqual(values, [interpreter.row(i) for i in range(8)])
+                self.assertEqual(values[3:7], list(interpreter.rows(3, 7)))
+
+    def test_gray_order_requires_the_gray_engine(self):
+        self.assertRaises(ValueError, flipflop, "p", order="gray")
+        self.assertRaises(ValueError, GrayInterpreter, parse("p"), order="random")
+
+    def test_long_chains_of_operators_can_be_evaluated(self):
+        code = " and ".join(["p", "q", "r"] * 5000)
+        result = flipflop(code, full=False, engine="gray")
+
+        self.assertEqual(8, len(result["values"]))
+        self.assertEqual([True, True, True, True], result["values"][-1])
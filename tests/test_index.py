@@ -0,0 +1,67 @@
+import unittest
+
+from flipflop.core import (
+    ExpressionIndex,
+    Lexer,
+    Node,
+    Parser,
+    Reader,
+    Token,
+    TokenType,
+    Wordifier,
+)
+
+
+class ExpressionIndexTestCase(unittest.TestCase):
+    def _index(self, code: str) -> ExpressionIndex:
+        tokens = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+        return ExpressionIndex(Parser(tokens).parse())
+
+    def test_indexes_unique_nodes_in_post_order(self):
+        index = self._index("(p and q) or (p and q)")
+
+        self.assertEqual(
+            ["p", "q", "(p AND q)", "((p AND q) OR (p AND q))"], index.headers
+        )
+        self.assertEqual([(-1, -1), (-1, -1), (0, 1), (2, 2)], index.children)
+        self.assertEqual(3, index.root)
+
+    def test_collects_sorted_variables(self):
+        index = self._index("r or (q and p) or q")
+        self.assertEqual(["p", "q", "r"], index.variables)
+
+    def test_headers_match_node_representation(self):
+        index = self._index("not (p xor (q nand (not p)))")
+        self.assertEqual([repr(node) for node in index.nodes], index.headers)
+
+    def test_orders_columns_by_length_then_alphabetically(self):
+        index = self._index("(p and q) or (r and not (p or q))")
+        self.assertEqual(
+            [
+                "p",
+                "q",
+                "r",
+                "(p OR q)",
+                "(p AND q)",
+                "NOT((p OR q))",
+                "(r AND NOT((p OR q)))",
+                "((p AND q) OR (r AND NOT((p OR q))))",
+            ],
+            [index.headers[i] for i in index.columns(full=True)],
+        )
+
+    def test_simple_columns_contain_variables_and_root(self):
+        index = self._index("q and not p")
+        self.assertEqual(
+            ["p", "q", "(q AND NOT(p))"],
+            [index.headers[i] for i in index.columns(full=False)],
+        )
+
+    def test_can_index_additional_expressions(self):
+        index = self._index("p and q")
+        position = index.add(Node(Token(TokenType.VARIABLE, "q")))
+        self.assertEqual(1, position)
+
+    def test_raises_for_variables_without_name(self):
+        with self.assertRaises(ValueError):
+            ExpressionIndex(Node(Token(TokenType.VARIABLE)))
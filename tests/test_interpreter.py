@@ -243,3 +243,50 @@ class InterpreterTestCase(unittest.TestCase):
                 interpreter = Interpreter(Parser(tokens).parse())
                 results = interpreter.evaluate()
                 self.assertDictEqual(expected, results)
+
+    def test_interpreter_can_evaluate_single_rows(self):
+        code = "(p and q) or (r and not (p or q))"
+        tokens = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+        interpreter = Interpreter(Parser(tokens).parse())
+        values = interpreter.evaluate()["values"]
+
+        for i in range(-len(values), len(values)):
+            with self.subTest(row=i):
+                self.assertEqual(values[i], interpreter.row(i))
+
+        self.assertEqual([True, True, False, True], interpreter.row(6, full=False))
+        self.assertEqual((True, True, False), interpreter.assignment(6))
+        self.assertRaises(IndexError, interpreter.row, 8)
+        self.assertRaises(IndexError, interpreter.row, -9)
+
+    def test_interpreter_can_evaluate_ranges_of_rows(self):
+        code = "p xor (q nand r)"
+        tokens = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+        interpreter = Interpreter(Parser(tokens).parse())
+        values = interpreter.evaluate()["values"]
+
+        for start, stop, step in [
+            (0, None, 1),
+            (2, 5, 1),
+            (1, 8, 3),
+            (6, 100, 1),
+            (7, 0, -2),
+            (9, None, 1),
+        ]:
+            with self.subTest(start=start, stop=stop, step=step):
+                self.assertEqual(
+                    values[start:stop:step], list(interpreter.rows(start, stop, step))
+                )
+
+    def test_interpreter_rows_do_not_enumerate_the_earlier_rows(self):
+        names = "bcghjklmpsuwyz"
+        code = " xor ".join(f"{a}{b}" for a in names[:3] for b in names[:10])
+        tokens = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+        interpreter = Interpreter(Parser(tokens).parse())
+
+        # One of the last rows of a table of 2 ** 30 rows, its variables are the binary digits of the index
+        row = (1 << 30) - 5
+        values = interpreter.row(row, full=False)
+        self.assertEqual(list(interpreter.assignment(row)), values[:-1])
+        self.assertEqual(bin(row).count("1") % 2 == 1, values[-1])
+        self.assertEqual(3, len(list(interpreter.rows(row, row + 3))))
@@ -1,6 +1,13 @@
+import itertools
+import tracemalloc
+import types
 import unittest
 
-from flipflop import flipflop
+from click.testing import CliRunner
+
+from flipflop import ENGINES, check, count_models, flipflop, iter_rows, page
+from flipflop.__main__ import main
+from flipflop.core import ParserError
 
 
 class TestMainFunction(unittest.TestCase):
@@ -40,3 +47,174 @@ class TestMainFunction(unittest.TestCase):
             "is_tautology": False,
         }
         self.assertEqual(result, expected)
+
+    def test_long_chains_of_operators_can_be_evaluated(self):
+        code = " and ".join(["p", "q", "r"] * 5000)
+        result = flipflop(code, full=False)
+
+        self.assertEqual(["p", "q", "r"], result["header"][:3])
+        self.assertEqual([True, True, True, True], result["values"][-1])
+        self.assertFalse(result["is_tautology"])
+
+    def test_reduced_evaluation_drops_variables_which_cancel_out(self):
+        code = "(x or not x) and p"
+        expected = {
+            "header": ["p", "((x OR NOT(x)) AND p)"],
+            "values": [[False, False], [True, True]],
+            "is_tautology": False,
+            "dropped_variables": ["x"],
+        }
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(expected, flipflop(code, engine=engine, reduce=True))
+
+    def test_reduced_evaluation_can_be_expanded_to_all_variables(self):
+        code = "(p xor q xor q) and (r or p)"
+        result = flipflop(code, full=False, reduce=True, expand=True)
+        expected = flipflop(code, full=False)
+
+        self.assertEqual(["q", "r"], result.pop("dropped_variables"))
+        self.assertEqual(expected, result)
+
+    def test_reduced_tautology_has_a_single_row(self):
+        result = flipflop("(p if q) eq (not q if not p)", full=False, reduce=True)
+        self.assertEqual([[True]], result["values"])
+        self.assertTrue(result["is_tautology"])
+
+    def test_check_returns_the_verdict_and_a_counterexample(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(
+                    {"is_tautology": True, "counterexample": None},
+                    check("(p if q) eq (not q if not p)", engine=engine),
+                )
+                self.assertEqual(
+                    {"is_tautology": False, "counterexample": {"p": True, "q": False}},
+                    check("p if q", engine=engine),
+                )
+
+    def test_compressed_evaluation(self):
+        result = flipflop("p or (q and r)", compress=True)
+        expected = {
+            "header": ["p", "q", "r", "(p OR (q AND r))"],
+            "values": [
+                [False, False, None, False],
+                [False, True, False, False],
+                [False, True, True, True],
+                [True, None, None, True],
+            ],
+            "is_tautology": False,
+        }
+        self.assertEqual(expected, result)
+
+    def test_count_models_matches_the_truth_table(self):
+        codes = ["p", "p and not p", "p or (q and r)", "(p if q) eq (not q if not p)"]
+        for code in codes:
+            expected = sum(row[-1] for row in flipflop(code, full=False)["values"])
+            for engine in ENGINES:
+                with self.subTest(code=code, engine=engine):
+                    self.assertEqual(expected, count_models(code, engine=engine))
+
+    def test_count_models_beyond_the_enumeration_limit(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)][:64]
+
+        # Each pair of variables is equal in 2 of its 4 assignments
+        code = " and ".join(f"({x} eq {y})" for x, y in zip(names[::2], names[1::2]))
+        self.assertEqual(1 << 32, count_models(code))
+
+        code = " or ".join(names)
+        self.assertEqual((1 << 64) - 1, count_models(code))
+
+    def test_iter_rows_yields_the_header_and_then_the_rows(self):
+        code = "(p or q) and (not p xor q)"
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                rows = iter_rows(code, engine=engine)
+                expected = flipflop(code)
+
+                self.assertEqual(expected["header"], next(rows))
+                self.assertEqual(expected["values"], list(rows))
+
+    def test_stream_mode_returns_a_generator(self):
+        rows = flipflop("p and q", full=False, stream=True)
+
+        self.assertIsInstance(rows, types.GeneratorType)
+        self.assertEqual(["p", "q", "(p AND q)"], next(rows))
+        self.assertEqual([False, False, False], next(rows))
+
+    def test_iter_rows_memory_does_not_depend_on_the_number_of_rows(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)][:16]
+        rows = iter_rows(" and ".join(names), full=False)
+        next(rows)
+
+        tracemalloc.start()
+        count = sum(1 for _ in rows)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(1 << 16, count)
+        self.assertLess(peak, 1 << 20)
+
+    def test_iter_rows_raises_syntax_errors_right_away(self):
+        self.assertRaises(ParserError, iter_rows, "p and")
+
+    def test_page_only_contains_the_requested_rows(self):
+        code = "(p or q) and (not p xor r)"
+        expected = flipflop(code)
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                results = page(code, offset=2, limit=3, engine=engine)
+                self.assertEqual(expected["header"], results["header"])
+                self.assertEqual(expected["values"][2:5], results["values"])
+                self.assertEqual(8, results["total"])
+
+        self.assertEqual(expected["values"][6:], page(code, offset=6)["values"])
+        self.assertEqual([], page(code, offset=8, limit=10)["values"])
+        self.assertRaises(ValueError, page, code, offset=-1)
+
+    def test_iter_rows_with_offset_and_limit(self):
+        rows = iter_rows("p and q", offset=1, limit=2)
+
+        self.assertEqual(["p", "q", "(p AND q)"], next(rows))
+        self.assertEqual([[False, True, False], [True, False, False]], list(rows))
+
+    def test_offset_and_limit_options(self):
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["-i", "p and q", "--offset", "3", "-t", "plain"])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("True  True  True", result.output)
+        self.assertIn("Rows 3-4 of 4", result.output)
+
+        result = runner.invoke(main, ["-i", "p and q", "--limit", "1", "--stream"])
+        self.assertEqual("p\tq\t(p AND q)\nFalse\tFalse\tFalse\n", result.output)
+
+    def test_options_of_different_modes_are_usage_errors(self):
+        runner = CliRunner()
+
+        for options, message in [
+            (["--stream", "--compress"], "'--stream' and '--compress'"),
+            (["--stream", "--reduce"], "'--stream' and '--reduce'"),
+            (["--check", "--count"], "'--count' and '--check'"),
+            (["--job", "job.json", "--engine", "row"], "'--job' and '--engine'"),
+            (["--offset", "1", "--check"], "'--check' and '--offset'"),
+            (["--compress", "--reduce"], "'--compress' and '--reduce'"),
+            (["--expand"], "'--expand' requires '--reduce'"),
+        ]:
+            with self.subTest(options=options):
+                result = runner.invoke(main, ["-i", "p or q", *options])
+                self.assertEqual(2, result.exit_code)
+                self.assertIn(message, result.output)
+
+        # Options which apply to the same mode are still accepted
+        for options in [
+            ["--stream", "-o", "gray"],
+            ["--count", "-e", "row"],
+            ["-r", "--expand"],
+        ]:
+            with self.subTest(options=options):
+                self.assertEqual(
+                    0, runner.invoke(main, ["-i", "p or q", *options]).exit_code
+                )
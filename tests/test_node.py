@@ -1,6 +1,16 @@
+import pickle
 import unittest
 
-from flipflop.core import Node, Token, TokenType
+from flipflop.core import (
+    Lexer,
+    Node,
+    NodeFactory,
+    Parser,
+    Reader,
+    Token,
+    TokenType,
+    Wordifier,
+)
 
 
 class NodeTestCase(unittest.TestCase):
@@ -238,3 +248,128 @@ class NodeTestCase(unittest.TestCase):
             },
             node.to_json_serializable(),
         )
+
+    def test_nodes_are_immutable(self):
+        node = Node(token=Token(type=TokenType.VARIABLE, value="p"))
+
+        with self.assertRaises(AttributeError):
+            node.left = Node(token=Token(type=TokenType.VARIABLE, value="q"))
+
+    def test_nodes_can_be_pickled(self):
+        node = Node(
+            token=Token(type=TokenType.NOT),
+            left=Node(token=Token(type=TokenType.VARIABLE, value="p")),
+        )
+
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node, restored)
+        self.assertEqual(hash(node), hash(restored))
+
+    def test_deep_trees_can_be_pickled(self):
+        shared = Node(token=Token(type=TokenType.VARIABLE, value="p"))
+        node = shared
+        for _ in range(300000):
+            node = Node(token=Token.operator(TokenType.AND), left=node, right=shared)
+
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node, restored)
+
+        # Shared sub-trees stay shared
+        self.assertIs(restored.right, restored.left.right)
+
+    def test_representations_of_deep_trees_do_not_recurse(self):
+        node = Node(token=Token(type=TokenType.VARIABLE, value="p"))
+        for _ in range(10000):
+            node = Node(token=Token(type=TokenType.NOT), left=node)
+
+        self.assertEqual("NOT(" * 10000 + "p" + ")" * 10000, repr(node))
+
+        data, depth = node.to_json_serializable(), 0
+        while "left" in data:
+            data, depth = data["left"], depth + 1
+        self.assertEqual(10000, depth)
+
+    def test_representations_are_cached(self):
+        node = Node(
+            token=Token(type=TokenType.OR),
+            left=Node(token=Token(type=TokenType.VARIABLE, value="p")),
+            right=Node(token=Token(type=TokenType.VARIABLE, value="q")),
+        )
+
+        self.assertIs(repr(node), repr(node))
+        self.assertIs(node.to_json_serializable(), node.to_json_serializable())
+
+    def test_deep_trees_can_be_compared_without_recursion(self):
+        def chain(last: str) -> Node:
+            node = Node(token=Token(type=TokenType.VARIABLE, value="p"))
+            for _ in range(100000):
+                node = Node(
+                    token=Token(type=TokenType.AND),
+                    left=node,
+                    right=Node(token=Token(type=TokenType.VARIABLE, value="q")),
+                )
+
+            return Node(
+                token=Token(type=TokenType.OR),
+                left=node,
+                right=Node(token=Token(type=TokenType.VARIABLE, value=last)),
+            )
+
+        self.assertEqual(chain("r"), chain("r"))
+        self.assertNotEqual(chain("r"), chain("s"))
+
+    def test_postorder_yields_children_before_parents_once(self):
+        shared = Node(token=Token(type=TokenType.VARIABLE, value="p"))
+        node = Node(
+            token=Token(type=TokenType.OR),
+            left=Node(token=Token(type=TokenType.NOT), left=shared),
+            right=shared,
+        )
+
+        self.assertEqual(
+            ["p", "NOT(p)", "(NOT(p) OR p)"], [repr(n) for n in node.postorder()]
+        )
+
+
+class NodeFactoryTestCase(unittest.TestCase):
+    def test_factory_shares_structurally_equal_nodes(self):
+        factory = NodeFactory()
+
+        p = factory.node(Token(TokenType.VARIABLE, "p"))
+        q = factory.node(Token(TokenType.VARIABLE, "q"))
+        first = factory.node(Token(TokenType.AND), left=p, right=q)
+        second = factory.node(
+            Token(TokenType.AND),
+            left=factory.node(Token(TokenType.VARIABLE, "p")),
+            right=factory.node(Token(TokenType.VARIABLE, "q")),
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(3, len(factory))
+
+    def test_factory_can_intern_any_tree(self):
+        tree = Node(
+            token=Token(TokenType.OR),
+            left=Node(
+                token=Token(TokenType.AND),
+                left=Node(token=Token(TokenType.VARIABLE, value="p")),
+                right=Node(token=Token(TokenType.VARIABLE, value="q")),
+            ),
+            right=Node(
+                token=Token(TokenType.AND),
+                left=Node(token=Token(TokenType.VARIABLE, value="p")),
+                right=Node(token=Token(TokenType.VARIABLE, value="q")),
+            ),
+        )
+
+        interned = NodeFactory().intern(tree)
+
+        self.assertEqual(tree, interned)
+        self.assertIs(interned.left, interned.right)
+
+    def test_parser_builds_shared_sub_expressions(self):
+        code = "(p and q) or (p and q)"
+        tokens = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+        root = Parser(tokens).parse()
+
+        self.assertIs(root.left, root.right)
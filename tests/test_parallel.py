@@ -0,0 +1,124 @@
+import itertools
+import time
+import unittest
+
+from click.testing import CliRunner
+
+from flipflop import check, count_models, flipflop, page
+from flipflop.__main__ import main
+from flipflop.core import Evaluator, ParallelInterpreter
+from tests.util import parse
+
+EXPRESSIONS = [
+    "p",
+    "p or not p",
+    "(p and q) or (r and not (p or q))",
+    "(p xor s) and (q if r) if (p if r)",
+    "(b xor c xor g xor h) or (b eq c) and not (j nor k)",
+]
+
+
+class ParallelTestCase(unittest.TestCase):
+    def _interpreter(self, code: str, **options):
+        return ParallelInterpreter(parse(code), **options)
+
+    def test_produces_the_same_truth_table_as_row_interpreter(self):
+        for code in EXPRESSIONS:
+            for full in [True, False]:
+                with self.subTest(code=code, full=full):
+                    self.assertEqual(
+                        flipflop(code, full=full),
+                        flipflop(code, full=full, engine="parallel", workers=2),
+                    )
+
+    def test_rows_are_split_into_shards_of_the_leading_variables(self):
+        interpreter = self._interpreter("p and q and r and s", workers=2)
+
+        # 2 workers with 4 shards each fix the first 3 variables
+        self.assertEqual(3, interpreter.shard_bits)
+        self.assertEqual(
+            list(itertools.product([False, True], repeat=3)), interpreter.shards()
+        )
+
+        # There can't be more shards than rows
+        self.assertEqual(1, self._interpreter("p", workers=4).shard_bits)
+        self.assertEqual(0, self._interpreter("p", shard_bits=0).shard_bits)
+
+    def test_count_models_is_reduced_in_the_workers(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                self.assertEqual(
+                    count_models(code),
+                    self._interpreter(code, workers=2).count_models(),
+                )
+
+    def test_counterexample_falsifies_the_expression(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                ast = parse(code)
+                counterexample = ParallelInterpreter(ast, workers=2).counterexample()
+
+                self.assertEqual(check(code)["is_tautology"], counterexample is None)
+                if counterexample is not None:
+                    self.assertFalse(Evaluator().evaluate(ast, counterexample))
+
+    def test_counterexample_cancels_the_remaining_shards(self):
+        # Only a single row is falsifying, every other shard would have to enumerate 2 ** 19 rows
+        names = ["".join(name) for name in itertools.product("bcghjklm", repeat=2)][:22]
+        interpreter = self._interpreter(" or ".join(names), workers=2)
+
+        self.assertEqual(dict.fromkeys(names, False), interpreter.counterexample())
+
+        # The first row of the first shard is falsifying, the other shards stop before finishing a single one
+        self.assertLess(interpreter.rows_searched, 1 << 19)
+
+    def test_rows_are_evaluated_in_blocks(self):
+        code = "(b xor c xor g xor h) or (b eq c) and not (j nor k)"
+        expected = flipflop(code)["values"]
+
+        interpreter = self._interpreter(code, workers=2)
+        self.assertEqual(expected, list(interpreter.rows()))
+        self.assertEqual(expected[5:70:3], list(interpreter.rows(5, 70, 3)))
+        self.assertEqual(
+            {
+                "header": flipflop(code)["header"],
+                "values": expected[10:20],
+                "offset": 10,
+                "total": 64,
+            },
+            page(code, offset=10, limit=10, engine="parallel", workers=2),
+        )
+
+    def test_closing_the_stream_cancels_the_remaining_blocks(self):
+        # Evaluating all the 2 ** 26 rows would take minutes
+        names = ["".join(name) for name in itertools.product("bcghjklm", repeat=2)][:26]
+        interpreter = self._interpreter(" and ".join(names), workers=2)
+
+        start = time.monotonic()
+        rows = interpreter.iter_rows(full=False)
+        self.assertEqual([False] * 27, next(rows))
+        rows.close()
+
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_workers_only_apply_to_the_parallel_engine(self):
+        self.assertRaises(ValueError, flipflop, "p", workers=2)
+        self.assertRaises(ValueError, self._interpreter, "p", workers=0)
+
+    def test_workers_option(self):
+        runner = CliRunner()
+
+        result = runner.invoke(main, ["-i", "p or not p", "-w", "2"])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("Expression IS a tautology", result.output)
+
+        result = runner.invoke(main, ["-i", "p or q", "-w", "2", "--count"])
+        self.assertIn("Satisfying assignments: 3", result.output)
+
+        result = runner.invoke(main, ["-i", "p or q", "-w", "2", "--offset", "3"])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("Rows 3-4 of 4", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,16 @@
 import unittest
 
-from flipflop.core import Lexer, Node, Parser, Reader, Token, TokenType, Wordifier
+from flipflop.core import (
+    Lexer,
+    Node,
+    Parser,
+    Reader,
+    Scanner,
+    Token,
+    TokenAssertionError,
+    TokenType,
+    Wordifier,
+)
 
 
 class ParserTestCase(unittest.TestCase):
@@ -138,3 +148,34 @@ class ParserTestCase(unittest.TestCase):
                 tokens = Lexer(Wordifier(Reader(expression)).wordify()).tokenize()
                 root_node = Parser(tokens).parse()
                 self.assertEqual(expected_root_node, root_node)
+
+    def test_parses_deeply_nested_expressions_without_recursion(self):
+        depth = 100000
+
+        code = "(" * depth + "p or q" + ")" * depth
+        root_node = Parser(Scanner(code).tokenize()).parse()
+        self.assertEqual(
+            self._operator_node(
+                TokenType.OR, self._variable_node("p"), self._variable_node("q")
+            ),
+            root_node,
+        )
+
+        root_node = Parser(Scanner("~(" * depth + "p" + ")" * depth).tokenize()).parse()
+        for _ in range(depth):
+            self.assertEqual(TokenType.NOT, root_node.token.type)
+            root_node = root_node.left
+
+        self.assertEqual(self._variable_node("p"), root_node)
+
+    def test_raises_for_unclosed_and_incomplete_expressions(self):
+        test_cases = [
+            ("(p or q", TokenAssertionError),
+            ("p or", TokenAssertionError),
+            ("(p or (q)", TokenAssertionError),
+        ]
+
+        for code, exception in test_cases:
+            with self.subTest(code=code):
+                with self.assertRaises(exception):
+                    Parser(Scanner(code).tokenize()).parse()
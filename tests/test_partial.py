@@ -0,0 +1,187 @@
+import itertools
+import random
+import unittest
+
+from flipflop import flipflop
+from flipflop.core import ExpressionIndex, TokenType
+from flipflop.core.packed import apply_operator
+from flipflop.core.partial import (
+    CounterexampleSearch,
+    ModelCount,
+    PrunedEnumeration,
+    apply_partial,
+    required_children,
+)
+from tests.util import parse
+
+OPERATORS = [
+    TokenType.NOT,
+    TokenType.AND,
+    TokenType.OR,
+    TokenType.NAND,
+    TokenType.NOR,
+    TokenType.XOR,
+    TokenType.IF,
+    TokenType.EQ,
+]
+
+
+def completions(value: bool | None) -> list[bool]:
+    return [False, True] if value is None else [value]
+
+
+class PartialTestCase(unittest.TestCase):
+    def _apply(self, token_type: TokenType, left: bool, right: bool) -> bool:
+        return bool(apply_operator(token_type, int(left), int(right), 1))
+
+    def test_partial_values_are_shared_by_all_completions(self):
+        for token_type in OPERATORS:
+            for left, right in itertools.product([None, False, True], repeat=2):
+                with self.subTest(token_type=token_type, left=left, right=right):
+                    results = {
+                        self._apply(token_type, a, b)
+                        for a in completions(left)
+                        for b in completions(right)
+                    }
+                    value = apply_partial(token_type, left, right)
+
+                    # Unknown values are only returned when the completions disagree
+                    if value is None:
+                        self.assertEqual(2, len(results))
+                    else:
+                        self.assertEqual({value}, results)
+
+    def test_required_children_hold_in_every_completion(self):
+        for token_type in OPERATORS:
+            for required in [False, True]:
+                for left, right in itertools.product([None, False, True], repeat=2):
+                    forced = required_children(token_type, required, left, right)
+                    matching = [
+                        (a, b)
+                        for a in completions(left)
+                        for b in completions(right)
+                        if self._apply(token_type, a, b) == required
+                    ]
+
+                    with self.subTest(
+                        token_type=token_type, required=required, left=left, right=right
+                    ):
+                        if forced[0] is not None:
+                            self.assertTrue(all(a == forced[0] for a, _ in matching))
+                        if forced[1] is not None and token_type != TokenType.NOT:
+                            self.assertTrue(all(b == forced[1] for _, b in matching))
+
+    def test_search_matches_the_truth_table(self):
+        generator = random.Random(7)
+        names = ["p", "q", "r", "s"]
+        operators = [t.value for t in OPERATORS if t != TokenType.NOT]
+
+        for _ in range(200):
+            code = generator.choice(names)
+            for _ in range(generator.randint(1, 7)):
+                operand = generator.choice(names)
+                if generator.random() < 0.3:
+                    operand = f"not {operand}"
+                code = f"({code}) {generator.choice(operators)} {operand}"
+
+            # Without scanning, with scanning the last variables, and scanning all of them
+            for scan_variables in [0, 2, 4]:
+                with self.subTest(code=code, scan_variables=scan_variables):
+                    root = parse(code)
+                    table = flipflop(code, full=False)
+                    search = CounterexampleSearch(ExpressionIndex(root), scan_variables)
+                    counterexample = search.run()
+
+                    self.assertEqual(table["is_tautology"], counterexample is None)
+                    if counterexample is not None:
+                        row = [counterexample[v] for v in table["header"][:-1]]
+                        self.assertIn(row + [False], table["values"])
+
+    def test_search_decides_branches_from_partial_assignments(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)][:40]
+        root = parse(f"not {names[0]} or not ({' and '.join(names)}) or {names[0]}")
+
+        search = CounterexampleSearch(ExpressionIndex(root))
+        self.assertIsNone(search.run())
+        self.assertLess(search.steps, 10)
+
+    def test_unit_propagation_finds_counterexample_without_branching(self):
+        root = parse("(p and q and not r) if (s or r)")
+
+        search = CounterexampleSearch(ExpressionIndex(root))
+        counterexample = search.run()
+
+        self.assertEqual({"p": True, "q": True, "r": False, "s": False}, counterexample)
+        self.assertLessEqual(search.steps, 4)
+
+    def test_scanning_finds_the_first_falsifying_row(self):
+        root = parse("(p xor q) or (r and s)")
+
+        search = CounterexampleSearch(ExpressionIndex(root))
+        self.assertEqual({"p": False, "q": False, "r": False, "s": False}, search.run())
+        self.assertEqual(1, search.steps)
+
+    def test_model_count_matches_the_truth_table(self):
+        for code in [
+            "p",
+            "p and not p",
+            "(p if q) and (r xor s)",
+            "p nor (q nand (r eq s))",
+        ]:
+            expected = sum(row[-1] for row in flipflop(code, full=False)["values"])
+            index = ExpressionIndex(parse(code))
+
+            # Without scanning, with scanning the last variables, and scanning all of them
+            for scan_variables in [0, 2, 4]:
+                with self.subTest(code=code, scan_variables=scan_variables):
+                    self.assertEqual(expected, ModelCount(index, scan_variables).run())
+
+    def test_model_count_prunes_decided_rows(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)][:40]
+        count = ModelCount(ExpressionIndex(parse(" or ".join(names))))
+
+        # The False branches are decided after each variable, until only 12 are left to scan
+        self.assertEqual((1 << 40) - 1, count.run())
+        self.assertEqual(2 * 28 + 1, count.steps)
+
+    def test_pruned_enumeration_emits_compressed_rows(self):
+        enumeration = PrunedEnumeration(ExpressionIndex(parse("p or (q and r)")))
+        expected = [
+            ([False, False, None], False),
+            ([False, True, False], False),
+            ([False, True, True], True),
+            ([True, None, None], True),
+        ]
+
+        self.assertEqual(expected, list(enumeration))
+        self.assertEqual(7, enumeration.steps)
+
+    def test_compressed_rows_cover_the_truth_table(self):
+        for code in [
+            "p",
+            "p and not p",
+            "(p if q) and (r xor s)",
+            "p nor (q nand (r eq s))",
+        ]:
+            with self.subTest(code=code):
+                table = flipflop(code, full=False)
+
+                expanded = []
+                for variables, result in PrunedEnumeration(
+                    ExpressionIndex(parse(code))
+                ):
+                    for values in itertools.product(*map(completions, variables)):
+                        expanded.append(list(values) + [result])
+
+                self.assertEqual(table["values"], expanded)
+
+    def test_decided_expressions_prune_the_enumeration(self):
+        names = ["".join(n) for n in itertools.product("bcghjklm", repeat=2)][:40]
+        code = f"{names[0]} if ({' and '.join(names[1:])})"
+        enumeration = PrunedEnumeration(ExpressionIndex(parse(code)))
+
+        # One row for each prefix of the variables, instead of 2 ** 40
+        rows = list(enumeration)
+        self.assertEqual(41, len(rows))
+        self.assertEqual(1 << 40, sum(1 << values.count(None) for values, _ in rows))
+        self.assertEqual(([False] + [None] * 39, True), rows[0])
@@ -0,0 +1,153 @@
+import itertools
+import random
+import unittest
+
+from flipflop import ENGINES, flipflop
+from flipflop.core import SatInterpreter, Solver, TokenType, Tseitin
+from flipflop.core.sat import counterexample, luby
+from tests.util import parse
+
+EXPRESSIONS = [
+    "p",
+    "not p",
+    "p and not p",
+    "p or not p",
+    "p nand q",
+    "p nor q",
+    "p xor q xor r",
+    "p xor p",
+    "(p if q) eq (not q if not p)",
+    "(p and q) or (not p and r) or (q and r)",
+    "not (p or q) eq (not p and not q)",
+    "(p if q) and (q if r) if (p if r)",
+]
+
+
+def variable_names(count: int) -> list[str]:
+    # Letters which can't form any operator keyword (or the 'v' operator) when combined
+    letters = "bcghjklmpsuwyz"
+    return ["".join(name) for name in itertools.product(letters, repeat=3)][:count]
+
+
+def brute_force(count: int, clauses: list[list[int]]) -> bool:
+    for values in itertools.product([False, True], repeat=count):
+        if all(
+            any(values[abs(literal) - 1] == (literal > 0) for literal in clause)
+            for clause in clauses
+        ):
+            return True
+
+    return False
+
+
+class SatTestCase(unittest.TestCase):
+    def test_luby_sequence(self):
+        self.assertEqual(
+            [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8], [luby(i) for i in range(15)]
+        )
+
+    def test_gate_encoding_of_every_operator(self):
+        for token_type in TokenType:
+            if token_type in (
+                TokenType.VARIABLE,
+                TokenType.NOT,
+                TokenType.L_PAR,
+                TokenType.R_PAR,
+            ):
+                continue
+
+            code = f"p {token_type.value} q"
+            with self.subTest(token_type=token_type):
+                encoder = Tseitin()
+                root = encoder.encode(parse(code))
+
+                for row in flipflop(code, full=False)["values"]:
+                    p, q, expected = row
+                    solver = Solver(encoder.count, encoder.clauses)
+                    solver.add_clause(
+                        [encoder.literals["p"] if p else -encoder.literals["p"]]
+                    )
+                    solver.add_clause(
+                        [encoder.literals["q"] if q else -encoder.literals["q"]]
+                    )
+                    solver.add_clause([root if expected else -root])
+                    self.assertTrue(solver.solve())
+
+                    solver.add_clause([-root if expected else root])
+                    self.assertFalse(solver.solve())
+
+    def test_solver_matches_brute_force_on_random_formulas(self):
+        generator = random.Random(4)
+        for _ in range(150):
+            count = generator.randint(3, 9)
+            clauses = [
+                [
+                    generator.choice([-1, 1]) * generator.randint(1, count)
+                    for _ in range(3)
+                ]
+                for _ in range(generator.randint(5, 45))
+            ]
+
+            solver = Solver(count, clauses)
+            satisfiable = solver.solve()
+            self.assertEqual(brute_force(count, clauses), satisfiable)
+
+            if satisfiable:
+                model = solver.model()
+                for clause in clauses:
+                    self.assertTrue(
+                        any(model[abs(literal)] == (literal > 0) for literal in clause)
+                    )
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        # Six pigeons in five holes, the variable of pigeon i in hole j is i * 5 + j + 1
+        pigeons, holes = 6, 5
+        clauses = [[i * holes + j + 1 for j in range(holes)] for i in range(pigeons)]
+        for j in range(holes):
+            for a, b in itertools.combinations(range(pigeons), 2):
+                clauses.append([-(a * holes + j + 1), -(b * holes + j + 1)])
+
+        solver = Solver(pigeons * holes, clauses)
+        self.assertFalse(solver.solve())
+        self.assertGreater(solver.conflicts, 0)
+
+    def test_empty_and_contradicting_clauses(self):
+        self.assertFalse(Solver(1, [[]]).solve())
+        self.assertFalse(Solver(1, [[1], [-1]]).solve())
+        self.assertTrue(Solver(1, [[1, -1]]).solve())
+
+    def test_counterexample_matches_the_truth_table(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                root = parse(code)
+                table = flipflop(code, full=False)
+                assignment = counterexample(root)
+
+                self.assertEqual(table["is_tautology"], assignment is None)
+                if assignment is not None:
+                    function = SatInterpreter(root).compiler.compile(root)
+                    self.assertFalse(function.evaluate(assignment))
+
+    def test_sat_engine_produces_the_same_table(self):
+        for code in EXPRESSIONS:
+            with self.subTest(code=code):
+                self.assertEqual(flipflop(code), flipflop(code, engine="sat"))
+
+    def test_thousands_of_variables(self):
+        names = variable_names(2000)
+
+        chain = " and ".join(f"({x} if {y})" for x, y in zip(names, names[1:]))
+        interpreter = SatInterpreter(parse(f"({chain}) if ({names[0]} if {names[-1]})"))
+        self.assertIsNone(interpreter.counterexample())
+
+        interpreter = SatInterpreter(parse(f"({chain}) if ({names[-1]} if {names[0]})"))
+        assignment = interpreter.counterexample()
+        self.assertTrue(assignment[names[-1]])
+        self.assertFalse(assignment[names[0]])
+
+    def test_counterexample_of_other_engines(self):
+        for engine in ["row", "bdd"]:
+            with self.subTest(engine=engine):
+                interpreter = ENGINES[engine](parse("p if q"))
+                self.assertEqual({"p": True, "q": False}, interpreter.counterexample())
+                self.assertIsNone(ENGINES[engine](parse("p or not p")).counterexample())
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from flipflop.core import (
+    InvalidBinaryTokenPlacement,
+    InvalidParenthesisTokenPlacement,
+    InvalidUnaryTokenPlacement,
+    InvalidVariableTokenPlacement,
+    Lexer,
+    Reader,
+    Scanner,
+    Token,
+    TokenType,
+    Wordifier,
+)
+
+
+class ScannerTestCase(unittest.TestCase):
+    def test_tokenizes_simple_expressions(self):
+        tokens = Scanner("p or q").tokenize()
+        self.assertEqual(
+            [
+                Token(TokenType.VARIABLE, "p"),
+                Token(TokenType.OR),
+                Token(TokenType.VARIABLE, "q"),
+            ],
+            tokens,
+        )
+
+    def test_produces_the_same_tokens_as_the_lexer(self):
+        expressions = [
+            "(p ∨ q) ∧ ~r",
+            "not (p xor (q nand (not p)))",
+            "  Test OR tst  ",
+            "p | q ^ r v s",
+            "a ↓ b → c ↔ d ⊕ e ∣ ¬f",
+            "door",
+            "xnort",
+            "(\tp\n and\n q)",
+        ]
+
+        for code in expressions:
+            with self.subTest(code=code):
+                expected = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+                self.assertEqual(expected, Scanner(code).tokenize())
+
+    def test_raises_the_same_exceptions_as_the_lexer(self):
+        test_cases = [
+            ("p ~ q", InvalidUnaryTokenPlacement),
+            ("and q", InvalidBinaryTokenPlacement),
+            ("(or q)", InvalidBinaryTokenPlacement),
+            ("a a", InvalidVariableTokenPlacement),
+            ("(a or b) c", InvalidVariableTokenPlacement),
+            (")", InvalidParenthesisTokenPlacement),
+            ("())", InvalidParenthesisTokenPlacement),
+        ]
+
+        for code, exception in test_cases:
+            with self.subTest(code=code):
+                with self.assertRaises(exception) as expected:
+                    Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+
+                with self.assertRaises(exception) as raised:
+                    Scanner(code).tokenize()
+
+                self.assertEqual(str(expected.exception), str(raised.exception))
+
+    def test_matches_the_lexer_on_random_input(self):
+        pieces = [
+            *"pqrvdont()|^~¬∧∨→↔⊕∣↓1_é \t\n\u00a0",
+            "and",
+            "or",
+            "not",
+            "xor",
+            "nand",
+        ]
+        generator = random.Random(0)
+
+        for _ in range(2000):
+            code = "".join(generator.choices(pieces, k=generator.randint(0, 12)))
+            with self.subTest(code=code):
+                try:
+                    expected = Lexer(Wordifier(Reader(code)).wordify()).tokenize()
+                except Exception as e:
+                    with self.assertRaises(type(e)) as raised:
+                        Scanner(code).tokenize()
+
+                    self.assertEqual(str(e), str(raised.exception))
+                else:
+                    self.assertEqual(expected, Scanner(code).tokenize())
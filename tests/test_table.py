@@ -0,0 +1,89 @@
+import unittest
+
+from flipflop import ENGINES, flipflop, truth_table
+from flipflop.core import ChunkedInterpreter, TruthTable
+from flipflop.core.chunked import IntegerBackend
+from tests.util import parse
+
+
+class TruthTableTestCase(unittest.TestCase):
+    expressions = [
+        "p",
+        "p or q",
+        "not (p xor (q nand (not p)))",
+        "(p and q) or (r and not (p or q))",
+        "(b xor c xor g xor h) or (b eq c) and not (j nor k)",
+    ]
+
+    def test_to_dict_matches_the_truth_table_of_every_engine(self):
+        for engine in ENGINES:
+            for expression in self.expressions:
+                for full in (True, False):
+                    with self.subTest(engine=engine, expression=expression, full=full):
+                        self.assertDictEqual(
+                            truth_table(expression, full=full, engine=engine).to_dict(),
+                            flipflop(expression, full=full),
+                        )
+
+    def test_chunked_table_assembles_multiple_chunks(self):
+        code = "(b xor c xor g xor h xor j xor k xor l) or (b eq c)"
+        ast = parse(code)
+        interpreter = ChunkedInterpreter(ast, chunk_rows=64, backend=IntegerBackend())
+
+        self.assertDictEqual(interpreter.table().to_dict(), flipflop(code))
+
+    def test_gray_order_keeps_the_rows_in_the_order_of_evaluation(self):
+        table = truth_table("p and q", engine="gray", order="gray")
+        self.assertListEqual(table.column("p"), [False, False, True, True])
+        self.assertListEqual(table.column("q"), [False, True, True, False])
+
+    def test_row_access(self):
+        table = truth_table("p and not q")
+
+        self.assertEqual(len(table), 4)
+        self.assertListEqual(table.header, ["p", "q", "NOT(q)", "(p AND NOT(q))"])
+        self.assertListEqual(table[2], [True, False, True, True])
+        self.assertListEqual(table[-1], [True, True, False, False])
+        self.assertListEqual(list(table), list(table.rows()))
+
+        with self.assertRaises(IndexError):
+            table[4]
+
+        with self.assertRaises(IndexError):
+            table[-5]
+
+    def test_column_access(self):
+        table = truth_table("p or q")
+
+        self.assertListEqual(table.column("q"), [False, True, False, True])
+        self.assertEqual(table.count(), 3)
+        self.assertEqual(table.count("p"), 2)
+        self.assertFalse(table.is_tautology)
+
+        with self.assertRaises(KeyError):
+            table.column("r")
+
+    def test_tautology(self):
+        self.assertTrue(truth_table("p or not p").is_tautology)
+
+    def test_columns_are_packed(self):
+        # 20 variables and 21 columns take under 3 MB, instead of over 170 MB of pointers in nested lists
+        names = "bcghjklmpsuwyz"
+        variables = [f"{a}{b}" for a in names[:4] for b in names[:5]]
+        table = truth_table(" and ".join(variables), full=False)
+
+        self.assertEqual(len(table), 1 << 20)
+        self.assertEqual(table.nbytes, 21 * (1 << 17))
+        self.assertEqual(table.count(), 1)
+        self.assertListEqual(table[-1], [True] * 21)
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            TruthTable(["p"], [b"\x00", b"\x00"], 4)
+
+        with self.assertRaises(ValueError):
+            TruthTable(["p"], [b"\x00\x00"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -66,3 +66,11 @@ class TokenTestCase(unittest.TestCase):
                 self.assertDictEqual(
                     {"type": token_type.value}, token.to_json_serializable()
                 )
+
+    def test_operator_tokens_are_interned(self):
+        self.assertIs(Token.operator(TokenType.AND), Token.operator(TokenType.AND))
+        self.assertEqual(Token(type=TokenType.AND), Token.operator(TokenType.AND))
+
+    def test_tokens_have_no_instance_dictionary(self):
+        token = Token(type=TokenType.VARIABLE, value="p")
+        self.assertFalse(hasattr(token, "__dict__"))
@@ -0,0 +1,6 @@
+from flipflop.core import Node, Parser, Scanner
+
+
+def parse(code: str) -> Node:
+    """Build the Syntax Tree of the code, shared by the tests which only need an AST to interpret"""
+    return Parser(Scanner(code).tokenize()).parse()